@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Amostragem Adaptativa de Tamanhos de Matriz
+===========================================
+
+Planeja a próxima rodada de tamanhos a medir a partir de uma varredura já
+existente (passo grosso), refinando onde o comportamento muda:
+
+- Saltos de GFLOPS entre tamanhos vizinhos (transições de capacidade de
+  cache, strides ruins) acima de GFLOPS_JUMP %
+- Divergência entre nativo e container: variação do overhead entre vizinhos
+  acima de DIVERGENCE pontos percentuais
+
+Os dois limites nunca ficam abaixo de duas vezes o erro padrão da média
+(SD_Mean) dos pontos envolvidos, para que ruído não seja tomado por transição.
+
+Em cada intervalo marcado o novo tamanho é uma potência de dois interna ao
+intervalo (conflitos de associatividade), se houver, ou o ponto médio
+alinhado a ALIGN. Os intervalos são atendidos em ordem de pontuação até
+esgotar o orçamento de tempo, estimado por T(N) ~ N³ a partir do vizinho.
+
+A saída é uma lista "variante,matSize" no formato de REMEASURE_FILE: os
+runners medem apenas esses tamanhos e os anexam ao mesmo output_<variante>.dat,
+de modo que a análise lê os novos pontos pela coluna matSize (run_adaptive.sh).
+
+Uso:
+    python3 adaptive_sampling.py --env native=001 --env docker=001 \\
+        --budget 1800 --out logs/adaptive_round1.csv
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from analysis_benchmark_hpc import (load_data, get_latest_run, dtype_suffix, callpath_suffix,
+                                    CALL_PATHS)
+from flop_model import DTYPES, BLAS12_ROUTINES
+
+GFLOPS_JUMP = 5.0     # % de variação de GFLOPS entre tamanhos vizinhos
+DIVERGENCE = 1.0      # pontos percentuais de variação do overhead container/nativo
+ALIGN = 8             # alinhamento dos tamanhos propostos
+STARTUP_COST = 0.5    # s por tamanho medido (processo do harness, compilação amortizada)
+
+# Sufixos dos .dat que não são o DGEMM via GSL (outros tipos, rotinas BLAS 1/2, caminhos de chamada)
+OTHER_SUFFIXES = tuple(sorted(({dtype_suffix(d) for d in list(DTYPES) + list(BLAS12_ROUTINES)}
+                               | {callpath_suffix(c) for c in CALL_PATHS}) - {''}))
+
+def run_variants(base_path, threading_mode, environment, method, run_number):
+    """Variantes DGEMM com .dat na execução (ignora _<t>gemm, _<rotina> e _<caminho>)"""
+    run_dir = Path(base_path) / threading_mode / environment / method / run_number
+    return sorted(p.stem[len('output_'):] for p in run_dir.glob('output_*.dat')
+                  if not p.stem.endswith(OTHER_SUFFIXES))
+
+def gflops_curve(df):
+    """GFLOPS por tamanho a partir das colunas gravadas (Size em GFLOP, Mean em s)"""
+    return pd.Series((df['Size'] / df['Mean']).values, index=df['matSize'].astype(int).values)
+
+def relative_error(df):
+    """Erro padrão relativo da média por tamanho (SD_Mean/Mean; 0 sem a coluna)"""
+    error = df['SD_Mean'] / df['Mean'] if 'SD_Mean' in df else pd.Series(0.0, index=df.index)
+    return pd.Series(error.fillna(0.0).values, index=df['matSize'].astype(int).values)
+
+def pick_size(low, high, align=ALIGN):
+    """Tamanho a medir em (low, high): potência de dois mais próxima do meio, ou o meio alinhado"""
+    middle = (low + high) / 2
+    powers = [2 ** k for k in range(int(np.log2(low)) + 1, int(np.log2(high)) + 1) if low < 2 ** k < high]
+    if powers:
+        return min(powers, key=lambda p: abs(p - middle))
+    size = int(round(middle / align) * align)
+    return size if low < size < high else None
+
+def score_intervals(reference, others, gflops_jump=GFLOPS_JUMP, divergence=DIVERGENCE):
+    """
+    Pontua cada intervalo entre tamanhos vizinhos da curva de referência (nativo)
+
+    Args:
+        reference: DataFrame do .dat de referência
+        others: {ambiente: DataFrame} dos containers para a mesma variante
+
+    Returns:
+        Lista de dicionários (low, high, jump_pct, divergence_pp, env, score);
+        score > 1 indica que o intervalo deve ser refinado
+    """
+    ref = gflops_curve(reference)
+    ref_time = pd.Series(reference['Mean'].values, index=ref.index)
+    ref_error = relative_error(reference)
+    overheads, errors = {}, {}
+    for env, df in others.items():
+        overheads[env] = (pd.Series(df['Mean'].values, index=df['matSize'].astype(int).values) / ref_time - 1) * 100
+        errors[env] = relative_error(df)
+
+    intervals = []
+    sizes = ref.index.values
+    for low, high in zip(sizes[:-1], sizes[1:]):
+        jump = abs(ref[high] - ref[low]) / min(ref[high], ref[low]) * 100
+        jump_noise = 2 * np.hypot(ref_error[low], ref_error[high]) * 100
+        score = jump / max(gflops_jump, jump_noise)
+        worst_env, worst_div = None, 0.0
+        for env, overhead in overheads.items():
+            if low in overhead.index and high in overhead.index:
+                div = abs(overhead[high] - overhead[low])
+                if not np.isfinite(div):
+                    continue
+                div_noise = 2 * np.sqrt(ref_error[low] ** 2 + ref_error[high] ** 2 +
+                                        errors[env][low] ** 2 + errors[env][high] ** 2) * 100
+                if div / max(divergence, div_noise) > score:
+                    score = div / max(divergence, div_noise)
+                if div > worst_div:
+                    worst_env, worst_div = env, div
+        intervals.append({'low': int(low), 'high': int(high), 'jump_pct': jump,
+                          'divergence_pp': worst_div, 'env': worst_env, 'score': score})
+    return intervals
+
+def estimate_cost(size, high, high_time, nrep, environments):
+    """Tempo estimado (s) para medir 'size' em todos os ambientes: T(N) ~ N³ a partir do vizinho"""
+    call = high_time * (size / high) ** 3
+    return environments * ((nrep + 1) * call + STARTUP_COST)
+
+def plan(base_path, threading_mode, method, runs, budget, nrep=5, variants=None,
+         gflops_jump=GFLOPS_JUMP, divergence=DIVERGENCE):
+    """
+    Próximos tamanhos a medir dentro do orçamento
+
+    Args:
+        runs: {ambiente: número da execução}; o primeiro é a referência (nativo)
+        budget: orçamento de tempo (s) para esta rodada
+
+    Returns:
+        (pontos, intervalos): pontos = lista de (variante, tamanho, custo estimado, intervalo);
+        intervalos = todos os intervalos pontuados (para o relatório de transições)
+    """
+    reference_env, reference_run = next(iter(runs.items()))
+    variants = variants or run_variants(base_path, threading_mode, reference_env, method, reference_run)
+
+    candidates, intervals = [], []
+    for variant in variants:
+        reference = load_data(base_path, threading_mode, reference_env, method, variant, reference_run)
+        if reference is None or len(reference) < 2:
+            continue
+        others = {}
+        for env, run in list(runs.items())[1:]:
+            df = load_data(base_path, threading_mode, env, method, variant, run)
+            if df is not None and not df.empty:
+                others[env] = df
+        times = pd.Series(reference['Mean'].values, index=reference['matSize'].astype(int).values)
+        for interval in score_intervals(reference, others, gflops_jump, divergence):
+            interval['variant'] = variant
+            intervals.append(interval)
+            if interval['score'] <= 1.0:
+                continue
+            size = pick_size(interval['low'], interval['high'])
+            if size is None:
+                continue
+            cost = estimate_cost(size, interval['high'], times[interval['high']], nrep, len(runs))
+            candidates.append((interval['score'], variant, size, cost, interval))
+
+    points, spent = [], 0.0
+    for score, variant, size, cost, interval in sorted(candidates, key=lambda c: -c[0]):
+        if spent + cost > budget:
+            continue
+        points.append((variant, size, cost, interval))
+        spent += cost
+    return points, intervals
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Planeja a próxima rodada da amostragem adaptativa")
+    parser.add_argument('--base', default='output', help="Diretório base (padrão: output)")
+    parser.add_argument('--mode', default='single', choices=['single', 'multi'])
+    parser.add_argument('--method', default='direct_compilation')
+    parser.add_argument('--env', action='append', metavar='AMBIENTE=NNN', required=True,
+                        help="Execução de cada ambiente (a primeira é a referência); NNN omitido = mais recente")
+    parser.add_argument('--budget', type=float, required=True, help="Orçamento de tempo da rodada (s)")
+    parser.add_argument('--nrep', type=int, default=5, help="Repetições por tamanho (padrão: 5)")
+    parser.add_argument('--variants', nargs='+', help="Variantes (padrão: todas da execução de referência)")
+    parser.add_argument('--gflops-jump', type=float, default=GFLOPS_JUMP)
+    parser.add_argument('--divergence', type=float, default=DIVERGENCE)
+    parser.add_argument('--out', required=True, help="CSV variante,matSize (entrada de REMEASURE_FILE)")
+    args = parser.parse_args()
+
+    runs = {}
+    for spec in args.env:
+        env, _, run = spec.partition('=')
+        runs[env] = run or get_latest_run(args.base, args.mode, env, args.method)
+        if runs[env] is None:
+            print(f"Sem execução para {env} em {args.base}/{args.mode}/{env}/{args.method}")
+            sys.exit(1)
+
+    points, intervals = plan(args.base, args.mode, args.method, runs, args.budget, args.nrep,
+                             args.variants, args.gflops_jump, args.divergence)
+
+    flagged = [i for i in intervals if i['score'] > 1.0]
+    print(f"Intervalos com transição: {len(flagged)} de {len(intervals)}")
+    print(f"{'Variante':<14} {'Intervalo':<13} {'ΔGFLOPS':>9} {'ΔOverhead':>10} {'Ambiente':<18} {'Novo N':>7}")
+    print("-" * 80)
+    chosen = {(variant, interval['low']): size for variant, size, _, interval in points}
+    for i in sorted(flagged, key=lambda i: -i['score']):
+        size = chosen.get((i['variant'], i['low']), '-')
+        print(f"{i['variant']:<14} {str(i['low']) + '-' + str(i['high']):<13} {i['jump_pct']:>8.1f}% "
+              f"{i['divergence_pp']:>8.2f}pp {i['env'] or '-':<18} {size:>7}")
+
+    with open(args.out, 'w') as f:
+        for variant, size, _, _ in points:
+            f.write(f"{variant},{size}\n")
+    print(f"\n{len(points)} tamanhos planejados (custo estimado: {sum(p[2] for p in points):.0f} s "
+          f"de {args.budget:.0f} s) → {args.out}")
+    sys.exit(0)
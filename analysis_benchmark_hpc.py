@@ -20,8 +20,12 @@ Data: 7 de Novembro de 2025
 import pandas as pd
 import numpy as np
 import sys
+from collections import OrderedDict
 from pathlib import Path
 
+from flop_model import (harness_gflop, harness_blas12, blas12_operand_bytes, DTYPES, DTYPE_NAMES,
+                        BLAS12_ROUTINES, HARNESS_NREP)
+
 # Cores para output
 class Colors:
     HEADER = '\033[95m'
@@ -44,8 +48,31 @@ class HPCThresholds:
     METHOD_DIFF_NEGLIGIBLE = 2.0  # < 2% diferença entre métodos
     METHOD_DIFF_ACCEPTABLE = 5.0  # < 5% diferença aceitável
 
+    # Estabilidade das medições (por ponto variante/ambiente/método/tamanho)
+    NOISE_CV_MAX = 5.0        # coeficiente de variação (σ/média) acima de 5%
+    NOISE_SPREAD_MAX = 10.0   # (máx - mín)/mediana acima de 10%
+    NOISE_SKEW_MAX = 1.0      # |assimetria| acima de 1 (cauda de outliers)
+    NOISE_KURTOSIS_MAX = 1.0  # curtose em excesso acima de 1 (caudas pesadas; só com NREP ≥ 6)
+
+    # Erro do temporizador por ponto (resolução + custo de leitura, por chamada)
+    TIMER_ERROR_MAX = 1.0     # acima de 1% do tempo médio o ponto não resolve overheads < 1%
+
+# Métodos de troca de biblioteca BLAS (subdiretórios de cada ambiente)
+#   dlopen: todas as bibliotecas no mesmo processo, intercaladas (teste_DLOPEN_DGEMM.c)
+METHODS = ['alternatives', 'direct_compilation', 'dlopen']
+METHOD_NAMES = {
+    'alternatives': 'Alternatives',
+    'direct_compilation': 'Compilação Direta',
+    'dlopen': 'dlopen',
+}
+
 def get_latest_run(base_path, threading_mode, environment, method):
-    """Encontra o número da execução mais recente"""
+    """
+    Encontra o número da execução completa mais recente
+    
+    Execuções com o marcador .in_progress (varredura interrompida, aguardando
+    retomada) são ignoradas; execuções antigas sem marcador contam como completas.
+    """
     import os
     run_dir = f"{base_path}/{threading_mode}/{environment}/{method}"
     if not os.path.exists(run_dir):
@@ -56,24 +83,53 @@ def get_latest_run(base_path, threading_mode, environment, method):
     try:
         for item in os.listdir(run_dir):
             item_path = os.path.join(run_dir, item)
-            if os.path.isdir(item_path) and item.isdigit() and len(item) == 3:
+            if (os.path.isdir(item_path) and item.isdigit() and len(item) == 3
+                    and not os.path.exists(os.path.join(item_path, '.in_progress'))):
                 runs.append(item)
     except:
         return None
     
     return sorted(runs)[-1] if runs else None
 
-def load_data(base_path, threading_mode, environment, method, variant, run_number=None):
+def dtype_suffix(dtype):
+    """Sufixo do arquivo de um tipo ou rotina BLAS 1/2 (benchmark_common.sh: dtype_output_file)"""
+    if dtype == 'd':
+        return ''
+    return f"_{dtype}gemm" if dtype in DTYPES else f"_{dtype}"
+
+# Caminhos de chamada do DGEMM (benchmark_common.sh: CALL_PATHS; blas_path.h)
+CALL_PATHS = ['gsl', 'cblas', 'fortran']
+CALL_PATH_NAMES = {'gsl': 'GSL', 'cblas': 'CBLAS', 'fortran': 'Fortran'}
+
+def callpath_suffix(call_path):
+    """Sufixo do arquivo de um caminho de chamada (benchmark_common.sh: callpath_output_file)"""
+    return '' if call_path == 'gsl' else f"_{call_path}"
+
+# Cache de load_data: caminho -> (mtime_ns, tamanho, DataFrame). A análise relê o
+# mesmo .dat uma vez por tamanho/seção; o arquivo é relido se mudar (remedição).
+# Limitado aos _DATA_CACHE_MAX arquivos usados mais recentemente.
+_DATA_CACHE = OrderedDict()
+_DATA_CACHE_MAX = 512
+
+def clear_data_cache():
+    """Esvazia o cache de load_data"""
+    _DATA_CACHE.clear()
+
+def load_data(base_path, threading_mode, environment, method, variant, run_number=None, dtype='d',
+              call_path='gsl'):
     """
     Carrega dados de benchmark com nova estrutura
     
     Args:
         base_path: Caminho base (ex: 'output')
         threading_mode: 'single' ou 'multi'
-        environment: 'native' ou 'docker'
+        environment: 'native' ou um ambiente de container ('docker', 'podman', ...)
         method: 'alternatives' ou 'direct_compilation'
         variant: Nome da variante (ex: 'OpenBLAS64')
         run_number: Número da execução (ex: '001'). Se None, usa a mais recente.
+        dtype: Tipo do GEMM ('s', 'd', 'c', 'z'); 'd' lê output_<variante>.dat;
+               ou rotina BLAS 1/2 ('dgemv', 'daxpy', 'ddot')
+        call_path: Caminho de chamada ('gsl', 'cblas', 'fortran'); 'gsl' lê output_<variante>.dat
     """
     if run_number is None:
         run_number = get_latest_run(base_path, threading_mode, environment, method)
@@ -81,14 +137,419 @@ def load_data(base_path, threading_mode, environment, method, variant, run_numbe
     if run_number is None:
         return None
     
-    file_path = f"{base_path}/{threading_mode}/{environment}/{method}/{run_number}/output_{variant}.dat"
+    file_path = (f"{base_path}/{threading_mode}/{environment}/{method}/{run_number}/"
+                 f"output_{variant}{dtype_suffix(dtype)}{callpath_suffix(call_path)}.dat")
     try:
-        df = pd.read_csv(file_path)
+        stat = Path(file_path).stat()
+        cached = _DATA_CACHE.get(file_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _DATA_CACHE.move_to_end(file_path)
+            return cached[2].copy()
+        df = pd.read_csv(file_path, skipinitialspace=True)
         df.columns = df.columns.str.strip()
-        return df
+        # Remedições são anexadas ao mesmo arquivo: vale a medição mais recente
+        df = df.drop_duplicates(subset='matSize', keep='last').sort_values('matSize')
+        df['dtype'] = dtype
+        df = df.reset_index(drop=True)
+        _DATA_CACHE[file_path] = (stat.st_mtime_ns, stat.st_size, df)
+        _DATA_CACHE.move_to_end(file_path)
+        if len(_DATA_CACHE) > _DATA_CACHE_MAX:
+            _DATA_CACHE.popitem(last=False)
+        # cópia: quem chama pode acrescentar colunas (notebooks)
+        return df.copy()
     except FileNotFoundError:
         return None
 
+def read_env_file(file_path):
+    """Lê um arquivo KEY="valor" gravado pelos runners (host.env, runtime.env)"""
+    env_file = Path(file_path)
+    if not env_file.is_file():
+        return None
+    info = {}
+    for line in env_file.read_text().splitlines():
+        if '=' in line:
+            key, value = line.split('=', 1)
+            info[key.strip()] = value.strip().strip('"')
+    return info
+
+def read_host_fingerprint(run_dir):
+    """
+    Lê a identificação do host gravada pelo runner (<run_dir>/host.env)
+    
+    Returns:
+        Dicionário com host_id, cpu_model, cpu_cores, cpu_max_mhz, caches,
+        kernel e bench_threads, ou None para execuções sem host.env
+    """
+    return read_env_file(Path(run_dir) / 'host.env')
+
+def read_runtime_info(base_path, threading_mode, environment, method, run_number=None):
+    """
+    Lê a configuração do ambiente gravada pelo runner (<run_dir>/runtime.env)
+    
+    Returns:
+        Dicionário com runtime, engine, flags, engine_version e image, ou None
+    """
+    if run_number is None:
+        run_number = get_latest_run(base_path, threading_mode, environment, method)
+    if run_number is None:
+        return None
+    return read_env_file(Path(base_path) / threading_mode / environment / method / run_number / 'runtime.env')
+
+def read_timer_calibration(base_path, threading_mode, environment, method, run_number=None):
+    """
+    Lê a calibração do temporizador gravada pelo harness (<run_dir>/timer.csv)
+    
+    Returns:
+        DataFrame com file, clock, resolution, overhead, granularity e batch_min (s),
+        uma linha por arquivo .dat (a calibração mais recente), ou None
+    """
+    if run_number is None:
+        run_number = get_latest_run(base_path, threading_mode, environment, method)
+    if run_number is None:
+        return None
+    try:
+        calib = pd.read_csv(Path(base_path) / threading_mode / environment / method / run_number / 'timer.csv')
+    except FileNotFoundError:
+        return None
+    return calib.drop_duplicates(subset='file', keep='last').reset_index(drop=True)
+
+def timing_error(df, calib, file_name):
+    """
+    Limite do erro de medição do temporizador por ponto
+    
+    Cada medição são duas leituras do relógio: erro de até uma resolução mais a
+    incerteza do custo de leitura descontado, dividido pelas chamadas do lote
+    (coluna Batch; 1 em arquivos anteriores à medição em lotes).
+    
+    Returns:
+        DataFrame com matSize, Mean, Batch, error_s e error_pct
+    """
+    row = calib[calib['file'] == file_name]
+    row = row.iloc[0] if not row.empty else calib.median(numeric_only=True)
+    error = df[['matSize', 'Mean']].copy()
+    error['Batch'] = df['Batch'] if 'Batch' in df else 1
+    error['error_s'] = (row['resolution'] + row['overhead']) / error['Batch']
+    error['error_pct'] = error['error_s'] / error['Mean'] * 100
+    return error
+
+def read_call_paths(base_path, threading_mode, environment, method, run_number=None):
+    """
+    Lê o símbolo BLAS resolvido por caminho de chamada (<run_dir>/callpath.csv)
+    
+    Returns:
+        DataFrame com file, path, entry, symbol, library e ilp64, uma linha por
+        arquivo .dat (a resolução mais recente), ou None
+    """
+    if run_number is None:
+        run_number = get_latest_run(base_path, threading_mode, environment, method)
+    if run_number is None:
+        return None
+    try:
+        resolved = pd.read_csv(Path(base_path) / threading_mode / environment / method / run_number / 'callpath.csv')
+    except FileNotFoundError:
+        return None
+    return resolved.drop_duplicates(subset='file', keep='last').reset_index(drop=True)
+
+def read_backends(base_path, threading_mode, environment, method, run_number=None):
+    """
+    Lê a biblioteca e o backend de threading detectados pelo ldd (<run_dir>/backends.csv)
+    
+    Returns:
+        DataFrame com uma linha por variante (registro mais recente), ou None
+    """
+    if run_number is None:
+        run_number = get_latest_run(base_path, threading_mode, environment, method)
+    if run_number is None:
+        return None
+    path = Path(base_path) / threading_mode / environment / method / run_number / 'backends.csv'
+    if not path.exists():
+        return None
+    df = pd.read_csv(path)
+    return df.drop_duplicates('variant', keep='last').reset_index(drop=True)
+
+# Sufixo da variante multithread -> backend esperado (benchmark_common.sh: backend_suffix)
+BACKEND_SUFFIXES = {'Ser': 'serial', 'Pth': 'pthread', 'Omp': 'openmp'}
+
+def classify_threading(row):
+    """
+    Problemas de threading de uma variante (linha de backends.csv)
+    
+    - oversubscrição: mais threads da BLAS que CPUs disponíveis ao processo
+    - OpenMP + pthreads: harness com runtime OpenMP sobre um backend pthread;
+      cada thread OpenMP da aplicação dispararia seu próprio pool de pthreads
+    - backend divergente: o backend carregado não é o indicado pelo nome da variante
+    
+    Returns:
+        Lista de motivos (vazia quando não há problema)
+    """
+    issues = []
+    if row['blas_threads'] > row['cpus']:
+        issues.append(f"oversubscrição ({row['blas_threads']} threads / {row['cpus']} CPUs)")
+    if (row['harness_openmp'] and row['backend'] == 'pthread'
+            and row['omp_threads'] * row['blas_threads'] > row['cpus']):
+        issues.append(f"OpenMP {row['omp_threads']} x pthreads {row['blas_threads']}")
+    expected = BACKEND_SUFFIXES.get(str(row['variant'])[-3:])
+    if expected and expected != row['backend']:
+        issues.append(f"backend divergente (esperado {expected})")
+    return issues
+
+def backend_scaling(base_path, environment, method, matrix_sizes, run_number=None):
+    """
+    Escalabilidade de cada variante multithread sobre a mesma biblioteca single-thread
+    
+    A referência é a variante single-thread com a mesma biblioteca em backends.csv
+    (ou o nome sem o sufixo de backend), na execução mais recente.
+    
+    Returns:
+        Lista de dicionários (variant, library, backend, threads, matSize,
+        gflops, speedup, efficiency_pct)
+    """
+    multi = read_backends(base_path, 'multi', environment, method, run_number)
+    if multi is None:
+        return []
+    single = read_backends(base_path, 'single', environment, method)
+    rows = []
+    
+    for _, b in multi.iterrows():
+        base_variant = str(b['variant'])
+        if base_variant[-3:] in BACKEND_SUFFIXES:
+            base_variant = base_variant[:-3]
+        if single is not None:
+            same_lib = single[single['library'] == b['library']]
+            if not same_lib.empty:
+                base_variant = same_lib['variant'].iloc[0]
+        
+        df_multi = load_data(base_path, 'multi', environment, method, b['variant'], run_number)
+        df_single = load_data(base_path, 'single', environment, method, base_variant)
+        if df_multi is None or df_single is None:
+            continue
+        threads = max(1, min(b['blas_threads'], b['cpus']))
+        
+        for size in matrix_sizes:
+            m = df_multi[df_multi['matSize'] == size]
+            s = df_single[df_single['matSize'] == size]
+            if m.empty or s.empty:
+                continue
+            speedup = s['Mean'].values[0] / m['Mean'].values[0]
+            rows.append({
+                'variant': b['variant'], 'library': b['library'], 'backend': b['backend'],
+                'threads': threads, 'matSize': size,
+                'gflops': calculate_gflops(size, m['Mean'].values[0], m['Size'].values[0]),
+                'speedup': speedup, 'efficiency_pct': speedup / threads * 100
+            })
+    
+    return rows
+
+# Posicionamento dos jobs no modo de contenção (run_contention.sh)
+CONTENTION_PLACEMENTS = ['pinned', 'unpinned']
+
+def load_contention(base_path, environment, placement, run_number=None):
+    """
+    Carrega as amostras por repetição de uma execução de contenção
+    (<base_path>/contention/<ambiente>/<pinned|unpinned>/NNN/K<k>_N<n>_job<j>_samples.csv)
+    
+    O tamanho do problema (coluna Size, GFLOP por chamada) vem do .dat do
+    mesmo job (K<k>_N<n>_job<j>.dat); NaN se o job não chegou a gravá-lo.
+    
+    Returns:
+        DataFrame com K, job, matSize, rep, start (s, relógio de parede),
+        time (s) e Size, ou None
+    """
+    import re
+    if run_number is None:
+        run_number = get_latest_run(base_path, 'contention', environment, placement)
+    if run_number is None:
+        return None
+    
+    frames = []
+    run_dir = Path(base_path) / 'contention' / environment / placement / run_number
+    for path in sorted(run_dir.glob('K*_N*_job*_samples.csv')):
+        match = re.match(r'K(\d+)_N\d+_job(\d+)_samples\.csv', path.name)
+        if not match:
+            continue
+        df = pd.read_csv(path).assign(K=int(match.group(1)), job=int(match.group(2)))
+        dat_path = path.with_name(path.name.replace('_samples.csv', '.dat'))
+        if dat_path.exists():
+            dat = pd.read_csv(dat_path, skipinitialspace=True)
+            dat.columns = dat.columns.str.strip()
+            sizes = dat.drop_duplicates(subset='matSize', keep='last')[['matSize', 'Size']]
+            df = df.merge(sizes, on='matSize', how='left')
+        else:
+            df['Size'] = np.nan
+        frames.append(df)
+    
+    return pd.concat(frames, ignore_index=True) if frames else None
+
+def contention_summary(samples):
+    """
+    Latência por job e throughput agregado do nó para cada (K, tamanho)
+    
+    O throughput agregado é o total de GFLOP de todos os jobs dividido pelo
+    intervalo entre a primeira partida e o último término (makespan);
+    a eficiência compara com K vezes o throughput de um job isolado (K=1).
+    O GFLOP por chamada é o Size gravado pelo harness (modelo do harness
+    apenas se nenhum job do grupo gravou o .dat).
+    
+    Returns:
+        DataFrame com K, matSize, jobs, samples, p50_ms, p99_ms, job_gflops,
+        node_gflops e scaling_pct
+    """
+    rows = []
+    for (k, size), group in samples.groupby(['K', 'matSize']):
+        times = group['time'].values
+        recorded = group['Size'].dropna() if 'Size' in group else pd.Series(dtype=float)
+        gflop = recorded.iloc[-1] if not recorded.empty else harness_gflop(size)
+        makespan = (group['start'] + group['time']).max() - group['start'].min()
+        rows.append({
+            'K': k, 'matSize': size, 'jobs': group['job'].nunique(), 'samples': len(group),
+            'p50_ms': np.percentile(times, 50) * 1e3,
+            'p99_ms': np.percentile(times, 99) * 1e3,
+            'job_gflops': gflop / np.mean(times),
+            'node_gflops': gflop * len(group) / makespan if makespan > 0 else np.nan,
+        })
+    
+    summary = pd.DataFrame(rows)
+    if summary.empty:
+        return summary
+    single = summary[summary['K'] == 1].set_index('matSize')['node_gflops']
+    summary['scaling_pct'] = [
+        r.node_gflops / (r.K * single[r.matSize]) * 100 if r.matSize in single.index else np.nan
+        for r in summary.itertuples()
+    ]
+    return summary.sort_values(['matSize', 'K']).reset_index(drop=True)
+
+# Fases de um job (run_latency.sh): (nome, fase inicial, fase final, descrição)
+LATENCY_PHASES = [
+    ('startup', 'launch', 'process_start', 'Partida (fork/exec, container)'),
+    ('loading', 'process_start', 'library_loaded', 'Carga (ld.so, init da BLAS)'),
+    ('setup', 'library_loaded', 'first_dgemm_start', 'Preparo (alocação, matrizes)'),
+    ('first_dgemm', 'first_dgemm_start', 'first_dgemm_done', '1º DGEMM (frio)'),
+    ('steady', 'first_dgemm_done', 'exit', 'Demais DGEMMs'),
+    ('teardown', 'exit', 'returned', 'Encerramento (saída, remoção do container)'),
+]
+
+def load_latency(base_path, environment, run_number=None):
+    """
+    Carrega os instantes das fases de cada job de uma execução de latência
+    (<base_path>/latency/<ambiente>/direct_compilation/NNN/<variante>_job<j>_phases.csv)
+    
+    Returns:
+        DataFrame com variant, job e uma coluna por fase (epoch, s), ou None
+    """
+    import re
+    if run_number is None:
+        run_number = get_latest_run(base_path, 'latency', environment, 'direct_compilation')
+    if run_number is None:
+        return None
+    
+    rows = []
+    run_dir = Path(base_path) / 'latency' / environment / 'direct_compilation' / run_number
+    for path in sorted(run_dir.glob('*_job*_phases.csv')):
+        match = re.match(r'(.+)_job(\d+)_phases\.csv', path.name)
+        if not match:
+            continue
+        phases = pd.read_csv(path, names=['phase', 'time']).drop_duplicates('phase', keep='last')
+        row = dict(zip(phases['phase'], phases['time']))
+        rows.append({'variant': match.group(1), 'job': int(match.group(2)), **row})
+    
+    return pd.DataFrame(rows) if rows else None
+
+def latency_breakdown(jobs):
+    """
+    Duração mediana de cada fase (LATENCY_PHASES) e do job inteiro, por variante
+    
+    process_start vem de /proc/self/stat (resolução de 1/CLK_TCK, ~10 ms) e é
+    limitado ao intervalo [launch, library_loaded]: a soma partida + carga é exata,
+    a divisão entre as duas tem a resolução do kernel. Jobs incompletos
+    (sem exit/returned) são descartados.
+    
+    Returns:
+        DataFrame com variant, jobs, <fase>_ms e total_ms (launch -> returned)
+    """
+    required = [start for _, start, _, _ in LATENCY_PHASES] + ['returned']
+    if any(phase not in jobs for phase in required):
+        return pd.DataFrame()
+    jobs = jobs.dropna(subset=['launch', 'library_loaded', 'exit', 'returned']).copy()
+    jobs['process_start'] = jobs['process_start'].fillna(jobs['launch']).clip(jobs['launch'], jobs['library_loaded'])
+    
+    rows = []
+    for variant, group in jobs.groupby('variant', sort=False):
+        row = {'variant': variant, 'jobs': len(group)}
+        for name, start, end, _ in LATENCY_PHASES:
+            row[f'{name}_ms'] = (group[end] - group[start]).median() * 1e3
+        row['total_ms'] = (group['returned'] - group['launch']).median() * 1e3
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+def list_environments(base_path, threading_mode):
+    """
+    Ambientes presentes na árvore de resultados (nativo primeiro)
+    
+    Cada ambiente da matriz de runtimes (docker, docker_privileged, podman,
+    apptainer, ...) é um diretório em <base_path>/<threading_mode>/.
+    """
+    mode_dir = Path(base_path) / threading_mode
+    if not mode_dir.is_dir():
+        return ['native', 'docker']
+    envs = sorted(p.name for p in mode_dir.iterdir() if p.is_dir())
+    return sorted(envs, key=lambda env: env != 'native')
+
+def find_result_trees(root):
+    """
+    Localiza árvores de resultados (diretórios com single/ ou multi/) sob root
+    
+    Cada host deve ser copiado para seu próprio subdiretório
+    (ex: results/nodeA/output, results/nodeB/output), de modo que os
+    diretórios NNN de hosts diferentes nunca se sobrescrevam.
+    """
+    root = Path(root)
+    trees = []
+    for candidate in [root] + sorted(p for p in root.rglob('*') if p.is_dir()):
+        if (candidate / 'single').is_dir() or (candidate / 'multi').is_dir():
+            if not any(parent in trees for parent in candidate.parents):
+                trees.append(candidate)
+    return trees
+
+def load_multi_host(roots, threading_mode, variants, environments=None, methods=None):
+    """
+    Carrega e combina resultados de vários hosts
+    
+    Args:
+        roots: Lista de diretórios (árvores de resultados ou pastas que as contêm)
+        environments: Ambientes a carregar. Se None, todos os presentes em
+                      cada árvore (ver list_environments)
+    
+    Returns:
+        DataFrame com as colunas do .dat mais variant, environment, method,
+        run, tree e os campos de host.env (host_id, cpu_model, ...); a chave
+        (tree, environment, method, run) evita colisões entre hosts
+    """
+    methods = methods or METHODS
+    frames = []
+
+    for root in roots:
+        for tree in find_result_trees(root):
+            # Execuções sem host.env: identifica o host pelo caminho da árvore
+            label = str(tree.relative_to(root)) if tree != Path(root) else Path(root).resolve().name
+            for env in environments or list_environments(tree, threading_mode):
+                for method in methods:
+                    run = get_latest_run(str(tree), threading_mode, env, method)
+                    if run is None:
+                        continue
+                    run_dir = tree / threading_mode / env / method / run
+                    host = read_host_fingerprint(run_dir) or {'host_id': label}
+                    for variant in variants:
+                        df = load_data(str(tree), threading_mode, env, method, variant, run)
+                        if df is None or df.empty:
+                            continue
+                        df = df.assign(variant=variant, environment=env, method=method,
+                                       run=run, tree=str(tree), **host)
+                        frames.append(df)
+
+    if not frames:
+        return None
+    return pd.concat(frames, ignore_index=True)
+
 def calculate_overhead(native_time, docker_time):
     """Calcula overhead percentual e absoluto"""
     if native_time == 0:
@@ -97,19 +558,87 @@ def calculate_overhead(native_time, docker_time):
     overhead_abs = docker_time - native_time
     return overhead_pct, overhead_abs
 
-def calculate_gflops(matrix_size, time_seconds):
+def calculate_gflops(matrix_size, time_seconds, gflop=None, dtype='d'):
     """
-    Calcula GFLOPS para operação DGEMM
-    DGEMM: C = A * B (matrizes N x N)
-    Operações: 2 * N^3 (N^3 multiplicações + N^3 adições)
+    Calcula GFLOPS para operação GEMM
+    GEMM: C = alpha * A * B + beta * C (matrizes N x N)
+    
+    Args:
+        gflop: Tamanho do problema gravado pelo harness (coluna Size).
+               Se None, usa o mesmo modelo do harness (flop_model.py):
+               2*N^3 + 2*N^2 para alpha=1, beta=0.5 (reais);
+               8*N^3 + 8*N^2 para CGEMM/ZGEMM
+        dtype: Tipo do GEMM ('s', 'd', 'c', 'z') ou rotina BLAS 1/2
     """
     if time_seconds == 0 or time_seconds < 0:
         return 0.0
-    n = matrix_size
-    operations = 2.0 * (n ** 3)
-    flops = operations / time_seconds
-    gflops = flops / 1e9
-    return gflops
+    if gflop is None or not gflop > 0:
+        gflop = harness_blas12(matrix_size, dtype)[0] if dtype in BLAS12_ROUTINES else harness_gflop(matrix_size, dtype)
+    return gflop / time_seconds
+
+def calculate_bandwidth(matrix_size, time_seconds, gbytes=None, routine='dgemv'):
+    """
+    Calcula GB/s de uma rotina BLAS 1/2
+    
+    Args:
+        gbytes: Tráfego gravado pelo harness (coluna GBytes). Se None, usa o
+                modelo de flop_model.py (tráfego compulsório de memória)
+    """
+    if time_seconds == 0 or time_seconds < 0:
+        return 0.0
+    if gbytes is None or not gbytes > 0:
+        gbytes = harness_blas12(matrix_size, routine)[1]
+    return gbytes / time_seconds
+
+def cache_size_bytes(value):
+    """Tamanho de cache gravado em host.env ('24576K', '32M') em bytes, ou None se desconhecido"""
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+    value = str(value).strip().upper()
+    try:
+        if value[-1:] in units:
+            return float(value[:-1]) * units[value[-1]]
+        return float(value)
+    except ValueError:
+        return None
+
+def llc_bytes(base_path, threading_mode, environment, method, run_number=None):
+    """Cache de último nível (cache_l3 do host.env da execução) em bytes, ou None"""
+    if run_number is None:
+        run_number = get_latest_run(base_path, threading_mode, environment, method)
+    if run_number is None:
+        return None
+    host = read_host_fingerprint(Path(base_path) / threading_mode / environment / method / run_number)
+    return cache_size_bytes(host.get('cache_l3', '')) if host else None
+
+def working_set_gb(matrix_size, working_set=None, routine='dgemv'):
+    """
+    Working set de uma rotina BLAS 1/2 em GB
+    
+    Args:
+        working_set: Coluna WorkingSet (operandos rotacionados pelo harness). Se
+                     None, os mesmos operandos reutilizados a cada chamada
+    """
+    if working_set is None or not working_set > 0:
+        return blas12_operand_bytes(routine, matrix_size) * 1e-9
+    return working_set
+
+def calculate_energy(df):
+    """
+    Energia por DGEMM e eficiência energética a partir das colunas RAPL do harness
+    
+    Joules = PkgJoules + DramJoules (DRAM ausente conta como zero);
+    GFLOPS/W = Size (GFLOP) / Joules, pois GFLOPS / (J / s) = GFLOP / J.
+    
+    Returns:
+        DataFrame com matSize, Mean, Joules, GFLOPS_W ou None sem leituras RAPL
+    """
+    if df is None or 'PkgJoules' not in df or df['PkgJoules'].isna().all():
+        return None
+    energy = df[['matSize', 'Size', 'Mean']].copy()
+    dram = df['DramJoules'].fillna(0.0) if 'DramJoules' in df else 0.0
+    energy['Joules'] = df['PkgJoules'] + dram
+    energy['GFLOPS_W'] = energy['Size'] / energy['Joules']
+    return energy[energy['Joules'] > 0]
 
 def calculate_efficiency_loss(native_gflops, docker_gflops):
     """Calcula perda de eficiência em GFLOPS"""
@@ -132,6 +661,286 @@ def get_overhead_classification(overhead_pct):
     else:
         return "CRÍTICO", Colors.RED, "✗"
 
+def max_sample_kurtosis(n):
+    """
+    Maior curtose em excesso possível com n repetições
+
+    O harness grava gsl_rstat_kurtosis (n·M4/M2² - 3), cujo máximo é
+    n - 2 + 1/(n-1) - 3: um outlier e n-1 tempos iguais (0.25 com n = 5)
+    """
+    return n - 2 + 1 / (n - 1) - 3 if n > 1 else 0.0
+
+def kurtosis_criterion_active(nrep=HARNESS_NREP):
+    """O critério de curtose só é aplicado se o limite for atingível com nrep repetições"""
+    return max_sample_kurtosis(nrep) > HPCThresholds.NOISE_KURTOSIS_MAX
+
+def classify_measurement_noise(row, nrep=HARNESS_NREP):
+    """
+    Avalia a estabilidade de uma linha do .dat (um tamanho de matriz)
+
+    Usa as estatísticas gravadas pelo harness: SD/Mean (CV), Largest/Smallest
+    (menor/maior tempo), Median, Skew e Kurtosis.
+
+    Args:
+        nrep: Repetições por tamanho (NREP); com poucas repetições a curtose
+              amostral não alcança NOISE_KURTOSIS_MAX e o critério é ignorado
+
+    Returns:
+        (métricas, motivos) - motivos vazio indica medição estável
+    """
+    mean = row['Mean']
+    median = row['Median']
+    cv_pct = (row['SD'] / mean) * 100 if mean > 0 else np.nan
+    spread_pct = ((row['Smallest'] - row['Largest']) / median) * 100 if median > 0 else np.nan
+    skew = row['Skew']
+    kurtosis = row['Kurtosis']
+
+    reasons = []
+    if not mean > 0:
+        reasons.append('resolução do timer')
+    if cv_pct > HPCThresholds.NOISE_CV_MAX:
+        reasons.append(f'CV {cv_pct:.1f}%')
+    if spread_pct > HPCThresholds.NOISE_SPREAD_MAX:
+        reasons.append(f'amplitude {spread_pct:.1f}%')
+    if abs(skew) > HPCThresholds.NOISE_SKEW_MAX:
+        reasons.append(f'assimetria {skew:+.2f}')
+    if kurtosis_criterion_active(nrep) and kurtosis > HPCThresholds.NOISE_KURTOSIS_MAX:
+        reasons.append(f'curtose {kurtosis:.2f}')
+
+    metrics = {'cv_pct': cv_pct, 'spread_pct': spread_pct, 'skew': skew, 'kurtosis': kurtosis}
+    return metrics, reasons
+
+def detect_unstable_measurements(base_path, threading_mode, variants, environments=None,
+                                 methods=None, run_number=None, nrep=HARNESS_NREP):
+    """
+    Lista os pontos (variante, ambiente, método, tamanho) com medição instável
+
+    Returns:
+        Lista de dicionários, um por ponto instável, com o número da execução
+        para permitir a remedição apenas desses pontos (run_remeasure.sh)
+    """
+    environments = environments or list_environments(base_path, threading_mode)
+    methods = methods or METHODS
+    flagged = []
+
+    for env in environments:
+        for method in methods:
+            run = run_number or get_latest_run(base_path, threading_mode, env, method)
+            if run is None:
+                continue
+            for variant in variants:
+                df = load_data(base_path, threading_mode, env, method, variant, run)
+                if df is None or df.empty:
+                    continue
+                for _, row in df.iterrows():
+                    metrics, reasons = classify_measurement_noise(row, nrep)
+                    if reasons:
+                        flagged.append({
+                            'threading_mode': threading_mode,
+                            'environment': env,
+                            'method': method,
+                            'run': run,
+                            'variant': variant,
+                            'matSize': int(row['matSize']),
+                            **metrics,
+                            'reasons': '; '.join(reasons),
+                        })
+    return flagged
+
+def write_remeasure_list(flagged, file_path):
+    """Grava a lista de pontos instáveis no formato lido por run_remeasure.sh"""
+    columns = ['threading_mode', 'environment', 'method', 'run', 'variant', 'matSize',
+               'cv_pct', 'spread_pct', 'skew', 'kurtosis', 'reasons']
+    df = pd.DataFrame(flagged, columns=columns)
+    df.to_csv(file_path, index=False, float_format='%.4f')
+    return file_path
+
+# Termos do modelo T(N) = a·N³ + b·N² + c
+TIME_MODEL_TERMS = [
+    ('a', 'computação (N³)'),
+    ('b', 'tráfego de memória (N²)'),
+    ('c', 'custo fixo por chamada'),
+]
+
+def fit_time_model(sizes, times, confidence=0.95):
+    """
+    Ajusta T(N) = a·N³ + b·N² + c por mínimos quadrados relativos
+
+    O resíduo é ponderado por 1/T para que os tamanhos pequenos (onde o
+    custo fixo aparece) tenham o mesmo peso dos grandes.
+
+    Returns:
+        Dicionário com coeficientes, erros padrão, intervalos de confiança,
+        covariância e graus de liberdade, ou None se houver menos de 4 pontos
+    """
+    from scipy import stats
+
+    sizes = np.asarray(sizes, dtype=float)
+    times = np.asarray(times, dtype=float)
+    valid = times > 0
+    sizes, times = sizes[valid], times[valid]
+    dof = len(sizes) - 3
+    if dof < 1:
+        return None
+
+    # Escala N/1000 para manter a matriz de projeto bem condicionada
+    scale = np.array([1e-9, 1e-6, 1.0])
+    x = sizes / 1000.0
+    design = np.column_stack([x ** 3, x ** 2, np.ones_like(x)]) / times[:, None]
+    target = np.ones_like(times)
+
+    coef, _, _, _ = np.linalg.lstsq(design, target, rcond=None)
+    residual = target - design @ coef
+    sigma2 = (residual @ residual) / dof
+    cov = sigma2 * np.linalg.pinv(design.T @ design)
+
+    coef = coef * scale
+    cov = cov * np.outer(scale, scale)
+    stderr = np.sqrt(np.diag(cov))
+    t_crit = stats.t.ppf((1 + confidence) / 2, dof)
+
+    return {
+        'coef': dict(zip('abc', coef)),
+        'stderr': dict(zip('abc', stderr)),
+        'ci': {k: (c - t_crit * e, c + t_crit * e) for k, c, e in zip('abc', coef, stderr)},
+        'cov': cov,
+        'dof': dof,
+        'rel_rmse': float(np.sqrt(sigma2)),
+    }
+
+def predict_time(fit, matrix_size):
+    """Tempo previsto pelo modelo e seu erro padrão para um tamanho N"""
+    n = float(matrix_size)
+    basis = np.array([n ** 3, n ** 2, 1.0])
+    coef = np.array([fit['coef'][k] for k in 'abc'])
+    return float(basis @ coef), float(np.sqrt(basis @ fit['cov'] @ basis))
+
+def compare_time_models(fit_ref, fit_other, confidence=0.95):
+    """
+    Compara coeficiente a coeficiente dois ajustes (ex: nativo vs Docker)
+
+    Returns:
+        {termo: (delta, (ic_inf, ic_sup), significativo)} - significativo
+        quando o intervalo de confiança da diferença não contém zero
+    """
+    from scipy import stats
+
+    dof = min(fit_ref['dof'], fit_other['dof'])
+    t_crit = stats.t.ppf((1 + confidence) / 2, dof)
+    result = {}
+    for k in 'abc':
+        delta = fit_other['coef'][k] - fit_ref['coef'][k]
+        err = t_crit * np.hypot(fit_ref['stderr'][k], fit_other['stderr'][k])
+        ci = (delta - err, delta + err)
+        result[k] = (delta, ci, not (ci[0] <= 0.0 <= ci[1]))
+    return result
+
+def extrapolate_overhead(fit_ref, fit_other, matrix_size, confidence=0.95):
+    """
+    Overhead percentual previsto em um tamanho não medido (ex: N=16384)
+
+    O intervalo usa propagação de primeira ordem dos erros das duas previsões.
+    """
+    from scipy import stats
+
+    t_ref, se_ref = predict_time(fit_ref, matrix_size)
+    t_other, se_other = predict_time(fit_other, matrix_size)
+    if t_ref <= 0:
+        return None
+    overhead_pct, _ = calculate_overhead(t_ref, t_other)
+    se_pct = 100 * np.hypot(se_other / t_ref, t_other * se_ref / t_ref ** 2)
+    z = stats.norm.ppf((1 + confidence) / 2)
+    return {
+        'time_ref': t_ref,
+        'time_other': t_other,
+        'overhead_pct': overhead_pct,
+        'ci': (overhead_pct - z * se_pct, overhead_pct + z * se_pct),
+    }
+
+def fit_variant_models(base_path, threading_mode, variant, environments, methods, run_number=None):
+    """Ajusta o modelo de tempo para cada (ambiente, método) de uma variante"""
+    fits = {}
+    for env in environments:
+        for method in methods:
+            df = load_data(base_path, threading_mode, env, method, variant, run_number)
+            if df is None or df.empty:
+                continue
+            fit = fit_time_model(df['matSize'].values, df['Mean'].values)
+            if fit is not None:
+                fits[(env, method)] = fit
+    return fits
+
+def print_model_comparison(label, fit_ref, fit_other):
+    """Imprime a diferença de cada coeficiente entre dois ajustes"""
+    comparison = compare_time_models(fit_ref, fit_other)
+    for k, term in TIME_MODEL_TERMS:
+        delta, ci, significant = comparison[k]
+        ref = fit_ref['coef'][k]
+        rel = (delta / ref) * 100 if ref != 0 else np.nan
+        if significant:
+            color, status = Colors.YELLOW, "≠ ALTERADO"
+        else:
+            color, status = Colors.GREEN, "≈ inalterado"
+        print(f"  {label:<38} {k} {term:<24} {delta:>+12.3e} [{ci[0]:>+11.3e}, {ci[1]:>+11.3e}] "
+              f"{rel:>+9.2f}% {color}{status}{Colors.END}")
+
+def time_model_analysis(base_path, threading_mode, variants, run_number=None, target_size=16384):
+    """
+    Ajuste de T(N) = a·N³ + b·N² + c por (variante, ambiente, método)
+
+    Mostra quais coeficientes o Docker e o método alternatives alteram e
+    extrapola o overhead para um tamanho de produção (target_size).
+    """
+    environments = list_environments(base_path, threading_mode)
+    containers = [env for env in environments if env != 'native']
+    methods = METHODS
+    results = {}
+
+    for variant in variants:
+        fits = fit_variant_models(base_path, threading_mode, variant, environments, methods, run_number)
+        if not fits:
+            continue
+        results[variant] = {'fits': fits, 'extrapolation': {}}
+
+        print(f"\n{Colors.CYAN}■ Biblioteca: {variant}{Colors.END}")
+        print(f"{'Ambiente/Método':<32} {'a (s/N³)':>13} {'b (s/N²)':>13} {'c (s)':>13} "
+              f"{'±IC95 c':>11} {'Erro rel.':>10}")
+        print("-" * 100)
+        for (env, method), fit in fits.items():
+            c_ci = fit['ci']['c']
+            print(f"{env + '/' + method:<32} {fit['coef']['a']:>13.4e} {fit['coef']['b']:>13.4e} "
+                  f"{fit['coef']['c']:>+13.4e} {(c_ci[1] - c_ci[0]) / 2:>11.2e} {fit['rel_rmse'] * 100:>9.2f}%")
+
+        print(f"\n  {Colors.BOLD}Diferença de coeficientes (IC 95%){Colors.END}")
+        for env in containers:
+            for method in methods:
+                if ('native', method) in fits and (env, method) in fits:
+                    print_model_comparison(f"{env} - Nativo ({method})",
+                                           fits[('native', method)], fits[(env, method)])
+        for env in environments:
+            if (env, 'alternatives') in fits and (env, 'direct_compilation') in fits:
+                print_model_comparison(f"Alternatives - Direta ({env})",
+                                       fits[(env, 'direct_compilation')], fits[(env, 'alternatives')])
+            if (env, 'dlopen') in fits and (env, 'direct_compilation') in fits:
+                print_model_comparison(f"dlopen - Direta ({env})",
+                                       fits[(env, 'direct_compilation')], fits[(env, 'dlopen')])
+
+        print(f"\n  {Colors.BOLD}Extrapolação para N={target_size} (sem medição){Colors.END}")
+        for env in containers:
+            for method in methods:
+                if ('native', method) not in fits or (env, method) not in fits:
+                    continue
+                extra = extrapolate_overhead(fits[('native', method)], fits[(env, method)], target_size)
+                if extra is None:
+                    continue
+                results[variant]['extrapolation'][(env, method)] = extra
+                classification, color, symbol = get_overhead_classification(extra['overhead_pct'])
+                print(f"  {env + '/' + method:<38} Nativo {extra['time_ref']:>10.3f}s  Container {extra['time_other']:>10.3f}s  "
+                      f"Overhead {extra['overhead_pct']:>+7.3f}% [{extra['ci'][0]:>+7.3f}, {extra['ci'][1]:>+7.3f}] "
+                      f"{color}{symbol} {classification}{Colors.END}")
+
+    return results
+
 def print_header(text):
     """Imprime cabeçalho formatado"""
     print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*100}{Colors.END}")
@@ -143,21 +952,105 @@ def print_section(text):
     print(f"\n{Colors.CYAN}{Colors.BOLD}{text}{Colors.END}")
     print(f"{Colors.CYAN}{'-'*100}{Colors.END}")
 
-def analyze_variant(base_path, threading_mode, variant, matrix_size, run_number=None):
-    """Analisa uma variante específica em um tamanho de matriz"""
+def analyze_variant(base_path, threading_mode, variant, matrix_size, run_number=None, column='Mean',
+                    environments=None, dtype='d'):
+    """
+    Analisa uma variante específica em um tamanho de matriz
+    
+    Args:
+        environments: Ambientes a considerar. Se None, todos os presentes
+                      em <base_path>/<threading_mode>/ (ver list_environments)
+        dtype: Tipo do GEMM ('s', 'd', 'c', 'z') ou rotina BLAS 1/2 ('dgemv', ...)
+    
+    Returns:
+        {'<ambiente>_<método>': valor da coluna} (padrão: tempo médio;
+        column='Size' retorna o tamanho do problema em GFLOP gravado,
+        column='GBytes' o tráfego de memória das rotinas BLAS 1/2 e
+        column='WorkingSet' os operandos rotacionados pelo harness)
+    """
     results = {}
     
-    for env in ['native', 'docker']:
-        for method in ['alternatives', 'direct_compilation']:
-            df = load_data(base_path, threading_mode, env, method, variant, run_number)
+    for env in environments or list_environments(base_path, threading_mode):
+        for method in METHODS:
+            df = load_data(base_path, threading_mode, env, method, variant, run_number, dtype)
             if df is not None and not df.empty:
                 row = df[df['matSize'] == matrix_size]
-                if not row.empty:
-                    results[f"{env}_{method}"] = row['Mean'].values[0]
+                if not row.empty and column in row:
+                    results[f"{env}_{method}"] = row[column].values[0]
     
     return results
 
-def hpc_analysis(base_path='output', threading_mode='single', run_number=None):
+def normalize_host_performance(df):
+    """
+    Adiciona GFLOPS, GFLOPS por núcleo e GFLOPS por núcleo·GHz
+    
+    Núcleos usados = min(bench_threads, cpu_cores); a frequência é a máxima
+    informada pelo host (cpu_max_mhz).
+    """
+    df = df.copy()
+    df['gflops'] = [calculate_gflops(n, t, g) for n, t, g in zip(df['matSize'], df['Mean'], df['Size'])]
+    # árvores sem host.env (anteriores ao fingerprint) não têm estas colunas
+    def column(name, default):
+        values = df[name] if name in df else pd.Series(default, index=df.index)
+        return pd.to_numeric(values, errors='coerce')
+
+    threads = column('bench_threads', 1).fillna(1)
+    cores = column('cpu_cores', np.nan).fillna(threads)
+    ghz = column('cpu_max_mhz', np.nan) / 1000.0
+    df['cores_used'] = np.minimum(threads, cores).clip(lower=1)
+    df['gflops_per_core'] = df['gflops'] / df['cores_used']
+    df['gflops_per_ghz'] = df['gflops_per_core'] / ghz
+    return df
+
+def cross_host_comparison(roots, threading_mode='single', variants=None, matrix_sizes=None):
+    """
+    Comparação entre hosts com GFLOPS normalizado por núcleo e por GHz
+    
+    Args:
+        roots: Diretórios com as árvores de resultados de cada host
+        matrix_sizes: Tamanhos comparados (padrão: 512, 768, 1024)
+    """
+    variants = variants or ['OpenBLAS64', 'BLIS64']
+    matrix_sizes = matrix_sizes or [512, 768, 1024]
+
+    print_header("COMPARAÇÃO ENTRE HOSTS: GFLOPS NORMALIZADO")
+
+    df = load_multi_host(roots, threading_mode, variants)
+    if df is None:
+        print(f"{Colors.RED}Nenhum resultado encontrado em: {', '.join(map(str, roots))}{Colors.END}")
+        return None
+    df = normalize_host_performance(df[df['matSize'].isin(matrix_sizes)])
+
+    print_section("1. HOSTS ENCONTRADOS")
+    hosts = df.drop_duplicates('host_id')
+    print(f"{'Host':<24} {'CPU':<40} {'Núcleos':>8} {'MHz':>8} {'L2':>8} {'L3':>9} {'Kernel':<20}")
+    print("-" * 125)
+    for _, h in hosts.fillna('?').iterrows():
+        print(f"{h['host_id']:<24} {str(h.get('cpu_model', '?'))[:40]:<40} {str(h.get('cpu_cores', '?')):>8} "
+              f"{str(h.get('cpu_max_mhz', '?')):>8} {str(h.get('cache_l2', '?')):>8} "
+              f"{str(h.get('cache_l3', '?')):>9} {str(h.get('kernel', '?')):<20}")
+
+    print_section("2. DESEMPENHO POR HOST (média dos tamanhos comparados)")
+    summary = df.groupby(['variant', 'environment', 'method', 'host_id']).agg(
+        gflops=('gflops', 'mean'),
+        gflops_per_core=('gflops_per_core', 'mean'),
+        gflops_per_ghz=('gflops_per_ghz', 'mean'),
+        sizes=('matSize', 'nunique'),
+    ).reset_index()
+
+    for (variant, env, method), group in summary.groupby(['variant', 'environment', 'method']):
+        best = group['gflops_per_ghz'].max()
+        print(f"\n{Colors.CYAN}■ {variant} - {env}/{method}{Colors.END}")
+        print(f"{'Host':<24} {'N':>4} {'GFLOPS':>10} {'GFLOPS/núcleo':>14} {'GFLOPS/GHz':>11} {'vs melhor':>10}")
+        print("-" * 80)
+        for _, row in group.sort_values('gflops_per_ghz', ascending=False).iterrows():
+            rel = (row['gflops_per_ghz'] / best - 1) * 100 if best > 0 else np.nan
+            print(f"{row['host_id']:<24} {row['sizes']:>4} {row['gflops']:>10.2f} {row['gflops_per_core']:>14.2f} "
+                  f"{row['gflops_per_ghz']:>11.3f} {rel:>+9.2f}%")
+
+    return summary
+
+def hpc_analysis(base_path='output', threading_mode='single', run_number=None, remeasure_file=None):
     """
     Análise rigorosa para HPC
     
@@ -165,9 +1058,10 @@ def hpc_analysis(base_path='output', threading_mode='single', run_number=None):
         base_path: Caminho base (padrão: 'output')
         threading_mode: 'single' ou 'multi' (padrão: 'single')
         run_number: Número da execução (ex: '001'). Se None, usa a mais recente.
+        remeasure_file: CSV onde gravar os pontos instáveis (entrada de run_remeasure.sh)
     """
     
-    print_header("ANÁLISE RIGOROSA PARA HPC: OVERHEAD DOCKER vs NATIVO")
+    print_header("ANÁLISE RIGOROSA PARA HPC: OVERHEAD DOS CONTAINERS vs NATIVO")
     
     print(f"{Colors.BOLD}Critérios de Aceitação para Computação de Alto Desempenho:{Colors.END}")
     print(f"  {Colors.GREEN}✓{Colors.END} Desprezível:   overhead < {HPCThresholds.OVERHEAD_NEGLIGIBLE:>4.1f}%  (impacto insignificante)")
@@ -183,86 +1077,104 @@ def hpc_analysis(base_path='output', threading_mode='single', run_number=None):
     matrix_sizes_all = [128, 256, 384, 512, 640, 768, 896, 1024]
     matrix_sizes_key = [512, 768, 1024]  # Tamanhos mais relevantes para HPC
     
+    # Pontos com medição instável (marcados nas tabelas e listados na seção 6)
+    unstable = detect_unstable_measurements(base_path, threading_mode, variants, run_number=run_number)
+    unstable_keys = {(u['variant'], u['environment'], u['method'], u['matSize']) for u in unstable}
+    
+    # Ambientes presentes na árvore: cada container é comparado com o nativo
+    environments = list_environments(base_path, threading_mode)
+    containers = [env for env in environments if env != 'native']
+    
     # ========================================================================
     # ANÁLISE 1: OVERHEAD DETALHADO POR TAMANHO DE MATRIZ
     # ========================================================================
-    print_section("1. OVERHEAD DO DOCKER: Análise Detalhada por Tamanho de Matriz")
+    print_section("1. OVERHEAD DOS CONTAINERS: Análise Detalhada por Tamanho de Matriz")
     
-    for method in ['alternatives', 'direct_compilation']:
-        method_name = "ALTERNATIVES" if method == 'alternatives' else "COMPILAÇÃO DIRETA"
+    for method in METHODS:
+        if not any(get_latest_run(base_path, threading_mode, env, method) for env in environments):
+            continue
+        method_name = METHOD_NAMES[method].upper()
         print(f"\n{Colors.YELLOW}{'='*100}{Colors.END}")
         print(f"{Colors.BOLD}{Colors.YELLOW}MÉTODO: {method_name}{Colors.END}")
         print(f"{Colors.YELLOW}{'='*100}{Colors.END}\n")
         
-        for variant in variants:
-            print(f"{Colors.CYAN}■ Biblioteca: {variant}{Colors.END}")
-            print(f"{'Matriz':<8} {'Nativo(s)':>13} {'Docker(s)':>13} {'Δ Abs(s)':>13} "
-                  f"{'Overhead%':>11} {'GFLOPS-N':>12} {'GFLOPS-D':>12} {'Δ Perf%':>11} {'Classificação':>30}")
-            print("-" * 135)
-            
-            for size in matrix_sizes_all:
-                results = analyze_variant(base_path, threading_mode, variant, size, run_number)
-                
-                native_key = f"native_{method}"
-                docker_key = f"docker_{method}"
+        for env in containers:
+            for variant in variants:
+                print(f"{Colors.CYAN}■ Biblioteca: {variant} - {env} vs Nativo{Colors.END}")
+                print(f"{'Matriz':<8} {'Nativo(s)':>13} {'Container(s)':>13} {'Δ Abs(s)':>13} "
+                      f"{'Overhead%':>11} {'GFLOPS-N':>12} {'GFLOPS-C':>12} {'Δ Perf%':>11} {'Classificação':>30}")
+                print("-" * 135)
                 
-                if native_key in results and docker_key in results:
-                    native_time = results[native_key]
-                    docker_time = results[docker_key]
-                    overhead_pct, overhead_abs = calculate_overhead(native_time, docker_time)
-                    
-                    native_gflops = calculate_gflops(size, native_time)
-                    docker_gflops = calculate_gflops(size, docker_time)
-                    perf_loss = calculate_efficiency_loss(native_gflops, docker_gflops)
+                for size in matrix_sizes_all:
+                    results = analyze_variant(base_path, threading_mode, variant, size, run_number,
+                                              environments=['native', env])
+                    gflop_sizes = analyze_variant(base_path, threading_mode, variant, size, run_number,
+                                                  column='Size', environments=['native', env])
                     
-                    classification, color, symbol = get_overhead_classification(overhead_pct)
+                    native_key = f"native_{method}"
+                    env_key = f"{env}_{method}"
                     
-                    print(f"{size:<8} {native_time:>13.6f} {docker_time:>13.6f} {overhead_abs:>+13.6f} "
-                          f"{overhead_pct:>+10.3f}% {native_gflops:>12.2f} {docker_gflops:>12.2f} "
-                          f"{perf_loss:>+10.2f}% {color}{symbol} {classification:>20}{Colors.END}")
-            print()
+                    if native_key in results and env_key in results:
+                        native_time = results[native_key]
+                        env_time = results[env_key]
+                        overhead_pct, overhead_abs = calculate_overhead(native_time, env_time)
+                        
+                        native_gflops = calculate_gflops(size, native_time, gflop_sizes.get(native_key))
+                        env_gflops = calculate_gflops(size, env_time, gflop_sizes.get(env_key))
+                        perf_loss = calculate_efficiency_loss(native_gflops, env_gflops)
+                        
+                        classification, color, symbol = get_overhead_classification(overhead_pct)
+                        noisy = any((variant, e, method, size) in unstable_keys for e in ['native', env])
+                        noise_mark = f" {Colors.YELLOW}(instável){Colors.END}" if noisy else ""
+                        
+                        print(f"{size:<8} {native_time:>13.6f} {env_time:>13.6f} {overhead_abs:>+13.6f} "
+                              f"{overhead_pct:>+10.3f}% {native_gflops:>12.2f} {env_gflops:>12.2f} "
+                              f"{perf_loss:>+10.2f}% {color}{symbol} {classification:>20}{Colors.END}{noise_mark}")
+                print()
     
     # ========================================================================
     # ANÁLISE 2: ESTATÍSTICAS RIGOROSAS
     # ========================================================================
     print_section("2. ESTATÍSTICAS RIGOROSAS DE OVERHEAD")
     
-    overhead_data = {
-        'alternatives': {'pct': [], 'abs': [], 'gflops_loss': []},
-        'direct_compilation': {'pct': [], 'abs': [], 'gflops_loss': []}
-    }
+    # (ambiente, método) -> overheads contra o nativo
+    overhead_data = {(env, method): {'pct': [], 'abs': [], 'gflops_loss': []}
+                     for env in containers for method in METHODS}
     
     # Coletar dados
     for variant in variants:
         for size in matrix_sizes_all:
-            results = analyze_variant(base_path, threading_mode, variant, size, run_number)
+            results = analyze_variant(base_path, threading_mode, variant, size, run_number,
+                                      environments=environments)
+            gflop_sizes = analyze_variant(base_path, threading_mode, variant, size, run_number,
+                                          column='Size', environments=environments)
             
-            for method in ['alternatives', 'direct_compilation']:
+            for (env, method), data in overhead_data.items():
                 native_key = f"native_{method}"
-                docker_key = f"docker_{method}"
+                env_key = f"{env}_{method}"
                 
-                if native_key in results and docker_key in results:
+                if native_key in results and env_key in results:
                     native_time = results[native_key]
-                    docker_time = results[docker_key]
-                    overhead_pct, overhead_abs = calculate_overhead(native_time, docker_time)
+                    env_time = results[env_key]
+                    overhead_pct, overhead_abs = calculate_overhead(native_time, env_time)
                     
-                    native_gflops = calculate_gflops(size, native_time)
-                    docker_gflops = calculate_gflops(size, docker_time)
-                    gflops_loss = calculate_efficiency_loss(native_gflops, docker_gflops)
+                    native_gflops = calculate_gflops(size, native_time, gflop_sizes.get(native_key))
+                    env_gflops = calculate_gflops(size, env_time, gflop_sizes.get(env_key))
+                    gflops_loss = calculate_efficiency_loss(native_gflops, env_gflops)
                     
-                    overhead_data[method]['pct'].append(overhead_pct)
-                    overhead_data[method]['abs'].append(overhead_abs)
-                    overhead_data[method]['gflops_loss'].append(gflops_loss)
+                    data['pct'].append(overhead_pct)
+                    data['abs'].append(overhead_abs)
+                    data['gflops_loss'].append(gflops_loss)
     
     # Estatísticas de Overhead Percentual
-    print(f"\n{Colors.BOLD}A) OVERHEAD PERCENTUAL (%) - Docker vs Nativo{Colors.END}")
-    print(f"{'Método':<25} {'N':>6} {'Média':>10} {'Mediana':>10} {'P90':>10} {'P95':>10} "
+    print(f"\n{Colors.BOLD}A) OVERHEAD PERCENTUAL (%) - Container vs Nativo{Colors.END}")
+    print(f"{'Ambiente':<20} {'Método':<25} {'N':>6} {'Média':>10} {'Mediana':>10} {'P90':>10} {'P95':>10} "
           f"{'P99':>10} {'Min':>10} {'Max':>10} {'σ':>10} {'Status':>25}")
-    print("-" * 145)
+    print("-" * 166)
     
-    for method, data in overhead_data.items():
+    for (env, method), data in overhead_data.items():
         if data['pct']:
-            method_name = "Alternatives" if method == 'alternatives' else "Compilação Direta"
+            method_name = METHOD_NAMES[method]
             pct_data = np.array(data['pct'])
             
             n = len(pct_data)
@@ -277,41 +1189,41 @@ def hpc_analysis(base_path='output', threading_mode='single', run_number=None):
             
             classification, color, symbol = get_overhead_classification(mean)
             
-            print(f"{method_name:<25} {n:>6} {mean:>+9.3f}% {median:>+9.3f}% {p90:>+9.3f}% {p95:>+9.3f}% "
+            print(f"{env:<20} {method_name:<25} {n:>6} {mean:>+9.3f}% {median:>+9.3f}% {p90:>+9.3f}% {p95:>+9.3f}% "
                   f"{p99:>+9.3f}% {min_val:>+9.3f}% {max_val:>+9.3f}% {std:>9.3f}% "
                   f"{color}{symbol} {classification}{Colors.END}")
     
     # Estatísticas de Overhead Absoluto
-    print(f"\n{Colors.BOLD}B) OVERHEAD ABSOLUTO (segundos) - Docker vs Nativo{Colors.END}")
-    print(f"{'Método':<25} {'N':>6} {'Média':>13} {'Mediana':>13} {'P95':>13} {'P99':>13} "
+    print(f"\n{Colors.BOLD}B) OVERHEAD ABSOLUTO (segundos) - Container vs Nativo{Colors.END}")
+    print(f"{'Ambiente':<20} {'Método':<25} {'N':>6} {'Média':>13} {'Mediana':>13} {'P95':>13} {'P99':>13} "
           f"{'Min':>13} {'Max':>13} {'σ':>13}")
-    print("-" * 125)
+    print("-" * 146)
     
-    for method, data in overhead_data.items():
+    for (env, method), data in overhead_data.items():
         if data['abs']:
-            method_name = "Alternatives" if method == 'alternatives' else "Compilação Direta"
+            method_name = METHOD_NAMES[method]
             abs_data = np.array(data['abs'])
             
             n = len(abs_data)
             
-            print(f"{method_name:<25} {n:>6} {np.mean(abs_data):>+12.6f}s {np.median(abs_data):>+12.6f}s "
+            print(f"{env:<20} {method_name:<25} {n:>6} {np.mean(abs_data):>+12.6f}s {np.median(abs_data):>+12.6f}s "
                   f"{np.percentile(abs_data, 95):>+12.6f}s {np.percentile(abs_data, 99):>+12.6f}s "
                   f"{np.min(abs_data):>+12.6f}s {np.max(abs_data):>+12.6f}s {np.std(abs_data, ddof=1):>12.6f}s")
     
     # Estatísticas de Perda de Desempenho
-    print(f"\n{Colors.BOLD}C) PERDA DE EFICIÊNCIA COMPUTACIONAL (%) - Docker vs Nativo{Colors.END}")
-    print(f"{'Método':<25} {'N':>6} {'Média':>10} {'Mediana':>10} {'P95':>10} {'P99':>10} "
+    print(f"\n{Colors.BOLD}C) PERDA DE EFICIÊNCIA COMPUTACIONAL (%) - Container vs Nativo{Colors.END}")
+    print(f"{'Ambiente':<20} {'Método':<25} {'N':>6} {'Média':>10} {'Mediana':>10} {'P95':>10} {'P99':>10} "
           f"{'Min':>10} {'Max':>10} {'σ':>10}")
-    print("-" * 110)
+    print("-" * 131)
     
-    for method, data in overhead_data.items():
+    for (env, method), data in overhead_data.items():
         if data['gflops_loss']:
-            method_name = "Alternatives" if method == 'alternatives' else "Compilação Direta"
+            method_name = METHOD_NAMES[method]
             gflops_data = np.array(data['gflops_loss'])
             
             n = len(gflops_data)
             
-            print(f"{method_name:<25} {n:>6} {np.mean(gflops_data):>+9.3f}% {np.median(gflops_data):>+9.3f}% "
+            print(f"{env:<20} {method_name:<25} {n:>6} {np.mean(gflops_data):>+9.3f}% {np.median(gflops_data):>+9.3f}% "
                   f"{np.percentile(gflops_data, 95):>+9.3f}% {np.percentile(gflops_data, 99):>+9.3f}% "
                   f"{np.min(gflops_data):>+9.3f}% {np.max(gflops_data):>+9.3f}% {np.std(gflops_data, ddof=1):>9.3f}%")
     
@@ -320,19 +1232,19 @@ def hpc_analysis(base_path='output', threading_mode='single', run_number=None):
     # ========================================================================
     print_section("3. COMPARAÇÃO: ALTERNATIVES vs COMPILAÇÃO DIRETA")
     
-    method_comparison = {'native': [], 'docker': []}
+    method_comparison = {env: [] for env in environments}
     
     print(f"\n{Colors.BOLD}Diferença de Desempenho entre Métodos (Direta - Alternatives){Colors.END}\n")
     
-    for env in ['native', 'docker']:
-        env_name = "NATIVO" if env == 'native' else "DOCKER"
+    for env in environments:
+        env_name = "NATIVO" if env == 'native' else env
         print(f"{Colors.YELLOW}Ambiente: {env_name}{Colors.END}")
         print(f"{'Biblioteca':<15} {'Matriz':<8} {'Alternatives':>13} {'Direta':>13} {'Δ Abs':>13} {'Δ %':>10} {'Status':>25}")
         print("-" * 105)
         
         for variant in variants:
             for size in matrix_sizes_key:
-                results = analyze_variant(base_path, threading_mode, variant, size, run_number)
+                results = analyze_variant(base_path, threading_mode, variant, size, run_number, environments=[env])
                 
                 alt_key = f"{env}_alternatives"
                 dir_key = f"{env}_direct_compilation"
@@ -359,12 +1271,12 @@ def hpc_analysis(base_path='output', threading_mode='single', run_number=None):
     
     # Estatísticas de comparação
     print(f"{Colors.BOLD}Estatísticas: Diferença Direta - Alternatives (%){Colors.END}")
-    print(f"{'Ambiente':<15} {'N':>6} {'Média':>10} {'Mediana':>10} {'σ':>10} {'Min':>10} {'Max':>10} {'Conclusão':>35}")
-    print("-" * 115)
+    print(f"{'Ambiente':<20} {'N':>6} {'Média':>10} {'Mediana':>10} {'σ':>10} {'Min':>10} {'Max':>10} {'Conclusão':>35}")
+    print("-" * 120)
     
     for env, diffs in method_comparison.items():
         if diffs:
-            env_name = "Nativo" if env == 'native' else "Docker"
+            env_name = "Nativo" if env == 'native' else env
             diffs_arr = np.array(diffs)
             
             mean = np.mean(diffs_arr)
@@ -380,96 +1292,675 @@ def hpc_analysis(base_path='output', threading_mode='single', run_number=None):
             else:
                 color, conclusion = Colors.RED, "⚠ Diferença significativa"
             
-            print(f"{env_name:<15} {len(diffs_arr):>6} {mean:>+9.3f}% {median:>+9.3f}% {std:>9.3f}% "
+            print(f"{env_name:<20} {len(diffs_arr):>6} {mean:>+9.3f}% {median:>+9.3f}% {std:>9.3f}% "
                   f"{min_val:>+9.3f}% {max_val:>+9.3f}% {color}{conclusion}{Colors.END}")
     
+    # dlopen: mesmas bibliotecas carregadas em um único processo, sem relink nem update-alternatives
+    dlopen_comparison = {}
+    for env in environments:
+        for variant in variants:
+            for size in matrix_sizes_key:
+                results = analyze_variant(base_path, threading_mode, variant, size, run_number, environments=[env])
+                dl_key = f"{env}_dlopen"
+                dir_key = f"{env}_direct_compilation"
+                if dl_key in results and dir_key in results:
+                    diff_pct = (results[dl_key] - results[dir_key]) / results[dir_key] * 100
+                    dlopen_comparison.setdefault(env, []).append(diff_pct)
+    
+    if dlopen_comparison:
+        print(f"\n{Colors.BOLD}Estatísticas: Diferença dlopen - Direta (%){Colors.END}")
+        print(f"{'Ambiente':<20} {'N':>6} {'Média':>10} {'Mediana':>10} {'Min':>10} {'Max':>10} {'Conclusão':>35}")
+        print("-" * 110)
+        for env, diffs in dlopen_comparison.items():
+            env_name = "Nativo" if env == 'native' else env
+            mean = np.mean(diffs)
+            if abs(mean) < HPCThresholds.METHOD_DIFF_NEGLIGIBLE:
+                color, conclusion = Colors.GREEN, "✓ Métodos equivalentes"
+            elif abs(mean) < HPCThresholds.METHOD_DIFF_ACCEPTABLE:
+                color, conclusion = Colors.YELLOW, "○ Pequena diferença aceitável"
+            else:
+                color, conclusion = Colors.RED, "⚠ Diferença significativa"
+            print(f"{env_name:<20} {len(diffs):>6} {mean:>+9.3f}% {np.median(diffs):>+9.3f}% "
+                  f"{np.min(diffs):>+9.3f}% {np.max(diffs):>+9.3f}% {color}{conclusion}{Colors.END}")
+    
     # ========================================================================
     # ANÁLISE 4: CASOS DE USO TÍPICOS EM HPC
     # ========================================================================
     print_section("4. ANÁLISE PARA CASOS DE USO TÍPICOS EM HPC")
     
     print(f"\n{Colors.BOLD}Matrizes Grandes (1024x1024) - Cenário HPC Típico{Colors.END}\n")
-    print(f"{'Biblioteca':<15} {'Método':<20} {'Nativo(s)':>13} {'Docker(s)':>13} "
-          f"{'Overhead':>11} {'GFLOPS-N':>12} {'GFLOPS-D':>12} {'Status':>25}")
-    print("-" * 140)
+    print(f"{'Biblioteca':<15} {'Ambiente':<20} {'Método':<20} {'Nativo(s)':>13} {'Container(s)':>13} "
+          f"{'Overhead':>11} {'GFLOPS-N':>12} {'GFLOPS-C':>12} {'Status':>25}")
+    print("-" * 161)
     
     size = 1024
     for variant in variants:
-        results = analyze_variant(base_path, threading_mode, variant, size, run_number)
+        results = analyze_variant(base_path, threading_mode, variant, size, run_number, environments=environments)
+        gflop_sizes = analyze_variant(base_path, threading_mode, variant, size, run_number,
+                                      column='Size', environments=environments)
         
-        for method in ['alternatives', 'direct_compilation']:
-            method_name = "Alternatives" if method == 'alternatives' else "Compilação Direta"
-            
-            native_key = f"native_{method}"
-            docker_key = f"docker_{method}"
-            
-            if native_key in results and docker_key in results:
-                native_time = results[native_key]
-                docker_time = results[docker_key]
-                overhead_pct, _ = calculate_overhead(native_time, docker_time)
+        for env in containers:
+            for method in METHODS:
+                method_name = METHOD_NAMES[method]
                 
-                native_gflops = calculate_gflops(size, native_time)
-                docker_gflops = calculate_gflops(size, docker_time)
+                native_key = f"native_{method}"
+                env_key = f"{env}_{method}"
                 
-                classification, color, symbol = get_overhead_classification(overhead_pct)
+                if native_key in results and env_key in results:
+                    native_time = results[native_key]
+                    env_time = results[env_key]
+                    overhead_pct, _ = calculate_overhead(native_time, env_time)
+                    
+                    native_gflops = calculate_gflops(size, native_time, gflop_sizes.get(native_key))
+                    env_gflops = calculate_gflops(size, env_time, gflop_sizes.get(env_key))
+                    
+                    classification, color, symbol = get_overhead_classification(overhead_pct)
+                    
+                    print(f"{variant:<15} {env:<20} {method_name:<20} {native_time:>13.6f} {env_time:>13.6f} "
+                          f"{overhead_pct:>+10.3f}% {native_gflops:>12.2f} {env_gflops:>12.2f} "
+                          f"{color}{symbol} {classification}{Colors.END}")
+    
+    # ========================================================================
+    # ANÁLISE 5: MATRIZ DE AMBIENTES (RUNTIMES) vs NATIVO
+    # ========================================================================
+    print_section("5. MATRIZ DE AMBIENTES: OVERHEAD DE CADA RUNTIME vs NATIVO")
+    
+    runtime_overhead = {}
+    
+    print(f"{'Ambiente':<20} {'Método':<20} {'N':>5} {'Média':>10} {'Mediana':>10} {'Máx':>10}  "
+          f"{'Classificação':<18} Flags")
+    print("-" * 135)
+    
+    for env in containers:
+        for method in METHODS:
+            overheads = []
+            for variant in variants:
+                for size in matrix_sizes_all:
+                    results = analyze_variant(base_path, threading_mode, variant, size, run_number,
+                                              environments=['native', env])
+                    native_key = f"native_{method}"
+                    env_key = f"{env}_{method}"
+                    if native_key in results and env_key in results:
+                        overheads.append(calculate_overhead(results[native_key], results[env_key])[0])
+            
+            if not overheads:
+                continue
+            runtime_overhead.setdefault(env, {})[method] = float(np.mean(overheads))
+            info = read_runtime_info(base_path, threading_mode, env, method, run_number) or {}
+            flags = (info.get('flags') or '(sem flags)') if info else '(runtime.env ausente)'
+            classification, color, symbol = get_overhead_classification(np.mean(overheads))
+            
+            print(f"{env:<20} {method:<20} {len(overheads):>5} {np.mean(overheads):>+9.3f}% "
+                  f"{np.median(overheads):>+9.3f}% {np.max(overheads):>+9.3f}%  "
+                  f"{color}{symbol} {classification:<16}{Colors.END} {flags}")
+    
+    if not runtime_overhead:
+        print(f"  {Colors.YELLOW}Nenhum ambiente de container com dados{Colors.END}")
+    
+    # ========================================================================
+    # ANÁLISE 6: ESTABILIDADE DAS MEDIÇÕES
+    # ========================================================================
+    print_section("6. ESTABILIDADE DAS MEDIÇÕES (RUÍDO E OUTLIERS)")
+    
+    if kurtosis_criterion_active():
+        kurtosis_criterion = f"curtose > {HPCThresholds.NOISE_KURTOSIS_MAX:.1f}"
+    else:
+        kurtosis_criterion = (f"curtose não avaliada (com {HARNESS_NREP} repetições o máximo "
+                              f"é {max_sample_kurtosis(HARNESS_NREP):.2f})")
+    print(f"Critérios: CV > {HPCThresholds.NOISE_CV_MAX:.1f}%, amplitude (máx-mín)/mediana > "
+          f"{HPCThresholds.NOISE_SPREAD_MAX:.1f}%, |assimetria| > {HPCThresholds.NOISE_SKEW_MAX:.1f}, "
+          f"{kurtosis_criterion}\n")
+    
+    if unstable:
+        print(f"{'Biblioteca':<15} {'Ambiente':<10} {'Método':<20} {'Matriz':<8} {'CV%':>8} "
+              f"{'Amplit.%':>9} {'Skew':>7} {'Kurt':>7}  Motivos")
+        print("-" * 120)
+        for u in unstable:
+            print(f"{u['variant']:<15} {u['environment']:<10} {u['method']:<20} {u['matSize']:<8} "
+                  f"{u['cv_pct']:>8.2f} {u['spread_pct']:>9.2f} {u['skew']:>+7.2f} {u['kurtosis']:>7.2f}  "
+                  f"{Colors.YELLOW}{u['reasons']}{Colors.END}")
+        
+        print(f"\n  {Colors.YELLOW}⚠ {len(unstable)} ponto(s) instável(is){Colors.END} - "
+              f"classificações marcadas como (instável) podem mudar em uma nova medição")
+    else:
+        print(f"  {Colors.GREEN}✓ Todas as medições estáveis{Colors.END}")
+    
+    # Lista sempre regravada (vazia quando tudo está estável) para não remedir pontos antigos
+    if remeasure_file and Path(remeasure_file).parent.is_dir():
+        write_remeasure_list(unstable, remeasure_file)
+        if unstable:
+            print(f"  → Remedir apenas estes pontos: ./run_remeasure.sh {remeasure_file}")
+    
+    # ========================================================================
+    # ANÁLISE 7: MODELO DE DESEMPENHO T(N)
+    # ========================================================================
+    print_section("7. MODELO DE DESEMPENHO: T(N) = a·N³ + b·N² + c")
+    
+    print("  a: termo de computação | b: tráfego de memória | c: custo fixo por chamada")
+    time_models = time_model_analysis(base_path, threading_mode, variants, run_number)
+    
+    # ========================================================================
+    # ANÁLISE 8: BACKENDS DE THREADING (serial, pthread, openmp)
+    # ========================================================================
+    print_section("8. BACKENDS DE THREADING: BACKEND CARREGADO, OVERSUBSCRIÇÃO E ESCALABILIDADE")
+    
+    threading_backends = {'backends': [], 'scaling': []}
+    print(f"{'Ambiente/Método':<32} {'Biblioteca':<15} {'Lib':<12} {'Backend':<9} {'Threads':>8} "
+          f"{'CPUs':>5}  Status")
+    print("-" * 120)
+    
+    for env in list_environments(base_path, threading_mode):
+        for method in METHODS:
+            backends = read_backends(base_path, threading_mode, env, method, run_number)
+            if backends is None:
+                continue
+            for _, b in backends.iterrows():
+                issues = classify_threading(b)
+                threading_backends['backends'].append({**b.to_dict(), 'environment': env,
+                                                       'method': method, 'issues': issues})
+                status = (f"{Colors.YELLOW}⚠ {'; '.join(issues)}{Colors.END}" if issues
+                          else f"{Colors.GREEN}✓ ok{Colors.END}")
+                print(f"{env + '/' + method:<32} {b['variant']:<15} {b['library']:<12} {b['backend']:<9} "
+                      f"{b['blas_threads']:>8} {b['cpus']:>5}  {status}")
+    
+    if not threading_backends['backends']:
+        print(f"  {Colors.YELLOW}Nenhum backends.csv encontrado (execuções anteriores à detecção de backend){Colors.END}")
+    
+    if threading_mode == 'multi':
+        print(f"\n{Colors.BOLD}Escalabilidade por backend (referência: mesma biblioteca single-thread){Colors.END}")
+        print(f"{'Ambiente/Método':<32} {'Biblioteca':<15} {'Backend':<9} {'Threads':>8} {'Matriz':>7} "
+              f"{'GFLOPS':>9} {'Speedup':>8} {'Eficiência':>11}")
+        print("-" * 110)
+        for env in list_environments(base_path, threading_mode):
+            for method in METHODS:
+                for r in backend_scaling(base_path, env, method, matrix_sizes_key, run_number):
+                    threading_backends['scaling'].append({**r, 'environment': env, 'method': method})
+                    print(f"{env + '/' + method:<32} {r['variant']:<15} {r['backend']:<9} {r['threads']:>8} "
+                          f"{r['matSize']:>7} {r['gflops']:>9.2f} {r['speedup']:>7.2f}x {r['efficiency_pct']:>10.1f}%")
+        
+        # Melhor backend de cada biblioteca (eficiência média no maior tamanho)
+        scaling = pd.DataFrame(threading_backends['scaling'])
+        if not scaling.empty:
+            largest = scaling[scaling['matSize'] == scaling['matSize'].max()]
+            summary = largest.groupby(['environment', 'library', 'backend'])['efficiency_pct'].mean()
+            print(f"\n  {Colors.BOLD}Eficiência média em N={largest['matSize'].iloc[0]}{Colors.END}")
+            for (env, library, backend), eff in summary.items():
+                print(f"  {env:<20} {library:<12} {backend:<9} {eff:>7.1f}%")
+    
+    # ========================================================================
+    # ANÁLISE 9: THROUGHPUT SOB CONTENÇÃO (K JOBS SIMULTÂNEOS)
+    # ========================================================================
+    print_section("9. THROUGHPUT SOB CONTENÇÃO: K JOBS DGEMM SIMULTÂNEOS POR NÓ")
+    
+    contention = {}
+    if (Path(base_path) / 'contention').is_dir():
+        for placement in CONTENTION_PLACEMENTS:
+            for env in list_environments(base_path, 'contention'):
+                samples = load_contention(base_path, env, placement)
+                if samples is None:
+                    continue
+                summary = contention_summary(samples)
+                contention[(env, placement)] = summary
                 
-                print(f"{variant:<15} {method_name:<20} {native_time:>13.6f} {docker_time:>13.6f} "
-                      f"{overhead_pct:>+10.3f}% {native_gflops:>12.2f} {docker_gflops:>12.2f} "
-                      f"{color}{symbol} {classification}{Colors.END}")
+                print(f"\n{Colors.CYAN}■ {env} ({placement}){Colors.END}")
+                print(f"{'Matriz':<8} {'K':>4} {'Amostras':>9} {'p50(ms)':>10} {'p99(ms)':>10} "
+                      f"{'p99/p50':>8} {'GFLOPS/job':>11} {'GFLOPS nó':>10} {'Escala':>8}")
+                print("-" * 90)
+                for r in summary.itertuples():
+                    print(f"{r.matSize:<8} {r.K:>4} {r.samples:>9} {r.p50_ms:>10.3f} {r.p99_ms:>10.3f} "
+                          f"{r.p99_ms / r.p50_ms:>8.2f} {r.job_gflops:>11.2f} {r.node_gflops:>10.2f} "
+                          f"{r.scaling_pct:>7.1f}%")
+            
+            # Containers vs nativo no mesmo (tamanho, K)
+            native = contention.get(('native', placement))
+            if native is None:
+                continue
+            for (env, env_placement), summary in contention.items():
+                if env == 'native' or env_placement != placement:
+                    continue
+                merged = native.merge(summary, on=['matSize', 'K'], suffixes=('_n', '_c'))
+                if merged.empty:
+                    continue
+                print(f"\n  {Colors.BOLD}{env} vs Nativo ({placement}){Colors.END}")
+                print(f"  {'Matriz':<8} {'K':>4} {'Perda thr.':>12} {'Δ p50':>9} {'Δ p99':>9}  Classificação")
+                for r in merged.itertuples():
+                    throughput_loss = calculate_efficiency_loss(r.node_gflops_n, r.node_gflops_c)
+                    classification, color, symbol = get_overhead_classification(throughput_loss)
+                    print(f"  {r.matSize:<8} {r.K:>4} {throughput_loss:>+11.2f}% "
+                          f"{calculate_overhead(r.p50_ms_n, r.p50_ms_c)[0]:>+8.2f}% "
+                          f"{calculate_overhead(r.p99_ms_n, r.p99_ms_c)[0]:>+8.2f}%  "
+                          f"{color}{symbol} {classification}{Colors.END}")
+    
+    if not contention:
+        print(f"  {Colors.YELLOW}Sem dados de contenção (execute ./run_contention.sh){Colors.END}")
+    
+    # ========================================================================
+    # ANÁLISE 10: TIPO DE DADO (SGEMM, DGEMM, CGEMM, ZGEMM)
+    # ========================================================================
+    print_section("10. TIPO DE DADO: SGEMM, DGEMM, CGEMM, ZGEMM")
+    
+    dtype_results = []
+    for method in METHODS:
+        for variant in variants:
+            for dtype in DTYPES:
+                for size in matrix_sizes_key:
+                    results = analyze_variant(base_path, threading_mode, variant, size, run_number,
+                                              environments=environments, dtype=dtype)
+                    gflop_sizes = analyze_variant(base_path, threading_mode, variant, size, run_number,
+                                                  column='Size', environments=environments, dtype=dtype)
+                    native_key = f"native_{method}"
+                    if native_key not in results:
+                        continue
+                    native_gflops = calculate_gflops(size, results[native_key], gflop_sizes.get(native_key), dtype)
+                    # uma linha por container com o ponto medido (ou só o nativo, sem container)
+                    measured = [env for env in containers if f"{env}_{method}" in results] or [None]
+                    for env in measured:
+                        row = {'method': method, 'variant': variant, 'dtype': dtype, 'matSize': size,
+                               'environment': env or '-', 'gflops_native': native_gflops,
+                               'gflops_container': np.nan, 'overhead_pct': np.nan}
+                        if env is not None:
+                            env_key = f"{env}_{method}"
+                            row['gflops_container'] = calculate_gflops(size, results[env_key],
+                                                                       gflop_sizes.get(env_key), dtype)
+                            row['overhead_pct'] = calculate_overhead(results[native_key], results[env_key])[0]
+                        dtype_results.append(row)
+    
+    dtype_df = pd.DataFrame(dtype_results)
+    if dtype_df.empty or set(dtype_df['dtype']) == {'d'}:
+        print(f"  {Colors.YELLOW}Apenas DGEMM medido (execute com DTYPES=\"s d c z\"){Colors.END}")
+    else:
+        # GFLOPS relativos ao DGEMM da mesma variante/tamanho (nativo)
+        dgemm = (dtype_df[dtype_df['dtype'] == 'd'].drop_duplicates(['method', 'variant', 'matSize'])
+                 .set_index(['method', 'variant', 'matSize'])['gflops_native'])
+        dtype_df['vs_dgemm'] = [
+            r.gflops_native / dgemm.get((r.method, r.variant, r.matSize), np.nan) for r in dtype_df.itertuples()
+        ]
+        
+        print(f"{'Método':<20} {'Biblioteca':<15} {'Ambiente':<20} {'Tipo':<7} {'Matriz':<8} {'GFLOPS-N':>10} "
+              f"{'GFLOPS-C':>10} {'Overhead':>10} {'vs DGEMM':>9}")
+        print("-" * 121)
+        for r in dtype_df.itertuples():
+            print(f"{METHOD_NAMES[r.method]:<20} {r.variant:<15} {r.environment:<20} {DTYPE_NAMES[r.dtype]:<7} "
+                  f"{r.matSize:<8} {r.gflops_native:>10.2f} {r.gflops_container:>10.2f} {r.overhead_pct:>+9.3f}% "
+                  f"{r.vs_dgemm:>8.2f}x")
+        
+        # A vantagem de uma biblioteca ou o overhead dos containers dependem do tipo?
+        print(f"\n{Colors.BOLD}Por tipo: overhead médio dos containers e biblioteca mais rápida (nativo){Colors.END}")
+        print(f"{'Tipo':<7} {'Matriz':<8} {'Overhead médio':>15} {'Mais rápida':<15} {'Vantagem':>9}")
+        print("-" * 60)
+        for (dtype, size), group in dtype_df.groupby(['dtype', 'matSize'], sort=False):
+            # GFLOPS nativo se repete em cada linha de container: uma por método/variante
+            ranked = (group.drop_duplicates(['method', 'variant'])
+                      .groupby('variant')['gflops_native'].mean().sort_values(ascending=False))
+            lead = (ranked.iloc[0] / ranked.iloc[1] - 1) * 100 if len(ranked) > 1 else np.nan
+            print(f"{DTYPE_NAMES[dtype]:<7} {size:<8} {group['overhead_pct'].mean():>+14.3f}% "
+                  f"{ranked.index[0]:<15} {lead:>+8.1f}%")
+    
+    # ========================================================================
+    # ANÁLISE 11: EFICIÊNCIA ENERGÉTICA (RAPL)
+    # ========================================================================
+    print_section("11. EFICIÊNCIA ENERGÉTICA: JOULES POR DGEMM E GFLOPS/W (RAPL)")
+    
+    energy_results = []
+    for method in METHODS:
+        for variant in variants:
+            for env in environments:
+                energy = calculate_energy(load_data(base_path, threading_mode, env, method, variant, run_number))
+                if energy is None:
+                    continue
+                for r in energy[energy['matSize'].isin(matrix_sizes_all)].itertuples():
+                    energy_results.append({'method': method, 'variant': variant, 'environment': env,
+                                           'matSize': r.matSize, 'time': r.Mean, 'joules': r.Joules,
+                                           'gflops': calculate_gflops(r.matSize, r.Mean, r.Size),
+                                           'gflops_w': r.GFLOPS_W})
+    
+    energy_df = pd.DataFrame(energy_results)
+    if energy_df.empty:
+        print(f"  {Colors.YELLOW}Sem leituras RAPL (powercap indisponível ou sem permissão; ver rapl em host.env){Colors.END}")
+    else:
+        print(f"{'Método':<20} {'Biblioteca':<15} {'Ambiente':<10} {'Matriz':<8} {'J/DGEMM':>12} "
+              f"{'GFLOPS':>10} {'GFLOPS/W':>10}")
+        print("-" * 100)
+        for r in energy_df.itertuples():
+            # o contador RAPL é atualizado a cada ~1 ms: chamadas mais curtas são imprecisas
+            note = f" {Colors.YELLOW}(< 1 ms){Colors.END}" if r.time < 1e-3 else ""
+            print(f"{METHOD_NAMES[r.method]:<20} {r.variant:<15} {r.environment:<10} {r.matSize:<8} "
+                  f"{r.joules:>12.4f} {r.gflops:>10.2f} {r.gflops_w:>10.3f}{note}")
+        
+        # A biblioteca mais rápida também é a mais eficiente?
+        print(f"\n{Colors.BOLD}Escolha da biblioteca: por tempo vs por energia{Colors.END}")
+        print(f"{'Método':<20} {'Ambiente':<10} {'Matriz':<8} {'Mais rápida':<15} {'Mais eficiente':<15}")
+        print("-" * 80)
+        for (method, env, size), group in energy_df.groupby(['method', 'environment', 'matSize'], sort=False):
+            if len(group) < 2:
+                continue
+            fastest = group.loc[group['time'].idxmin(), 'variant']
+            greenest = group.loc[group['gflops_w'].idxmax(), 'variant']
+            flip = f" {Colors.YELLOW}⚠ inverte{Colors.END}" if fastest != greenest else ""
+            print(f"{METHOD_NAMES[method]:<20} {env:<10} {size:<8} {fastest:<15} {greenest:<15}{flip}")
+    
+    # ========================================================================
+    # ANÁLISE 12: LATÊNCIA FIM A FIM POR JOB (PARTIDA, CARGA, 1º DGEMM)
+    # ========================================================================
+    print_section("12. LATÊNCIA FIM A FIM POR JOB: PARTIDA, CARGA DA BLAS E 1º DGEMM")
+    
+    latency = {}
+    if (Path(base_path) / 'latency').is_dir():
+        for env in list_environments(base_path, 'latency'):
+            jobs = load_latency(base_path, env)
+            if jobs is None:
+                continue
+            breakdown = latency_breakdown(jobs)
+            if breakdown.empty:
+                continue
+            latency[env] = breakdown
+    
+    if not latency:
+        print(f"  {Colors.YELLOW}Sem dados de latência (execute ./run_latency.sh){Colors.END}")
+    else:
+        print(f"Medianas por job (ms); soma das fases = launch → returned")
+        for name, _, _, description in LATENCY_PHASES:
+            print(f"  {name:<12} {description}")
+        
+        print(f"\n{'Ambiente':<18} {'Biblioteca':<12} {'Jobs':>5} "
+              + " ".join(f"{name:>11}" for name, _, _, _ in LATENCY_PHASES) + f" {'Total':>10}")
+        print("-" * 120)
+        for env, breakdown in latency.items():
+            for r in breakdown.itertuples():
+                print(f"{env:<18} {r.variant:<12} {r.jobs:>5} "
+                      + " ".join(f"{getattr(r, f'{name}_ms'):>11.2f}" for name, _, _, _ in LATENCY_PHASES)
+                      + f" {r.total_ms:>10.2f}")
+        
+        # Custo fixo do container: diferença por fase em relação ao nativo
+        native = latency.get('native')
+        if native is not None:
+            for env, breakdown in latency.items():
+                if env == 'native':
+                    continue
+                merged = native.merge(breakdown, on='variant', suffixes=('_n', '_c'))
+                if merged.empty:
+                    continue
+                print(f"\n  {Colors.BOLD}{env} vs Nativo (Δ ms por job){Colors.END}")
+                for r in merged.itertuples():
+                    deltas = {name: getattr(r, f'{name}_ms_c') - getattr(r, f'{name}_ms_n')
+                              for name, _, _, _ in LATENCY_PHASES}
+                    dominant = max(deltas, key=deltas.get)
+                    total = r.total_ms_c - r.total_ms_n
+                    print(f"  {r.variant:<12} total {total:>+10.2f} ms ({calculate_overhead(r.total_ms_n, r.total_ms_c)[0]:>+8.1f}%)"
+                          f" | maior custo: {dominant} ({deltas[dominant]:+.2f} ms)")
+    
+    # ========================================================================
+    # ANÁLISE 13: CALIBRAÇÃO DO TEMPORIZADOR E ERRO POR PONTO
+    # ========================================================================
+    print_section("13. CALIBRAÇÃO DO TEMPORIZADOR E ERRO DE MEDIÇÃO POR PONTO")
+    
+    timer_errors = []
+    calibrations = {}
+    for env in list_environments(base_path, threading_mode):
+        for method in METHODS:
+            calib = read_timer_calibration(base_path, threading_mode, env, method, run_number)
+            if calib is None or calib.empty:
+                continue
+            calibrations[(env, method)] = calib
+            for variant in variants:
+                df = load_data(base_path, threading_mode, env, method, variant, run_number)
+                if df is None or df.empty:
+                    continue
+                error = timing_error(df, calib, f"output_{variant}.dat")
+                timer_errors.extend({'environment': env, 'method': method, 'variant': variant, **r}
+                                    for r in error.to_dict('records'))
+    
+    if not calibrations:
+        print(f"  {Colors.YELLOW}Sem calibração do temporizador (timer.csv; execuções anteriores a esta medição){Colors.END}")
+    else:
+        print(f"{'Ambiente':<18} {'Método':<20} {'Relógio':<15} {'Resolução':>11} {'Custo':>10} "
+              f"{'Granul.':>10} {'Lote abaixo de':>15}")
+        print("-" * 105)
+        for (env, method), calib in calibrations.items():
+            c = calib.median(numeric_only=True)
+            print(f"{env:<18} {METHOD_NAMES[method]:<20} {calib['clock'].iloc[-1]:<15} "
+                  f"{c['resolution'] * 1e9:>9.1f}ns {c['overhead'] * 1e9:>8.1f}ns "
+                  f"{c['granularity'] * 1e9:>8.1f}ns {c['batch_min'] * 1e6:>13.2f}µs")
+        
+        errors_df = pd.DataFrame(timer_errors)
+        if not errors_df.empty:
+            print(f"\n{Colors.BOLD}Erro do temporizador por chamada (limite superior){Colors.END}")
+            print(f"{'Ambiente':<18} {'Método':<20} {'Biblioteca':<12} {'Menor N':>8} {'Lote':>6} "
+                  f"{'Erro':>10} {'Erro %':>9} {'Pontos > {0:.0f}%'.format(HPCThresholds.TIMER_ERROR_MAX):>12}")
+            print("-" * 105)
+            for (env, method, variant), group in errors_df.groupby(['environment', 'method', 'variant'], sort=False):
+                first = group.loc[group['matSize'].idxmin()]
+                above = (group['error_pct'] > HPCThresholds.TIMER_ERROR_MAX).sum()
+                color = Colors.YELLOW if above else Colors.GREEN
+                print(f"{env:<18} {METHOD_NAMES[method]:<20} {variant:<12} {int(first['matSize']):>8} "
+                      f"{int(first['Batch']):>6} {first['error_s'] * 1e9:>8.1f}ns {first['error_pct']:>8.4f}% "
+                      f"{color}{above:>12}{Colors.END}")
+    
+    # ========================================================================
+    # ANÁLISE 14: CAMINHO DE CHAMADA (GSL vs CBLAS vs FORTRAN)
+    # ========================================================================
+    print_section("14. CAMINHO DE CHAMADA: gsl_blas_dgemm vs cblas_dgemm vs dgemm_")
+    
+    call_path_results = []
+    resolutions = {}
+    for env in environments:
+        for method in METHODS:
+            resolved = read_call_paths(base_path, threading_mode, env, method, run_number)
+            if resolved is not None and not resolved.empty:
+                resolutions[(env, method)] = resolved
+            for variant in variants:
+                frames = {path: load_data(base_path, threading_mode, env, method, variant, run_number,
+                                          call_path=path) for path in CALL_PATHS}
+                if frames['gsl'] is None or all(frames[path] is None for path in CALL_PATHS[1:]):
+                    continue
+                for size in matrix_sizes_key:
+                    row = {'environment': env, 'method': method, 'variant': variant, 'matSize': size}
+                    for path, df in frames.items():
+                        point = df[df['matSize'] == size] if df is not None else None
+                        if point is None or point.empty:
+                            row[f'time_{path}'] = row[f'gflops_{path}'] = np.nan
+                            continue
+                        row[f'time_{path}'] = point['Mean'].iloc[0]
+                        row[f'gflops_{path}'] = calculate_gflops(size, row[f'time_{path}'], point['Size'].iloc[0])
+                    direct_times = [t for t in (row['time_cblas'], row['time_fortran']) if pd.notna(t)]
+                    if pd.isna(row['time_gsl']) or not direct_times:
+                        continue
+                    direct = min(direct_times)
+                    # custo da GSL em relação ao caminho direto mais rápido
+                    row['gsl_overhead_pct'] = calculate_overhead(direct, row['time_gsl'])[0]
+                    call_path_results.append(row)
+    
+    if not call_path_results:
+        print(f"  {Colors.YELLOW}Apenas o caminho GSL medido (execute com CALL_PATHS=\"gsl cblas fortran\"){Colors.END}")
+    else:
+        print(f"{'Ambiente':<20} {'Método':<20} {'Biblioteca':<12} {'Matriz':<8} {'GFLOPS GSL':>11} "
+              f"{'CBLAS':>9} {'Fortran':>9} {'GSL vs direto':>14} {'Classificação':>18}")
+        print("-" * 128)
+        for r in call_path_results:
+            classification, color, symbol = get_overhead_classification(r['gsl_overhead_pct'])
+            print(f"{r['environment']:<20} {METHOD_NAMES[r['method']]:<20} {r['variant']:<12} {r['matSize']:<8} "
+                  f"{r['gflops_gsl']:>11.2f} {r['gflops_cblas']:>9.2f} {r['gflops_fortran']:>9.2f} "
+                  f"{r['gsl_overhead_pct']:>+13.3f}% {color}{symbol} {classification:>15}{Colors.END}")
+    
+    # Qual símbolo cada caminho executou (a GSL chama o cblas_dgemm que vencer a resolução)
+    gslcblas_wins = []
+    if resolutions:
+        print(f"\n{Colors.BOLD}Símbolo resolvido por caminho (dlsym + dladdr){Colors.END}")
+        print(f"{'Ambiente':<20} {'Método':<20} {'Arquivo':<32} {'Caminho':<8} {'Símbolo':<16} {'Biblioteca':<28}")
+        print("-" * 128)
+        for (env, method), resolved in resolutions.items():
+            for r in resolved.itertuples():
+                library = Path(str(r.library)).name
+                note = ""
+                if r.path == 'gsl' and 'gslcblas' in library:
+                    gslcblas_wins.append((env, method, r.file))
+                    note = f" {Colors.YELLOW}⚠ CBLAS de referência da GSL{Colors.END}"
+                print(f"{env:<20} {METHOD_NAMES[method]:<20} {r.file:<32} {r.path:<8} {r.symbol:<16} "
+                      f"{library:<28}{note}")
+    
+    if call_path_results:
+        mean_gsl = np.mean([r['gsl_overhead_pct'] for r in call_path_results])
+        classification, color, symbol = get_overhead_classification(mean_gsl)
+        print(f"\n  Custo médio da GSL em relação à chamada direta: {mean_gsl:+.3f}% "
+              f"({color}{symbol} {classification}{Colors.END})")
+        if abs(mean_gsl) < HPCThresholds.OVERHEAD_NEGLIGIBLE and not gslcblas_wins:
+            print(f"  {Colors.GREEN}✓ Manter as chamadas pela GSL{Colors.END} (verificação de argumentos sem custo mensurável)")
+        else:
+            print(f"  {Colors.YELLOW}△ Chamar cblas_dgemm/dgemm_ diretamente no código de produção{Colors.END}")
+    if gslcblas_wins:
+        print(f"  {Colors.YELLOW}⚠ {len(gslcblas_wins)} binário(s) com gsl_blas_dgemm → libgslcblas: "
+              f"a BLAS da variante não exporta cblas_dgemm (ex: só cblas_dgemm64_) ou vem depois de "
+              f"-lgslcblas no link{Colors.END}")
+    
+    # ========================================================================
+    # ANÁLISE 15: ROTINAS LIMITADAS POR MEMÓRIA (DGEMV, DAXPY, DDOT)
+    # ========================================================================
+    print_section("15. ROTINAS LIMITADAS POR MEMÓRIA: DGEMV, DAXPY, DDOT (GB/s)")
+    
+    membound_results = []
+    llc = {}
+    for method in METHODS:
+        for variant in variants:
+            for routine in BLAS12_ROUTINES:
+                for size in matrix_sizes_key:
+                    results = analyze_variant(base_path, threading_mode, variant, size, run_number,
+                                              environments=environments, dtype=routine)
+                    native_key = f"native_{method}"
+                    if native_key not in results:
+                        continue
+                    gflop_sizes = analyze_variant(base_path, threading_mode, variant, size, run_number,
+                                                  column='Size', environments=environments, dtype=routine)
+                    gbytes = analyze_variant(base_path, threading_mode, variant, size, run_number,
+                                             column='GBytes', environments=environments, dtype=routine)
+                    working_sets = analyze_variant(base_path, threading_mode, variant, size, run_number,
+                                                   column='WorkingSet', environments=environments, dtype=routine)
+                    for env in containers:
+                        env_key = f"{env}_{method}"
+                        if env_key not in results:
+                            continue
+                        row = {'method': method, 'variant': variant, 'routine': routine,
+                               'environment': env, 'matSize': size, 'cache_resident': False}
+                        for side, side_env, key in [('native', 'native', native_key), ('container', env, env_key)]:
+                            row[f'gflops_{side}'] = calculate_gflops(size, results[key], gflop_sizes.get(key), routine)
+                            row[f'gbps_{side}'] = calculate_bandwidth(size, results[key], gbytes.get(key), routine)
+                            # operandos que cabem na LLC: GB/s mede a cache, não a DRAM
+                            if (side_env, method) not in llc:
+                                llc[(side_env, method)] = llc_bytes(base_path, threading_mode, side_env, method,
+                                                                    run_number)
+                            llc_size = llc[(side_env, method)]
+                            if llc_size is not None:
+                                working_set = working_set_gb(size, working_sets.get(key), routine)
+                                row['cache_resident'] |= working_set * 1e9 <= llc_size
+                        row['overhead_pct'] = calculate_overhead(results[native_key], results[env_key])[0]
+                        membound_results.append(row)
+    
+    membound_overhead_mean = None
+    if not membound_results:
+        print(f"  {Colors.YELLOW}Sem rotinas BLAS 1/2 medidas (execute com ROUTINES=\"dgemv daxpy ddot\"){Colors.END}")
+    else:
+        print(f"DGEMV com A (N x N); DAXPY e DDOT com vetores de N² elementos (mesmo volume de dados)")
+        print(f"GB/s: tráfego compulsório de memória por chamada / tempo médio\n")
+        print(f"{'Método':<20} {'Biblioteca':<12} {'Ambiente':<20} {'Rotina':<7} {'Matriz':<8} {'GB/s-N':>9} "
+              f"{'GB/s-C':>9} {'GFLOPS-N':>9} {'GFLOPS-C':>9} {'Overhead%':>10} {'Classificação':>20}")
+        print("-" * 139)
+        cache_mark = f" {Colors.YELLOW}(na cache){Colors.END}"
+        for r in membound_results:
+            classification, color, symbol = get_overhead_classification(r['overhead_pct'])
+            print(f"{METHOD_NAMES[r['method']]:<20} {r['variant']:<12} {r['environment']:<20} "
+                  f"{BLAS12_ROUTINES[r['routine']]:<7} {r['matSize']:<8} {r['gbps_native']:>9.2f} "
+                  f"{r['gbps_container']:>9.2f} {r['gflops_native']:>9.2f} {r['gflops_container']:>9.2f} "
+                  f"{r['overhead_pct']:>+9.3f}% {color}{symbol} {classification:>17}{Colors.END}"
+                  f"{cache_mark if r['cache_resident'] else ''}")
+        resident = sum(r['cache_resident'] for r in membound_results)
+        if resident:
+            print(f"\n  {Colors.YELLOW}⚠ {resident} ponto(s) com working set na LLC (cache_l3 do host.env): "
+                  f"GB/s mede a banda da cache, não da DRAM{Colors.END}")
+        
+        # O overhead dos containers aparece mais nas rotinas limitadas por memória que no DGEMM?
+        membound_df = pd.DataFrame(membound_results)
+        membound_overhead_mean = membound_df['overhead_pct'].mean()
+        print(f"\n{Colors.BOLD}Por rotina: overhead médio de cada container (mesmos limites do DGEMM){Colors.END}")
+        print(f"{'Ambiente':<20} {'Rotina':<7} {'Pontos':>7} {'Overhead médio':>15} {'GB/s-N médio':>13} {'Classificação':>20}")
+        print("-" * 91)
+        for (env, routine), group in membound_df.groupby(['environment', 'routine'], sort=False):
+            mean = group['overhead_pct'].mean()
+            classification, color, symbol = get_overhead_classification(mean)
+            print(f"{env:<20} {BLAS12_ROUTINES[routine]:<7} {len(group):>7} {mean:>+14.3f}% "
+                  f"{group['gbps_native'].mean():>13.2f} {color}{symbol} {classification:>17}{Colors.END}")
+        dgemm_pct = [pct for data in overhead_data.values() for pct in data['pct']]
+        dgemm_mean = np.mean(dgemm_pct) if dgemm_pct else np.nan
+        print(f"{'(todos)':<20} {'DGEMM':<7} {'':>7} {dgemm_mean:>+14.3f}% (seção 2, limitado por computação)")
     
     # ========================================================================
     # CONCLUSÕES E RECOMENDAÇÕES PARA HPC
     # ========================================================================
-    print_section("5. CONCLUSÕES E RECOMENDAÇÕES PARA HPC")
+    print_section("16. CONCLUSÕES E RECOMENDAÇÕES PARA HPC")
     
-    # Calcular médias finais
-    alt_overhead_mean = np.mean(overhead_data['alternatives']['pct']) if overhead_data['alternatives']['pct'] else 0
-    dir_overhead_mean = np.mean(overhead_data['direct_compilation']['pct']) if overhead_data['direct_compilation']['pct'] else 0
+    # Calcular médias finais: overhead de cada container por método (alternatives e direta)
+    container_overhead = {}
+    for env in containers:
+        for method in ['alternatives', 'direct_compilation']:
+            pct = overhead_data[(env, method)]['pct']
+            if pct:
+                container_overhead.setdefault(env, {})[method] = float(np.mean(pct))
     
-    native_method_diff = np.mean(method_comparison['native']) if method_comparison['native'] else 0
-    docker_method_diff = np.mean(method_comparison['docker']) if method_comparison['docker'] else 0
+    method_diffs = {env: float(np.mean(diffs)) for env, diffs in method_comparison.items() if diffs}
     
-    print(f"\n{Colors.BOLD}A) OVERHEAD DO DOCKER:{Colors.END}\n")
+    print(f"\n{Colors.BOLD}A) OVERHEAD DOS CONTAINERS:{Colors.END}")
     
-    print(f"  Método Alternatives:")
-    print(f"    • Overhead médio: {alt_overhead_mean:+.3f}%")
-    classification, color, symbol = get_overhead_classification(alt_overhead_mean)
-    print(f"    • Classificação: {color}{symbol} {classification}{Colors.END}")
+    for env, means in container_overhead.items():
+        print(f"\n  {env}:")
+        for method, mean in means.items():
+            classification, color, symbol = get_overhead_classification(mean)
+            print(f"    • {METHOD_NAMES[method]:<20} overhead médio {mean:>+8.3f}%  "
+                  f"{color}{symbol} {classification}{Colors.END}")
+    if not container_overhead:
+        print(f"\n  {Colors.YELLOW}Nenhum container com dados comparáveis ao nativo{Colors.END}")
     
-    print(f"\n  Método Compilação Direta:")
-    print(f"    • Overhead médio: {dir_overhead_mean:+.3f}%")
-    classification, color, symbol = get_overhead_classification(dir_overhead_mean)
-    print(f"    • Classificação: {color}{symbol} {classification}{Colors.END}")
+    if membound_overhead_mean is not None:
+        print(f"\n  Rotinas limitadas por memória (DGEMV, DAXPY, DDOT):")
+        print(f"    • Overhead médio: {membound_overhead_mean:+.3f}%")
+        classification, color, symbol = get_overhead_classification(membound_overhead_mean)
+        print(f"    • Classificação: {color}{symbol} {classification}{Colors.END}")
     
-    # Recomendação sobre Docker
-    print(f"\n  {Colors.BOLD}Recomendação sobre uso de Docker:{Colors.END}")
-    max_overhead = max(abs(alt_overhead_mean), abs(dir_overhead_mean))
+    # Recomendação pelo pior container (DGEMM e, se medidas, rotinas limitadas por memória)
+    worst_env, max_overhead = None, 0.0
+    for env, means in container_overhead.items():
+        for mean in means.values():
+            if abs(mean) > max_overhead:
+                worst_env, max_overhead = env, abs(mean)
+    if membound_overhead_mean is not None and abs(membound_overhead_mean) > max_overhead:
+        max_overhead = abs(membound_overhead_mean)
+    worst_label = f" (pior caso: {worst_env})" if worst_env else ""
+    
+    print(f"\n  {Colors.BOLD}Recomendação sobre uso de containers{worst_label}:{Colors.END}")
     
     if max_overhead < HPCThresholds.OVERHEAD_NEGLIGIBLE:
         print(f"    {Colors.GREEN}✓ RECOMENDADO{Colors.END} - Overhead desprezível (< {HPCThresholds.OVERHEAD_NEGLIGIBLE}%)")
-        print(f"      Docker pode ser usado sem impacto perceptível no desempenho")
+        print(f"      Containers podem ser usados sem impacto perceptível no desempenho")
         print(f"      Ideal para desenvolvimento, testes e até produção")
     elif max_overhead < HPCThresholds.OVERHEAD_ACCEPTABLE:
         print(f"    {Colors.GREEN}○ ACEITÁVEL{Colors.END} - Overhead pequeno (< {HPCThresholds.OVERHEAD_ACCEPTABLE}%)")
-        print(f"      Docker é aceitável para desenvolvimento e testes")
+        print(f"      Containers são aceitáveis para desenvolvimento e testes")
         print(f"      Para produção HPC, preferir ambiente nativo")
     elif max_overhead < HPCThresholds.OVERHEAD_SIGNIFICANT:
         print(f"    {Colors.YELLOW}△ USO CAUTELOSO{Colors.END} - Overhead mensurável (< {HPCThresholds.OVERHEAD_SIGNIFICANT}%)")
-        print(f"      Docker deve ser usado apenas para desenvolvimento")
+        print(f"      Containers devem ser usados apenas para desenvolvimento")
         print(f"      Produção HPC requer ambiente nativo")
     else:
         print(f"    {Colors.RED}✗ NÃO RECOMENDADO{Colors.END} - Overhead significativo (≥ {HPCThresholds.OVERHEAD_SIGNIFICANT}%)")
-        print(f"      Docker introduz overhead inaceitável para HPC")
+        print(f"      O container introduz overhead inaceitável para HPC")
         print(f"      Use apenas ambiente nativo")
     
     print(f"\n{Colors.BOLD}B) ALTERNATIVES vs COMPILAÇÃO DIRETA:{Colors.END}\n")
     
-    avg_method_diff = (abs(native_method_diff) + abs(docker_method_diff)) / 2
+    avg_method_diff = float(np.mean([abs(diff) for diff in method_diffs.values()])) if method_diffs else 0.0
     
     print(f"  Diferença média entre métodos:")
-    print(f"    • Nativo: {native_method_diff:+.3f}%")
-    print(f"    • Docker: {docker_method_diff:+.3f}%")
-    print(f"    • Média:  {avg_method_diff:.3f}%")
+    for env, diff in method_diffs.items():
+        env_name = "Nativo" if env == 'native' else env
+        print(f"    • {env_name + ':':<21} {diff:+.3f}%")
+    print(f"    • {'Média:':<21} {avg_method_diff:.3f}%")
     
     print(f"\n  {Colors.BOLD}Recomendação sobre método:{Colors.END}")
     
@@ -490,14 +1981,14 @@ def hpc_analysis(base_path='output', threading_mode='single', run_number=None):
     
     print(f"\n{Colors.BOLD}C) RESUMO EXECUTIVO PARA HPC:{Colors.END}\n")
     
-    print(f"  {Colors.BOLD}1. Docker vs Nativo:{Colors.END}")
+    print(f"  {Colors.BOLD}1. Containers vs Nativo:{Colors.END}")
     if max_overhead < HPCThresholds.OVERHEAD_ACCEPTABLE:
-        print(f"     • Overhead médio: {max_overhead:.3f}% {Colors.GREEN}✓{Colors.END}")
-        print(f"     • Docker é viável para HPC com overhead desprezível")
+        print(f"     • Overhead médio{worst_label}: {max_overhead:.3f}% {Colors.GREEN}✓{Colors.END}")
+        print(f"     • Containers são viáveis para HPC com overhead desprezível")
         print(f"     • Benefícios: reprodutibilidade, isolamento, portabilidade")
     else:
-        print(f"     • Overhead médio: {max_overhead:.3f}% {Colors.YELLOW}⚠{Colors.END}")
-        print(f"     • Docker tem overhead mensurável para HPC")
+        print(f"     • Overhead médio{worst_label}: {max_overhead:.3f}% {Colors.YELLOW}⚠{Colors.END}")
+        print(f"     • Ao menos um container tem overhead mensurável para HPC")
         print(f"     • Recomendação: ambiente nativo para produção")
     
     print(f"\n  {Colors.BOLD}2. Alternatives vs Compilação Direta:{Colors.END}")
@@ -513,15 +2004,15 @@ def hpc_analysis(base_path='output', threading_mode='single', run_number=None):
     print(f"\n  {Colors.BOLD}3. Recomendação Final:{Colors.END}")
     
     if max_overhead < HPCThresholds.OVERHEAD_ACCEPTABLE and avg_method_diff < HPCThresholds.METHOD_DIFF_ACCEPTABLE:
-        print(f"     {Colors.GREEN}✓ AMBIENTE: DOCKER ou NATIVO{Colors.END} (overhead desprezível)")
+        print(f"     {Colors.GREEN}✓ AMBIENTE: CONTAINER ou NATIVO{Colors.END} (overhead desprezível)")
         print(f"     {Colors.GREEN}✓ MÉTODO: ALTERNATIVES{Colors.END} (prático e preciso)")
         print(f"     {Colors.BOLD}→ Ideal para desenvolvimento e produção HPC{Colors.END}")
     elif max_overhead < HPCThresholds.OVERHEAD_ACCEPTABLE:
-        print(f"     {Colors.GREEN}✓ AMBIENTE: DOCKER ou NATIVO{Colors.END} (overhead desprezível)")
+        print(f"     {Colors.GREEN}✓ AMBIENTE: CONTAINER ou NATIVO{Colors.END} (overhead desprezível)")
         print(f"     {Colors.YELLOW}○ MÉTODO: COMPILAÇÃO DIRETA{Colors.END} (maior precisão)")
-        print(f"     {Colors.BOLD}→ Docker viável, mas prefira compilação direta{Colors.END}")
+        print(f"     {Colors.BOLD}→ Containers viáveis, mas prefira compilação direta{Colors.END}")
     else:
-        print(f"     {Colors.YELLOW}△ AMBIENTE: NATIVO{Colors.END} (overhead significativo no Docker)")
+        print(f"     {Colors.YELLOW}△ AMBIENTE: NATIVO{Colors.END} (overhead significativo em {worst_env or 'container'})")
         print(f"     {Colors.YELLOW}○ MÉTODO: COMPILAÇÃO DIRETA{Colors.END} (controle total)")
         print(f"     {Colors.BOLD}→ Para HPC de produção, use nativo com compilação direta{Colors.END}")
     
@@ -529,23 +2020,46 @@ def hpc_analysis(base_path='output', threading_mode='single', run_number=None):
     
     # Retornar métricas para uso programático
     return {
-        'docker_overhead': {
-            'alternatives': alt_overhead_mean,
-            'direct': dir_overhead_mean,
+        'container_overhead': {
+            'by_environment': container_overhead,
+            'worst': worst_env,
             'max': max_overhead
         },
         'method_difference': {
-            'native': native_method_diff,
-            'docker': docker_method_diff,
+            **method_diffs,
             'avg': avg_method_diff
-        }
+        },
+        'runtime_overhead': runtime_overhead,
+        'unstable_points': unstable,
+        'time_models': time_models,
+        'threading_backends': threading_backends,
+        'contention': contention,
+        'dtypes': dtype_results,
+        'energy': energy_results,
+        'latency': latency,
+        'timer_errors': timer_errors,
+        'call_paths': call_path_results,
+        'memory_bound': membound_results
     }
 
 if __name__ == "__main__":
-    metrics = hpc_analysis()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Análise rigorosa de benchmarks DGEMM para HPC")
+    parser.add_argument('--hosts', nargs='+', metavar='DIR',
+                        help="Comparar hosts: diretórios com as árvores de resultados de cada host")
+    parser.add_argument('--mode', default='single', choices=['single', 'multi'],
+                        help="Modo de threading para --hosts (padrão: single)")
+    args = parser.parse_args()
+    
+    if args.hosts:
+        cross_host_comparison(args.hosts, args.mode)
+        sys.exit(0)
+    
+    metrics = hpc_analysis(remeasure_file='output/remeasure_single.csv')
     
     # Exit code baseado em critérios HPC
-    max_overhead = metrics['docker_overhead']['max']
+    max_overhead = metrics['container_overhead']['max']
     
     if max_overhead < HPCThresholds.OVERHEAD_ACCEPTABLE:
         sys.exit(0)  # Sucesso - overhead aceitável
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Benchmark da Ferramenta de Análise
+==================================
+
+Mede o custo dos pontos de entrada da análise (analysis_benchmark_hpc.py) em
+árvores sintéticas de escala crescente (generate_synthetic_results.py):
+tempo de carga, tempo de análise e pico de memória, comparados com a
+referência gravada em benchmark_analysis_baseline.json.
+
+Pontos de entrada:
+- load_data:        todos os .dat de todas as execuções
+- notebook_load:    carga + concat da execução 001 (notebooks/notebook_implementation.py)
+- analyze_variant:  variante x tamanho na execução mais recente
+- detect_unstable:  detect_unstable_measurements (seção 6)
+- hpc_analysis:     relatório completo (saída descartada)
+
+Tempo: melhor de --repeat execuções, após uma execução de aquecimento;
+memória: pico do tracemalloc em uma execução separada. O cache de load_data
+é limpo antes de cada medição.
+
+Uso:
+    python3 benchmark_analysis.py                      # escalas small e medium
+    python3 benchmark_analysis.py --scales large       # 50 x 10 x 64 x 8
+    python3 benchmark_analysis.py --update-baseline    # grava a nova referência
+
+Código de saída: 0 sem regressão, 1 se algum ponto excede a referência além
+da tolerância (TIME_TOLERANCE, MEMORY_TOLERANCE).
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+import analysis_benchmark_hpc as analysis
+from generate_synthetic_results import generate, variant_names, environment_names, METHODS
+
+# Escalas: execuções x bibliotecas x tamanhos x ambientes (3 métodos cada)
+SCALES = {
+    'small': {'runs': 2, 'variants': 2, 'sizes': 8, 'environments': 2},
+    'medium': {'runs': 10, 'variants': 5, 'sizes': 16, 'environments': 4},
+    'large': {'runs': 50, 'variants': 10, 'sizes': 64, 'environments': 8},
+}
+BASELINE_FILE = Path(__file__).parent / 'benchmark_analysis_baseline.json'
+
+# Regressão: mais lento que a referência x (1 + tolerância)
+TIME_TOLERANCE = 0.5     # tempo varia entre máquinas e cargas: 50%
+MEMORY_TOLERANCE = 0.25  # pico de memória é determinístico: 25%
+
+def synthetic_tree(workdir, scale):
+    """Árvore sintética da escala (reaproveitada se já gerada com os mesmos parâmetros)"""
+    params = SCALES[scale]
+    base = Path(workdir) / scale
+    marker = base / 'scale.json'
+    if not marker.exists() or json.loads(marker.read_text()) != params:
+        generate(base / 'output', **params)
+        marker.write_text(json.dumps(params))
+    return str(base / 'output')
+
+def entry_points(base_path, scale):
+    """Funções medidas: nome -> callable sem argumentos"""
+    params = SCALES[scale]
+    variants = variant_names(params['variants'])
+    environments = environment_names(params['environments'])
+    runs = [f"{run:03d}" for run in range(1, params['runs'] + 1)]
+    sizes = [128 + i * 128 for i in range(params['sizes'])]
+
+    def load_all():
+        for env in environments:
+            for method in METHODS:
+                for run in runs:
+                    for variant in variants:
+                        analysis.load_data(base_path, 'single', env, method, variant, run)
+
+    def notebook_load():
+        frames = []
+        for variant in variants:
+            for env in environments:
+                for method in METHODS:
+                    df = analysis.load_data(base_path, 'single', env, method, variant, '001')
+                    if df is not None:
+                        df['variant'] = variant
+                        df['environment'] = env
+                        df['method'] = method
+                        frames.append(df)
+        return pd.concat(frames, ignore_index=True)
+
+    def analyze_all():
+        for variant in variants:
+            for size in sizes:
+                analysis.analyze_variant(base_path, 'single', variant, size)
+
+    def detect_unstable():
+        analysis.detect_unstable_measurements(base_path, 'single', variants)
+
+    def full_report():
+        with contextlib.redirect_stdout(io.StringIO()):
+            analysis.hpc_analysis(base_path, 'single')
+
+    return {
+        'load_data': load_all,
+        'notebook_load': notebook_load,
+        'analyze_variant': analyze_all,
+        'detect_unstable': detect_unstable,
+        'hpc_analysis': full_report,
+    }
+
+def measure(func, repeat):
+    """Melhor tempo (s) de 'repeat' execuções e pico de memória (MB) de uma execução"""
+    func()  # aquecimento: imports tardios (scipy) fora da medição
+    best = float('inf')
+    for _ in range(repeat):
+        analysis.clear_data_cache()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    analysis.clear_data_cache()
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak / 2**20
+
+def compare(results, baseline):
+    """Linhas (escala, ponto, métrica, atual, referência, razão) que excedem a tolerância"""
+    regressions = []
+    for scale, points in results.items():
+        for name, current in points.items():
+            reference = baseline.get(scale, {}).get(name)
+            if reference is None:
+                continue
+            for metric, tolerance in [('time_s', TIME_TOLERANCE), ('peak_mb', MEMORY_TOLERANCE)]:
+                ratio = current[metric] / reference[metric] if reference[metric] > 0 else 1.0
+                if ratio > 1.0 + tolerance:
+                    regressions.append((scale, name, metric, current[metric], reference[metric], ratio))
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark dos pontos de entrada da análise")
+    parser.add_argument('--scales', nargs='+', default=['small', 'medium'], choices=list(SCALES))
+    parser.add_argument('--repeat', type=int, default=3, help="Execuções por medição de tempo (padrão: 3)")
+    parser.add_argument('--workdir', default='/tmp/meugemm_benchmark',
+                        help="Onde gerar as árvores sintéticas (reaproveitadas entre execuções)")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help=f"Grava os resultados como referência em {BASELINE_FILE.name}")
+    args = parser.parse_args()
+
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    results = {}
+    for scale in args.scales:
+        params = SCALES[scale]
+        print(f"\n■ {scale}: {params['runs']} execuções x {params['variants']} bibliotecas x "
+              f"{params['sizes']} tamanhos x {params['environments']} ambientes x {len(METHODS)} métodos")
+        base_path = synthetic_tree(args.workdir, scale)
+        print(f"{'Ponto de entrada':<18} {'Tempo (s)':>10} {'Ref. (s)':>10} {'Pico (MB)':>10} {'Ref. (MB)':>10}")
+        print("-" * 62)
+        results[scale] = {}
+        for name, func in entry_points(base_path, scale).items():
+            elapsed, peak = measure(func, args.repeat)
+            results[scale][name] = {'time_s': round(elapsed, 4), 'peak_mb': round(peak, 2)}
+            reference = baseline.get(scale, {}).get(name, {})
+            print(f"{name:<18} {elapsed:>10.3f} {reference.get('time_s', float('nan')):>10.3f} "
+                  f"{peak:>10.2f} {reference.get('peak_mb', float('nan')):>10.2f}")
+
+    if args.update_baseline:
+        for scale, points in results.items():
+            baseline[scale] = points
+        baseline['_host'] = {'python': platform.python_version(), 'pandas': pd.__version__,
+                             'machine': platform.machine()}
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"\nReferência gravada em {BASELINE_FILE}")
+        sys.exit(0)
+
+    regressions = compare(results, baseline)
+    if regressions:
+        print("\nRegressões (acima da tolerância):")
+        for scale, name, metric, current, reference, ratio in regressions:
+            print(f"  {scale}/{name} {metric}: {current:.3f} vs {reference:.3f} ({ratio:.2f}x)")
+        sys.exit(1)
+    print("\nSem regressões em relação à referência")
+    sys.exit(0)
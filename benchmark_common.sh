@@ -0,0 +1,508 @@
+#!/bin/bash
+
+# Funções compartilhadas pelos scripts de teste (run_all_*.sh)
+# Uso: source "$(dirname "$0")/benchmark_common.sh"
+#
+# Variáveis esperadas: INITIAL_SIZE, FINAL_SIZE, STEP
+# Variáveis opcionais:
+#   NREP            - repetições por tamanho (padrão do harness: 5)
+#   REMEASURE_FILE  - CSV "variant,matSize" com os pontos a remedir
+#   BACKENDS        - backends de threading da varredura multithread (serial pthread openmp)
+#   DTYPES          - tipos do GEMM medidos em cada variante (s d c z; padrão: d)
+#   CALL_PATHS      - caminhos de chamada do DGEMM (gsl cblas fortran; padrão: gsl)
+#   ROUTINES        - rotinas BLAS 1/2 limitadas por memória medidas em cada variante
+#                     (dgemv daxpy ddot; padrão: nenhuma)
+#   RESUME          - 1 = retomar a última execução interrompida (padrão), 0 = sempre nova
+#   DGEMM_CLOCK     - raw = CLOCK_MONOTONIC_RAW no harness (padrão: omp_get_wtime)
+#   DGEMM_BATCH_MIN - duração mínima (s) de uma medição; chamadas mais curtas em lotes
+
+: "${DTYPES:=d}"
+: "${CALL_PATHS:=gsl}"
+: "${ROUTINES:=}"
+
+# Arquivo de saída de um tipo: DGEMM mantém output_<variante>.dat,
+# os demais recebem o sufixo do kernel (output_<variante>_zgemm.dat)
+# e as rotinas BLAS 1/2, o nome da rotina (output_<variante>_dgemv.dat)
+dtype_output_file() {
+    local OUTPUT_FILE=$1
+    local DTYPE=$2
+    case $DTYPE in
+        d) echo "$OUTPUT_FILE" ;;
+        s|c|z) echo "${OUTPUT_FILE%.dat}_${DTYPE}gemm.dat" ;;
+        *) echo "${OUTPUT_FILE%.dat}_${DTYPE}.dat" ;;
+    esac
+}
+
+# Arquivo de saída de um caminho de chamada: gsl mantém output_<variante>.dat,
+# cblas e fortran recebem o sufixo do caminho (output_<variante>_fortran.dat)
+callpath_output_file() {
+    local OUTPUT_FILE=$1
+    local CALL_PATH=$2
+    if [ "$CALL_PATH" == "gsl" ]; then
+        echo "$OUTPUT_FILE"
+    else
+        echo "${OUTPUT_FILE%.dat}_${CALL_PATH}.dat"
+    fi
+}
+
+# =============================================
+# RETOMADA DE VARREDURAS INTERROMPIDAS
+# =============================================
+# O orquestrador cria <execução>/.in_progress ao abrir uma execução; o script de
+# teste troca o marcador por .complete quando a varredura termina sem falhas.
+# Uma execução interrompida (OOM, reboot, container morto) mantém .in_progress:
+# a próxima rodada reutiliza o mesmo NNN e cada .dat continua do próximo tamanho.
+# Os scripts de teste marcam SWEEP_FAILED=1 quando o harness falha durante a
+# varredura e registram cada .dat com expect_sweep_output só depois que o binário
+# linka (ou que o harness dlopen carrega a biblioteca). Variantes indisponíveis
+# no host (alternativa/biblioteca ausente, falha de compilação ou link) vão para
+# <execução>/skipped.log com skip_variant e não impedem o .complete.
+: "${RESUME:=1}"
+SWEEP_FAILED=0
+SWEEP_OUTPUTS=""
+
+# Registra um .dat que a varredura deve levar até FINAL_SIZE (conferido em finish_run)
+expect_sweep_output() {
+    SWEEP_OUTPUTS="$SWEEP_OUTPUTS $1"
+}
+
+# Registra variantes não medidas nesta execução em <execução>/skipped.log
+# (variante,motivo,data). Uso: skip_variant <motivo> <variante>...
+skip_variant() {
+    local REASON=$1
+    shift
+    local VARIANT
+    mkdir -p "$OUTPUT_DIR" 2>/dev/null
+    for VARIANT in "$@"; do
+        echo "$VARIANT,$REASON,$(date -Iseconds)" >> "$OUTPUT_DIR/skipped.log"
+    done
+}
+
+# Próximo número de execução em <base> (001 se vazio; maior existente + 1)
+get_next_run_number() {
+    local base_dir=$1
+    mkdir -p "$base_dir" 2>/dev/null
+
+    local max_num=0
+    for dir in "$base_dir"/[0-9][0-9][0-9]; do
+        if [ -d "$dir" ]; then
+            num=$(basename "$dir")
+            # Remove leading zeros for comparison
+            num=$((10#$num))
+            if [ "$num" -gt "$max_num" ]; then
+                max_num=$num
+            fi
+        fi
+    done
+
+    printf "%03d" $((max_num + 1))
+}
+
+# Execução interrompida mais recente de <base> no mesmo host (vazio se não houver)
+resumable_run_number() {
+    local BASE=$1
+    [ "$RESUME" == "1" ] || return 0
+    local LAST=$(ls -d "$BASE"/[0-9][0-9][0-9] 2>/dev/null | sort | tail -n 1)
+    [ -n "$LAST" ] && [ -f "$LAST/.in_progress" ] || return 0
+    local RUN_HOST=$(. "$LAST/host.env" 2>/dev/null; echo "$hostname")
+    [ "$RUN_HOST" == "$(hostname -s)" ] && basename "$LAST"
+}
+
+# Abre uma execução: grava host/ambiente e o marcador (na retomada, mantém os originais)
+# Uso: open_run <dir> <threads> <ambiente> <método>
+open_run() {
+    local DIR=$1
+    if [ -f "$DIR/.in_progress" ]; then
+        echo "$(date -Iseconds)" >> "$DIR/.in_progress"
+        return
+    fi
+    write_host_fingerprint "$DIR" $2
+    write_runtime_info "$DIR" $3 $4
+    echo "$(date -Iseconds)" > "$DIR/.in_progress"
+}
+
+# Fecha a execução do script de teste: .complete apenas se nenhuma varredura falhou
+# e todo .dat registrado chegou a FINAL_SIZE (remedições não alteram o estado da execução)
+# Variantes em skipped.log são apenas listadas
+finish_run() {
+    [ -z "$REMEASURE_FILE" ] || return 0
+    local DAT_FILE
+    if [ -s "$OUTPUT_DIR/skipped.log" ]; then
+        echo -e "${YELLOW}[AVISO]${NC} Variantes não medidas neste host (skipped.log):" \
+            $(awk -F',' '{ print $1 " (" $2 ")" }' "$OUTPUT_DIR/skipped.log" | sort -u | paste -sd ',' | sed 's/,/, /g')
+    fi
+    for DAT_FILE in $SWEEP_OUTPUTS; do
+        if [ "$(resume_first_size "$DAT_FILE")" -le "$FINAL_SIZE" ]; then
+            echo -e "${YELLOW}[AVISO]${NC} $(basename "$DAT_FILE") não chegou a $FINAL_SIZE"
+            SWEEP_FAILED=1
+        fi
+    done
+    if [ "$SWEEP_FAILED" -ne 0 ]; then
+        echo -e "${YELLOW}[AVISO]${NC} Varredura incompleta: $OUTPUT_DIR continua em andamento (.in_progress)"
+        return 1
+    fi
+    rm -f "$OUTPUT_DIR/.in_progress"
+    echo "$(date -Iseconds)" > "$OUTPUT_DIR/.complete"
+}
+
+# Primeiro tamanho ainda não medido em um .dat (INITIAL_SIZE se vazio;
+# maior que FINAL_SIZE se completo). Uma linha parcial no fim do arquivo
+# (processo morto durante a escrita) é descartada.
+resume_first_size() {
+    local DAT_FILE=$1
+    if [ ! -s "$DAT_FILE" ]; then
+        echo $INITIAL_SIZE
+        return
+    fi
+    [ -n "$(tail -c 1 "$DAT_FILE")" ] && sed -i '$ d' "$DAT_FILE"
+    local LAST=$(awk -F',' 'NR > 1 && $1 + 0 > m { m = $1 + 0 } END { print m + 0 }' "$DAT_FILE")
+    if [ "$LAST" -eq 0 ]; then
+        echo $INITIAL_SIZE
+    else
+        echo $((LAST + STEP))
+    fi
+}
+
+# Lista os tamanhos marcados para remedição de uma variante
+remeasure_sizes() {
+    local VARIANT_NAME=$1
+    awk -F',' -v v="$VARIANT_NAME" '$1 == v { gsub(/ /, "", $2); print $2 }' "$REMEASURE_FILE" | sort -n | uniq
+}
+
+# Combinações tipo:caminho medidas em cada variante (ex: d:gsl d:fortran z:gsl dgemv:gsl)
+# As rotinas BLAS 1/2 são medidas pela GSL, como os tipos do GEMM
+harness_jobs() {
+    local DTYPE CALL_PATH ROUTINE
+    for DTYPE in $DTYPES; do
+        for CALL_PATH in $CALL_PATHS; do
+            [ "$DTYPE" != "d" ] && [ "$CALL_PATH" != "gsl" ] && continue
+            echo "$DTYPE:$CALL_PATH"
+        done
+    done
+    for ROUTINE in $ROUTINES; do
+        echo "$ROUTINE:gsl"
+    done
+}
+
+# Executa o harness GEMM para uma variante, uma vez por tipo em DTYPES, para
+# DGEMM, por caminho em CALL_PATHS (os demais tipos só pela GSL) e por rotina
+# BLAS 1/2 em ROUTINES
+# Sem REMEASURE_FILE: varredura INITIAL_SIZE..FINAL_SIZE (STEP), retomada do
+# primeiro tamanho ausente no .dat (ver resume_first_size)
+# Com REMEASURE_FILE: apenas os tamanhos marcados, anexados ao mesmo .dat
+# (a chave de remedição é o nome do arquivo: <variante>, <variante>_<t>gemm,
+# <variante>_<caminho> ou <variante>_<rotina>)
+run_dgemm_harness() {
+    local EXEC_NAME=$1
+    local OUTPUT_FILE=$2
+    local VARIANT_NAME=$3
+    local JOB DTYPE CALL_PATH
+    # calibração do temporizador e símbolo BLAS resolvido de cada execução do harness
+    export DGEMM_TIMER_FILE="$OUTPUT_DIR/timer.csv"
+    export DGEMM_CALLPATH_FILE="$OUTPUT_DIR/callpath.csv"
+
+    for JOB in $(harness_jobs); do
+        DTYPE=${JOB%%:*}
+        CALL_PATH=${JOB#*:}
+        local DTYPE_FILE=$(callpath_output_file $(dtype_output_file $OUTPUT_FILE $DTYPE) $CALL_PATH)
+
+        if [ -z "$REMEASURE_FILE" ]; then
+            expect_sweep_output "$DTYPE_FILE"
+            local FIRST=$(resume_first_size $DTYPE_FILE)
+            [ "$FIRST" -gt "$FINAL_SIZE" ] && continue
+            [ "$FIRST" -ne "$INITIAL_SIZE" ] && \
+                echo "$(basename $DTYPE_FILE),$FIRST,$(date -Iseconds)" >> "$LOG_DIR/resume.log"
+            if ! $EXEC_NAME $DTYPE_FILE $FIRST $FINAL_SIZE $STEP ${NREP:-5} $DTYPE $CALL_PATH > /dev/null 2>&1; then
+                SWEEP_FAILED=1
+                return 1
+            fi
+            continue
+        fi
+
+        local KEY=$(basename "$DTYPE_FILE" .dat)
+        KEY=${KEY#output_}
+        local SIZES=$(remeasure_sizes "$KEY")
+        local SIZE
+        for SIZE in $SIZES; do
+            $EXEC_NAME $DTYPE_FILE $SIZE $SIZE $STEP ${NREP:-5} $DTYPE $CALL_PATH > /dev/null 2>&1 || return 1
+            echo "$KEY,$SIZE,$(date -Iseconds)" >> "$LOG_DIR/remeasure.log"
+        done
+    done
+    return 0
+}
+
+# Script de teste correspondente a (modo, método)
+#   direct_compilation - um binário por variante (run_all_tests*.sh)
+#   alternatives       - update-alternatives (run_all_alternatives*.sh, requer root)
+#   dlopen             - todas as variantes em um único processo (run_all_dlopen.sh, usa NUM_THREADS)
+method_script() {
+    local MODE=$1
+    local METHOD=$2
+    local SUFFIX=""
+    [ "$MODE" == "multi" ] && SUFFIX="_multithread"
+    case $METHOD in
+        alternatives) echo "./run_all_alternatives${SUFFIX}.sh" ;;
+        dlopen) echo "./run_all_dlopen.sh" ;;
+        *) echo "./run_all_tests${SUFFIX}.sh" ;;
+    esac
+}
+
+# Valor de um campo do lscpu (ex: "Model name")
+lscpu_field() {
+    LC_ALL=C lscpu 2>/dev/null | awk -F':' -v k="$1" '$1 == k { sub(/^[ \t]+/, "", $2); print $2; exit }'
+}
+
+# Tamanho de cache via sysfs (ex: index3 = L3)
+cpu_cache_size() {
+    cat "/sys/devices/system/cpu/cpu0/cache/$1/size" 2>/dev/null || echo "unknown"
+}
+
+# Frequência máxima em MHz (cpufreq > lscpu > /proc/cpuinfo)
+cpu_max_mhz() {
+    local KHZ=$(cat /sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq 2>/dev/null)
+    if [ -n "$KHZ" ]; then
+        echo $((KHZ / 1000))
+        return
+    fi
+    local MHZ=$(lscpu_field "CPU max MHz")
+    [ -z "$MHZ" ] && MHZ=$(awk -F':' '/^cpu MHz/ { gsub(/ /, "", $2); print $2; exit }' /proc/cpuinfo)
+    echo "${MHZ:-unknown}"
+}
+
+# Disponibilidade do RAPL para o harness: readable, no_permission ou unavailable
+rapl_status() {
+    local ZONE=$(ls -d /sys/class/powercap/intel-rapl:[0-9]* 2>/dev/null | head -n 1)
+    if [ -z "$ZONE" ]; then
+        echo "unavailable"
+    elif cat "$ZONE/energy_uj" > /dev/null 2>&1; then
+        echo "readable"
+    else
+        echo "no_permission"
+    fi
+}
+
+# Grava a identificação do host e do hardware em <dir>/host.env
+# Deve ser chamada no host (dentro do container o hostname é o ID do container)
+# Uso: write_host_fingerprint <dir> <threads usadas no benchmark>
+write_host_fingerprint() {
+    local DIR=$1
+    local BENCH_THREADS=${2:-1}
+    local CPU_MODEL=$(lscpu_field "Model name")
+    local SOCKETS=$(lscpu_field "Socket(s)")
+    local CORES_PER_SOCKET=$(lscpu_field "Core(s) per socket")
+    local CPU_CORES=$(( ${SOCKETS:-1} * ${CORES_PER_SOCKET:-$(nproc --all)} ))
+    local KERNEL=$(uname -r)
+    local HW_HASH=$(echo "$CPU_MODEL|$CPU_CORES|$(nproc --all)|$(cpu_cache_size index3)|$KERNEL" | sha1sum | cut -c1-8)
+
+    mkdir -p "$DIR"
+    {
+        echo "host_id=\"$(hostname -s)-$HW_HASH\""
+        echo "hostname=\"$(hostname -s)\""
+        echo "cpu_model=\"$CPU_MODEL\""
+        echo "cpu_sockets=\"${SOCKETS:-1}\""
+        echo "cpu_cores=\"$CPU_CORES\""
+        echo "cpu_threads=\"$(nproc --all)\""
+        echo "cpu_max_mhz=\"$(cpu_max_mhz)\""
+        echo "cache_l1d=\"$(cpu_cache_size index0)\""
+        echo "cache_l2=\"$(cpu_cache_size index2)\""
+        echo "cache_l3=\"$(cpu_cache_size index3)\""
+        echo "kernel=\"$KERNEL\""
+        echo "arch=\"$(uname -m)\""
+        echo "bench_threads=\"$BENCH_THREADS\""
+        echo "rapl=\"$(rapl_status)\""
+        echo "date=\"$(date -Iseconds)\""
+    } > "$DIR/host.env"
+}
+
+# =============================================
+# MATRIZ DE AMBIENTES (RUNTIMES)
+# =============================================
+# Cada ambiente vira um diretório próprio: output/<modo>/<ambiente>/<método>/NNN
+#   docker             - configuração original (alternatives com --privileged)
+#   docker_privileged  - --privileged em ambos os métodos
+#   docker_cpuset      - --cpuset-cpus (CPUSET, padrão: 0 ou 0-(NUM_THREADS-1))
+#   docker_seccomp     - --security-opt seccomp=unconfined
+#   docker_nonet       - --network none
+#   podman             - Podman rootless, root do container = usuário do host (PODMAN_IMAGE)
+#   apptainer          - Apptainer/Singularity (APPTAINER_IMAGE, .sif)
+RUNTIME_ALL="docker docker_privileged docker_cpuset docker_seccomp docker_nonet podman apptainer"
+: "${DOCKER_IMAGE:=meugemm:latest}"
+: "${PODMAN_IMAGE:=localhost/meugemm:latest}"
+: "${APPTAINER_IMAGE:=meugemm.sif}"
+
+# Engine usada por um ambiente
+runtime_engine() {
+    case $1 in
+        docker*) echo "docker" ;;
+        podman) echo "podman" ;;
+        apptainer) echo "apptainer" ;;
+        *) echo "unknown" ;;
+    esac
+}
+
+# Flags do ambiente para um método (gravadas em runtime.env)
+runtime_flags() {
+    local RUNTIME=$1
+    local METHOD=$2
+    local CPUS=${CPUSET:-0-$(( ${NUM_THREADS:-1} - 1 ))}
+    case $RUNTIME in
+        docker) [ "$METHOD" == "alternatives" ] && echo "--privileged" ;;
+        docker_privileged) echo "--privileged" ;;
+        docker_cpuset) echo "--cpuset-cpus=$CPUS" ;;
+        docker_seccomp) echo "--security-opt seccomp=unconfined" ;;
+        docker_nonet) echo "--network none" ;;
+        apptainer) echo "--containall --no-home" ;;
+    esac
+}
+
+# Verifica se a engine e a imagem do ambiente estão disponíveis
+runtime_available() {
+    local RUNTIME=$1
+    case $(runtime_engine $RUNTIME) in
+        docker) command -v docker &> /dev/null && docker image inspect $DOCKER_IMAGE &> /dev/null ;;
+        podman) command -v podman &> /dev/null && podman image exists $PODMAN_IMAGE ;;
+        apptainer) command -v apptainer &> /dev/null && [ -f "$APPTAINER_IMAGE" ] ;;
+        *) return 1 ;;
+    esac
+}
+
+# update-alternatives exige escrita no sistema de arquivos da imagem (Apptainer é somente leitura)
+runtime_supports_method() {
+    local RUNTIME=$1
+    local METHOD=$2
+    [ "$METHOD" == "alternatives" ] && [ "$RUNTIME" == "apptainer" ] && return 1
+    return 0
+}
+
+# Grava a configuração do ambiente em <dir>/runtime.env
+write_runtime_info() {
+    local DIR=$1
+    local RUNTIME=$2
+    local METHOD=$3
+    local ENGINE=$(runtime_engine $RUNTIME)
+    local VERSION="" IMAGE=""
+    case $ENGINE in
+        docker) VERSION=$(docker --version 2>/dev/null); IMAGE=$DOCKER_IMAGE ;;
+        podman) VERSION=$(podman --version 2>/dev/null); IMAGE=$PODMAN_IMAGE ;;
+        apptainer) VERSION=$(apptainer --version 2>/dev/null); IMAGE=$APPTAINER_IMAGE ;;
+    esac
+    [ "$RUNTIME" == "native" ] && ENGINE="native"
+
+    mkdir -p "$DIR"
+    {
+        echo "runtime=\"$RUNTIME\""
+        echo "engine=\"$ENGINE\""
+        echo "flags=\"$(runtime_flags $RUNTIME $METHOD)\""
+        echo "engine_version=\"$VERSION\""
+        echo "image=\"$IMAGE\""
+    } > "$DIR/runtime.env"
+}
+
+# Executa um script de teste dentro de um ambiente
+# Uso: runtime_run <ambiente> <método> <output_dir> <log_dir> <script> [VAR=valor ...]
+runtime_run() {
+    local RUNTIME=$1
+    local METHOD=$2
+    local RUN_OUTPUT_DIR=$3
+    local RUN_LOG_DIR=$4
+    local SCRIPT=$5
+    shift 5
+    local FLAGS=$(runtime_flags $RUNTIME $METHOD)
+    local CMD="mkdir -p \$OUTPUT_DIR \$LOG_DIR && $SCRIPT"
+    local ENV_ARGS=()
+    local KV
+    for KV in "OUTPUT_DIR=$RUN_OUTPUT_DIR" "LOG_DIR=$RUN_LOG_DIR" "$@"; do
+        ENV_ARGS+=(--env "$KV")
+    done
+
+    case $(runtime_engine $RUNTIME) in
+        docker)
+            docker run --rm $FLAGS -v $(pwd):/app "${ENV_ARGS[@]}" $DOCKER_IMAGE bash -c "$CMD" ;;
+        podman)
+            podman run --rm $FLAGS -v $(pwd):/app:Z "${ENV_ARGS[@]}" $PODMAN_IMAGE bash -c "$CMD" ;;
+        apptainer)
+            apptainer exec $FLAGS --bind $(pwd):/app --pwd /app "${ENV_ARGS[@]}" $APPTAINER_IMAGE bash -c "$CMD" ;;
+        *)
+            return 1 ;;
+    esac
+}
+
+# =============================================
+# BACKENDS DE THREADING (serial, pthread, openmp)
+# =============================================
+# Dimensão da varredura multithread: cada biblioteca é testada com cada backend
+# (variantes <Biblioteca><Ser|Pth|Omp>, ex: OpenBLAS64Pth)
+: "${BACKENDS:=pthread openmp}"
+
+# Sufixo da variante para um backend
+backend_suffix() {
+    case $1 in
+        serial) echo "Ser" ;;
+        pthread) echo "Pth" ;;
+        openmp) echo "Omp" ;;
+    esac
+}
+
+# Threads do runtime OpenMP para um backend: N no backend openmp, 1 nos demais
+# (o harness é linkado com -fopenmp; com OMP_NUM_THREADS > 1 sobre um backend
+# pthread, cada thread OpenMP da aplicação teria seu próprio pool de pthreads)
+export_omp_threads() {
+    if [ "$1" == "openmp" ]; then
+        export OMP_NUM_THREADS=$NUM_THREADS
+    else
+        export OMP_NUM_THREADS=1
+    fi
+}
+
+# Biblioteca e backend de um .so, pelo diretório real (symlinks de alternatives resolvidos)
+# Ex: .../openblas64-pthread/libopenblas64.so.0 -> "openblas64 pthread"
+#     .../blas/libblas.so.3                    -> "blas serial"
+blas_backend_of() {
+    local REAL=$(readlink -f "$1" 2>/dev/null)
+    local DIR=$(basename "$(dirname "$REAL")")
+    local FILE=$(basename "$REAL")
+    case $DIR in
+        *-serial|*-pthread|*-openmp) echo "${DIR%-*} ${DIR##*-}" ;;
+        blas|atlas) echo "$DIR serial" ;;
+        *)
+            # biblioteca fora de um diretório de backend (ex: libgslcblas.so.0)
+            FILE=${FILE#lib}
+            echo "${FILE%%.so*} unknown" ;;
+    esac
+}
+
+# Registra o backend efetivamente carregado (detectado pelo log do ldd) em $OUTPUT_DIR/backends.csv
+# Uso: record_blas_backend <variante> <ldd_log> [caminho da biblioteca]
+# Sem caminho explícito, usa a primeira BLAS listada pelo ldd (gslcblas apenas como último recurso)
+record_blas_backend() {
+    local VARIANT_NAME=$1
+    local LDD_FILE=$2
+    local LIB_PATH=$3
+    local CSV="$OUTPUT_DIR/backends.csv"
+
+    if [ -z "$LIB_PATH" ]; then
+        LIB_PATH=$(awk '$2 == "=>" && $1 ~ /^lib(openblas|blis|blas|tatlas|satlas)/ { print $3; exit }' "$LDD_FILE")
+        [ -z "$LIB_PATH" ] && LIB_PATH=$(awk '$2 == "=>" && $1 ~ /^libgslcblas/ { print $3; exit }' "$LDD_FILE")
+    fi
+    read -r LIBRARY BACKEND <<< "$(blas_backend_of "$LIB_PATH")"
+
+    local CPUS=$(nproc)
+    local OMP_THREADS=${OMP_NUM_THREADS:-$CPUS}
+    local BLAS_THREADS
+    case $LIBRARY in
+        openblas*) BLAS_THREADS=$OPENBLAS_NUM_THREADS ;;
+        blis*) BLAS_THREADS=$BLIS_NUM_THREADS ;;
+    esac
+    # sem variável da biblioteca: serial = 1, openmp = OMP_NUM_THREADS, pthread = todos os núcleos
+    case $BACKEND in
+        openmp) : "${BLAS_THREADS:=$OMP_THREADS}" ;;
+        pthread) : "${BLAS_THREADS:=$CPUS}" ;;
+        *) BLAS_THREADS=1 ;;
+    esac
+    # harness linkado com -fopenmp (runtime OpenMP ao lado dos pthreads da biblioteca)
+    local HARNESS_OPENMP=0
+    grep -q "libgomp" "$LDD_FILE" 2>/dev/null && HARNESS_OPENMP=1
+
+    [ -f "$CSV" ] || echo "variant,library,backend,blas_threads,omp_threads,cpus,harness_openmp,lib_path" > "$CSV"
+    echo "$VARIANT_NAME,$LIBRARY,$BACKEND,$BLAS_THREADS,$OMP_THREADS,$CPUS,$HARNESS_OPENMP,$(readlink -f "$LIB_PATH")" >> "$CSV"
+}
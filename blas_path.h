@@ -0,0 +1,135 @@
+#ifndef BLAS_PATH_H
+#define BLAS_PATH_H
+
+/*
+ * Caminhos de chamada do DGEMM: mesmo problema por interfaces diferentes
+ *
+ *   gsl     - gsl_blas_dgemm (verificação de argumentos e gsl_matrix); a GSL
+ *             chama o cblas_dgemm que vencer a resolução global de símbolos
+ *             (com -lgslcblas antes da BLAS, pode ser o da própria libgslcblas)
+ *   cblas   - cblas_dgemm64_ (ILP64, Debian *64) ou cblas_dgemm, direto
+ *   fortran - dgemm_64_ (ILP64) ou dgemm_, ABI Fortran (colunas, por referência)
+ *
+ * Os símbolos são resolvidos com dlsym(RTLD_DEFAULT), na mesma ordem do
+ * ligador dinâmico, e a biblioteca que os define é identificada com dladdr.
+ * A resolução é gravada em DGEMM_CALLPATH_FILE (uma linha por execução).
+ */
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <stdint.h>
+#include <dlfcn.h>
+
+// enums CBLAS (cblas.h)
+#define BLAS_PATH_ROW_MAJOR 101
+#define BLAS_PATH_NO_TRANS 111
+
+typedef void (*cblas_dgemm_lp64_t)(int, int, int, int, int, int, double,
+	const double*, int, const double*, int, double, double*, int);
+typedef void (*cblas_dgemm_ilp64_t)(int, int, int, int64_t, int64_t, int64_t, double,
+	const double*, int64_t, const double*, int64_t, double, double*, int64_t);
+typedef void (*fortran_dgemm_lp64_t)(const char*, const char*, const int*, const int*, const int*,
+	const double*, const double*, const int*, const double*, const int*,
+	const double*, double*, const int*, size_t, size_t);
+typedef void (*fortran_dgemm_ilp64_t)(const char*, const char*, const int64_t*, const int64_t*, const int64_t*,
+	const double*, const double*, const int64_t*, const double*, const int64_t*,
+	const double*, double*, const int64_t*, size_t, size_t);
+
+typedef struct{
+	char name[8];          // gsl, cblas ou fortran
+	const char *entry;     // função chamada pelo harness
+	const char *symbol;    // símbolo BLAS que executa o DGEMM
+	void *fn;              // endereço de 'symbol'
+	int ilp64;             // 1 = inteiros de 64 bits (sufixo 64_)
+	char library[512];     // biblioteca que define 'symbol' (dladdr)
+} blasPath;
+
+static inline void blasPathLibrary(blasPath *p){
+	Dl_info info;
+	if (p->fn != NULL && dladdr(p->fn, &info) != 0 && info.dli_fname != NULL)
+		snprintf(p->library, sizeof(p->library), "%s", info.dli_fname);
+	else
+		snprintf(p->library, sizeof(p->library), "?");
+}
+
+// primeiro símbolo encontrado de uma lista {ILP64, LP64}
+static inline void blasPathLookup(blasPath *p, const char *ilp64, const char *lp64){
+	p->fn = dlsym(RTLD_DEFAULT, ilp64);
+	p->symbol = ilp64;
+	p->ilp64 = 1;
+	if (p->fn == NULL){
+		p->fn = dlsym(RTLD_DEFAULT, lp64);
+		p->symbol = lp64;
+		p->ilp64 = 0;
+	}
+}
+
+// 0 = resolvido; -1 = caminho desconhecido ou símbolo ausente
+static inline int blasPathResolve(blasPath *p, const char *name){
+	memset(p, 0, sizeof(blasPath));
+	snprintf(p->name, sizeof(p->name), "%s", name);
+	if (strcmp(name, "gsl") == 0){
+		p->entry = "gsl_blas_dgemm";
+		p->symbol = "cblas_dgemm";
+		p->fn = dlsym(RTLD_DEFAULT, "cblas_dgemm");
+	}
+	else if (strcmp(name, "cblas") == 0){
+		blasPathLookup(p, "cblas_dgemm64_", "cblas_dgemm");
+		p->entry = p->symbol;
+	}
+	else if (strcmp(name, "fortran") == 0){
+		blasPathLookup(p, "dgemm_64_", "dgemm_");
+		p->entry = p->symbol;
+	}
+	else
+		return -1;
+	blasPathLibrary(p);
+	// gsl funciona mesmo sem cblas_dgemm visível (GSL com CBLAS estática)
+	if (p->fn == NULL && strcmp(name, "gsl") != 0)
+		return -1;
+	return 0;
+}
+
+// C = alpha*A*B + beta*C em matrizes n x n por linhas (caminhos cblas e fortran)
+static inline void blasPathDgemm(const blasPath *p, int n, double alpha, const double *A, int lda,
+		const double *B, int ldb, double beta, double *C, int ldc){
+	if (p->name[0] == 'c'){
+		if (p->ilp64)
+			((cblas_dgemm_ilp64_t)p->fn)(BLAS_PATH_ROW_MAJOR, BLAS_PATH_NO_TRANS, BLAS_PATH_NO_TRANS,
+				n, n, n, alpha, A, lda, B, ldb, beta, C, ldc);
+		else
+			((cblas_dgemm_lp64_t)p->fn)(BLAS_PATH_ROW_MAJOR, BLAS_PATH_NO_TRANS, BLAS_PATH_NO_TRANS,
+				n, n, n, alpha, A, lda, B, ldb, beta, C, ldc);
+		return;
+	}
+	// por colunas, C' = B'A': mesmas matrizes, sem cópia
+	if (p->ilp64){
+		int64_t n64 = n, ldb64 = ldb, lda64 = lda, ldc64 = ldc;
+		((fortran_dgemm_ilp64_t)p->fn)("N", "N", &n64, &n64, &n64, &alpha, B, &ldb64, A, &lda64,
+			&beta, C, &ldc64, 1, 1);
+	}
+	else
+		((fortran_dgemm_lp64_t)p->fn)("N", "N", &n, &n, &n, &alpha, B, &ldb, A, &lda,
+			&beta, C, &ldc, 1, 1);
+}
+
+// grava a resolução (uma linha por execução do harness) em DGEMM_CALLPATH_FILE
+static inline void blasPathSave(const blasPath *p, const char *outFile){
+	const char *fileName = getenv("DGEMM_CALLPATH_FILE");
+	const char *base;
+	FILE *f;
+	if (fileName == NULL)
+		return;
+	f = fopen(fileName, "a");
+	if (f == NULL)
+		return;
+	fseek(f, 0, SEEK_END);
+	if (ftell(f) == 0)
+		fprintf(f, "file,path,entry,symbol,library,ilp64\n");
+	base = strrchr(outFile, '/');
+	fprintf(f, "%s,%s,%s,%s,%s,%d\n", base ? base + 1 : outFile,
+		p->name, p->entry, p->symbol, p->library, p->ilp64);
+	fclose(f);
+}
+
+#endif
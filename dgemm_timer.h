@@ -0,0 +1,112 @@
+#ifndef DGEMM_TIMER_H
+#define DGEMM_TIMER_H
+
+/*
+ * Temporizador dos harnesses: calibração e lotes para chamadas curtas
+ *
+ * Relógio: omp_get_wtime() (padrão) ou CLOCK_MONOTONIC_RAW com DGEMM_CLOCK=raw
+ * (não sofre ajustes de NTP; em VMs/containers a fonte de relógio pode ter
+ * resolução e custo de leitura diferentes do host).
+ * Calibração: resolução declarada (clock_getres / omp_get_wtick), custo de
+ * duas leituras seguidas (mediana) e menor incremento observado.
+ * Lotes: chamadas mais curtas que DGEMM_BATCH_MIN segundos (padrão:
+ * 100 x (resolução + custo), erro do temporizador < 1%) são medidas em lotes
+ * e o tempo por chamada é (duração do lote - custo) / lote.
+ */
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include <omp.h>
+
+#define TIMER_CALIB_SAMPLES 1000
+#define TIMER_MAX_BATCH 10000
+
+typedef struct{
+	int raw;             // 1 = CLOCK_MONOTONIC_RAW, 0 = omp_get_wtime
+	double resolution;   // s
+	double overhead;     // s, mediana de duas leituras seguidas
+	double granularity;  // s, menor diferença não nula observada
+	double batchMin;     // s, duração mínima de uma medição
+} dgemmTimer;
+
+static inline double timerNow(const dgemmTimer *t){
+	struct timespec ts;
+	if (!t->raw)
+		return omp_get_wtime();
+	clock_gettime(CLOCK_MONOTONIC_RAW, &ts);
+	return ts.tv_sec + ts.tv_nsec*1e-9;
+}
+
+static int timerCompare(const void *a, const void *b){
+	double x = *(const double*)a, y = *(const double*)b;
+	return (x > y) - (x < y);
+}
+
+static inline void timerCalibrate(dgemmTimer *t){
+	static double diffs[TIMER_CALIB_SAMPLES];
+	struct timespec res;
+	double t0, t1;
+	int i;
+	memset(t, 0, sizeof(dgemmTimer));
+	t->raw = (getenv("DGEMM_CLOCK") != NULL && strcmp(getenv("DGEMM_CLOCK"), "raw") == 0);
+	if (t->raw){
+		clock_getres(CLOCK_MONOTONIC_RAW, &res);
+		t->resolution = res.tv_sec + res.tv_nsec*1e-9;
+	}
+	else
+		t->resolution = omp_get_wtick();
+	t->granularity = 0.0;
+	for (i = 0; i < TIMER_CALIB_SAMPLES; i++){
+		t0 = timerNow(t);
+		t1 = timerNow(t);
+		diffs[i] = t1 - t0;
+		if (diffs[i] > 0 && (t->granularity == 0.0 || diffs[i] < t->granularity))
+			t->granularity = diffs[i];
+	}
+	qsort(diffs, TIMER_CALIB_SAMPLES, sizeof(double), timerCompare);
+	t->overhead = diffs[TIMER_CALIB_SAMPLES/2];
+	if (getenv("DGEMM_BATCH_MIN") != NULL && getenv("DGEMM_BATCH_MIN")[0] != '\0')
+		t->batchMin = atof(getenv("DGEMM_BATCH_MIN"));
+	else
+		t->batchMin = 100*(t->resolution + t->overhead);
+}
+
+// chamadas por medição para uma chamada de duração 'probe' (s)
+static inline int timerBatch(const dgemmTimer *t, double probe){
+	double batch;
+	if (probe >= t->batchMin)
+		return 1;
+	if (probe <= 0)
+		return TIMER_MAX_BATCH;
+	batch = t->batchMin/probe + 1;
+	return batch > TIMER_MAX_BATCH ? TIMER_MAX_BATCH : (int)batch;
+}
+
+// tempo por chamada de um lote, descontado o custo das leituras
+static inline double timerPerCall(const dgemmTimer *t, double elapsed, int batch){
+	double dt = elapsed - t->overhead;
+	return (dt > 0 ? dt : elapsed)/batch;
+}
+
+// grava a calibração (uma linha por execução do harness) em DGEMM_TIMER_FILE
+static inline void timerSave(const dgemmTimer *t, const char *outFile){
+	const char *fileName = getenv("DGEMM_TIMER_FILE");
+	const char *base;
+	FILE *f;
+	if (fileName == NULL)
+		return;
+	f = fopen(fileName, "a");
+	if (f == NULL)
+		return;
+	fseek(f, 0, SEEK_END);
+	if (ftell(f) == 0)
+		fprintf(f, "file,clock,resolution,overhead,granularity,batch_min\n");
+	base = strrchr(outFile, '/');
+	fprintf(f, "%s,%s,%.3le,%.3le,%.3le,%.3le\n", base ? base + 1 : outFile,
+		t->raw ? "monotonic_raw" : "omp_get_wtime",
+		t->resolution, t->overhead, t->granularity, t->batchMin);
+	fclose(f);
+}
+
+#endif
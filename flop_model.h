@@ -0,0 +1,99 @@
+#ifndef FLOP_MODEL_H
+#define FLOP_MODEL_H
+
+#include <string.h>
+
+/*
+ * Modelo de contagem de FLOPs para GEMM (mesmo modelo de flop_model.py)
+ *
+ * C = alpha*op(A)*op(B) + beta*C, com A (M x K), B (K x N) e C (M x N):
+ * - produto A*B: 2*M*N*K
+ * - escala por alpha: M*N (omitida quando alpha = 1)
+ * - atualizacao beta*C: M*N adicoes (omitidas quando beta = 0)
+ *   mais M*N multiplicacoes (omitidas quando beta = 1)
+ *
+ * Tipos complexos (CGEMM/ZGEMM) contam operacoes reais, como no LAPACK:
+ * multiplicacao complexa = 6 FLOPs, adicao complexa = 2 (produto: 8*M*N*K)
+ */
+static inline double gemm_flops_t(double m, double n, double k, double alpha, double beta, int isComplex){
+	double mn = m*n;
+	// custo de uma multiplicacao e de uma adicao no tipo do GEMM
+	double mul = isComplex ? 6.0 : 1.0;
+	double add = isComplex ? 2.0 : 1.0;
+	double flops = 0.0;
+	if (alpha != 0.0){
+		flops += (mul + add)*mn*k;
+		if (alpha != 1.0)
+			flops += mul*mn;
+	}
+	if (beta != 0.0){
+		if (alpha != 0.0)
+			flops += add*mn;
+		if (beta != 1.0)
+			flops += mul*mn;
+	}
+	return flops;
+}
+
+// GEMM real (SGEMM/DGEMM)
+static inline double gemm_flops(double m, double n, double k, double alpha, double beta){
+	return gemm_flops_t(m, n, k, alpha, beta, 0);
+}
+
+// tamanho do problema em GFLOP (coluna Size do .dat)
+static inline double gemm_gflop(double m, double n, double k, double alpha, double beta){
+	return gemm_flops(m, n, k, alpha, beta)*0.000000001;
+}
+
+// tamanho do problema em GFLOP por tipo: 's', 'd', 'c' ou 'z'
+static inline double gemm_gflop_t(double m, double n, double k, double alpha, double beta, char dtype){
+	return gemm_flops_t(m, n, k, alpha, beta, dtype == 'c' || dtype == 'z')*0.000000001;
+}
+
+/*
+ * Rotinas BLAS 1/2 (limitadas por memoria), mesmo modelo de flop_model.py
+ *
+ * matSize N: DGEMV com A (N x N); DAXPY e DDOT com vetores de N*N elementos
+ * (mesmo volume de dados da matriz do DGEMV)
+ * - dgemv y = alpha*A*x + beta*y: GEMM N x 1 x N
+ * - daxpy y = alpha*x + y: L adicoes (+ L multiplicacoes se alpha != 1)
+ * - ddot  x.y: L multiplicacoes + L adicoes
+ * Bytes: trafego compulsorio de memoria (cada elemento lido/escrito uma vez)
+ * - dgemv: A, x e y lidos (y so se beta != 0), y escrito
+ * - daxpy: x e y lidos, y escrito; ddot: x e y lidos
+ */
+static inline double blas12_flops(const char *routine, double n, double alpha, double beta){
+	double len = n*n;
+	if (strcmp(routine, "dgemv") == 0)
+		return gemm_flops(n, 1, n, alpha, beta);
+	if (strcmp(routine, "daxpy") == 0)
+		return alpha == 1.0 ? len : 2*len;
+	return 2*len;
+}
+
+static inline double blas12_bytes(const char *routine, double n, double beta){
+	double len = n*n;
+	if (strcmp(routine, "dgemv") == 0)
+		return 8*(n*n + n + (beta != 0.0 ? 2*n : n));
+	if (strcmp(routine, "daxpy") == 0)
+		return 8*3*len;
+	return 8*2*len;
+}
+
+// bytes dos operandos de uma chamada (dgemv: A, x e y; daxpy/ddot: x e y)
+static inline double blas12_operand_bytes(const char *routine, double n){
+	if (strcmp(routine, "dgemv") == 0)
+		return 8*(n*n + 2*n);
+	return 8*2*n*n;
+}
+
+// tamanho do problema em GFLOP (coluna Size) e trafego em GB (coluna GBytes)
+static inline double blas12_gflop(const char *routine, double n, double alpha, double beta){
+	return blas12_flops(routine, n, alpha, beta)*0.000000001;
+}
+
+static inline double blas12_gbytes(const char *routine, double n, double beta){
+	return blas12_bytes(routine, n, beta)*0.000000001;
+}
+
+#endif
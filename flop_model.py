@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Modelo de Contagem de FLOPs para GEMM
+=====================================
+
+Modelo único usado pela análise (Python) e pelos harnesses (flop_model.h).
+Os harnesses gravam o resultado na coluna Size (GFLOP) do .dat; a análise
+usa esse valor gravado e só recorre a este modelo para dados antigos.
+
+C = alpha·op(A)·op(B) + beta·C, com A (M x K), B (K x N) e C (M x N):
+- Produto A·B: 2·M·N·K (M·N·K multiplicações + M·N·K adições)
+- Escala por alpha: M·N multiplicações (omitida quando alpha = 1)
+- Atualização beta·C: M·N adições (omitida quando beta = 0)
+  mais M·N multiplicações (omitidas quando beta = 1)
+
+Tipos complexos (CGEMM/ZGEMM) contam operações reais, como no LAPACK:
+multiplicação complexa = 6 FLOPs (4 mult. + 2 adições), adição complexa = 2.
+- Produto A·B: 8·M·N·K
+- Escala por alpha: 6·M·N; atualização beta·C: 2·M·N adições + 6·M·N mult.
+
+Rotinas BLAS 1/2 (limitadas por memória), matSize N: DGEMV com A (N x N);
+DAXPY e DDOT com vetores de L = N² elementos (o volume de dados da matriz).
+- dgemv y = alpha·A·x + beta·y: GEMM N x 1 x N
+- daxpy y = alpha·x + y: L adições (+ L multiplicações se alpha ≠ 1)
+- ddot x·y: 2·L
+Bytes (coluna GBytes): tráfego compulsório, cada elemento lido/escrito uma vez
+- dgemv: 8·(N² + N + 2·N) (y lido só se beta ≠ 0); daxpy: 8·3·L; ddot: 8·2·L
+Working set (coluna WorkingSet): cópias dos operandos rotacionadas pelo harness
+até passar de 2x a LLC, para que cada chamada leia da DRAM
+"""
+
+# Constantes usadas pelos harnesses (teste_GSL_DGEMM.c / teste_DGEMM.c)
+HARNESS_ALPHA = 1.0
+HARNESS_BETA = 0.5
+HARNESS_NREP = 5   # repetições por tamanho (NREP)
+
+# Tipos de dado do GEMM (prefixo BLAS) -> aritmética complexa
+DTYPES = {'s': False, 'd': False, 'c': True, 'z': True}
+DTYPE_NAMES = {'s': 'SGEMM', 'd': 'DGEMM', 'c': 'CGEMM', 'z': 'ZGEMM'}
+
+# Rotinas BLAS 1/2 medidas pelo harness (benchmark_common.sh: ROUTINES)
+BLAS12_ROUTINES = {'dgemv': 'DGEMV', 'daxpy': 'DAXPY', 'ddot': 'DDOT'}
+
+def gemm_flops(m, n, k, alpha=1.0, beta=0.0, dtype='d'):
+    """Número de operações de ponto flutuante (reais) de um GEMM M x N x K"""
+    mn = float(m) * float(n)
+    # custo de uma multiplicação e de uma adição no tipo do GEMM
+    mul, add = (6.0, 2.0) if DTYPES[dtype] else (1.0, 1.0)
+    flops = 0.0
+    if alpha != 0.0:
+        flops += (mul + add) * mn * float(k)
+        if alpha != 1.0:
+            flops += mul * mn
+    if beta != 0.0:
+        if alpha != 0.0:
+            flops += add * mn
+        if beta != 1.0:
+            flops += mul * mn
+    return flops
+
+def gemm_gflop(m, n, k, alpha=1.0, beta=0.0, dtype='d'):
+    """Tamanho do problema em GFLOP (mesmo valor da coluna Size)"""
+    return gemm_flops(m, n, k, alpha, beta, dtype) * 1e-9
+
+def harness_gflop(matrix_size, dtype='d'):
+    """GFLOP de uma chamada do harness (matrizes N x N, alpha=1, beta=0.5)"""
+    return gemm_gflop(matrix_size, matrix_size, matrix_size, HARNESS_ALPHA, HARNESS_BETA, dtype)
+
+def blas12_flops(routine, n, alpha=1.0, beta=0.0):
+    """Operações de ponto flutuante de uma rotina BLAS 1/2 com matSize n"""
+    length = float(n) * float(n)
+    if routine == 'dgemv':
+        return gemm_flops(n, 1, n, alpha, beta)
+    if routine == 'daxpy':
+        return length if alpha == 1.0 else 2.0 * length
+    return 2.0 * length
+
+def blas12_bytes(routine, n, beta=0.0):
+    """Tráfego compulsório de memória (bytes) de uma rotina BLAS 1/2 com matSize n"""
+    n = float(n)
+    if routine == 'dgemv':
+        return 8.0 * (n * n + n + (2.0 * n if beta != 0.0 else n))
+    if routine == 'daxpy':
+        return 8.0 * 3.0 * n * n
+    return 8.0 * 2.0 * n * n
+
+def blas12_operand_bytes(routine, n):
+    """Bytes dos operandos de uma chamada BLAS 1/2 (dgemv: A, x e y; daxpy/ddot: x e y)"""
+    n = float(n)
+    if routine == 'dgemv':
+        return 8.0 * (n * n + 2.0 * n)
+    return 8.0 * 2.0 * n * n
+
+def harness_blas12(matrix_size, routine):
+    """(GFLOP, GB) de uma chamada do harness (alpha=1, beta=0.5)"""
+    return (blas12_flops(routine, matrix_size, HARNESS_ALPHA, HARNESS_BETA) * 1e-9,
+            blas12_bytes(routine, matrix_size, HARNESS_BETA) * 1e-9)
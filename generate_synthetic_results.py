@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Gerador de Árvores de Resultados Sintéticas
+===========================================
+
+Escreve árvores output/<modo>/<ambiente>/<método>/NNN/ no mesmo formato dos
+runners (output_<variante>.dat, host.env, runtime.env, .complete), em escala
+configurável, para testar e medir o desempenho da análise sem executar DGEMMs.
+
+Modelo dos tempos (por variante, ambiente, execução e tamanho):
+- T(N) = GFLOP(N) / pico da variante x (1 + N0/N)  (ineficiência em N pequeno)
+- containers: fator fixo de overhead por ambiente (0 a 2%)
+- cada execução: deriva de ±0.5%; cada repetição: ruído lognormal de 1%
+- 2% dos pontos com uma repetição 30% mais lenta (outlier)
+
+Uso:
+    python3 generate_synthetic_results.py --out /tmp/synthetic/output \\
+        --runs 50 --variants 10 --sizes 64 --environments 8
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from flop_model import harness_gflop
+
+# Variantes reais primeiro (hpc_analysis usa OpenBLAS64 e BLIS64), depois sintéticas
+VARIANT_PEAKS = {'OpenBLAS64': 20.0, 'BLIS64': 15.0, 'BLAS': 2.0, 'ATLAS': 8.0, 'BLIS': 14.0}
+# Ambientes da matriz de runtimes (benchmark_common.sh: RUNTIME_ALL)
+ENVIRONMENTS = ['native', 'docker', 'docker_privileged', 'docker_cpuset', 'docker_seccomp',
+                'docker_nonet', 'podman', 'apptainer']
+METHODS = ['direct_compilation', 'alternatives', 'dlopen']
+
+HEADER = ("matSize,Size,Mean,Variance,Largest,Smallest,Median,SD,SD_Mean,Skew,RMS,Kurtosis,"
+          "PkgJoules,DramJoules,Batch")
+NREP = 5
+INITIAL_SIZE = 128
+STEP = 128
+
+def variant_names(count):
+    """Nomes das variantes: as reais e, além delas, Lib06, Lib07, ..."""
+    names = list(VARIANT_PEAKS)[:count]
+    names += [f"Lib{i:02d}" for i in range(len(names) + 1, count + 1)]
+    return names
+
+def environment_names(count):
+    """Nomes dos ambientes: nativo, matriz de runtimes e, além dela, env09, env10, ..."""
+    names = ENVIRONMENTS[:count]
+    names += [f"env{i:02d}" for i in range(len(names) + 1, count + 1)]
+    return names
+
+def sample_times(rng, mean_time):
+    """Repetições de um ponto (ruído lognormal e outlier ocasional)"""
+    times = mean_time * rng.lognormal(0.0, 0.01, NREP)
+    if rng.random() < 0.02:
+        times[rng.integers(NREP)] *= 1.3
+    return times
+
+def dat_row(size, gflop, times, watts):
+    """Linha do .dat com as estatísticas do harness (Largest = menor tempo, como no harness)"""
+    mean, sd = times.mean(), times.std(ddof=1)
+    centered = (times - mean) / times.std()
+    skew = (centered ** 3).mean()
+    kurtosis = (centered ** 4).mean() - 3.0
+    joules = mean * watts
+    return (f"{size},  {gflop:.9f},  {mean:.9f}, {sd ** 2:.6e}, {times.min():.9f}, "
+            f"{times.max():.9f},  {np.median(times):.9f}, {sd:.9f}, {sd / np.sqrt(NREP):.9f}, "
+            f"{skew:.4f}, {np.sqrt((times ** 2).mean()):.9f}, {kurtosis:.4f}, "
+            f"{joules:.6f}, {joules * 0.1:.6f}, 1 \n")
+
+def write_env(path, values):
+    """Arquivo KEY="valor" (mesmo formato de host.env/runtime.env)"""
+    path.write_text("".join(f'{key}="{value}"\n' for key, value in values.items()))
+
+def generate(out, runs=2, variants=2, sizes=8, environments=2, methods=None,
+             threading_mode='single', seed=1234567890):
+    """
+    Gera a árvore sintética em <out>/<threading_mode>/...
+
+    Returns:
+        Número de arquivos .dat escritos
+    """
+    rng = np.random.default_rng(seed)
+    out = Path(out)
+    methods = methods or METHODS
+    variant_list = variant_names(variants)
+    env_list = environment_names(environments)
+    size_list = [INITIAL_SIZE + i * STEP for i in range(sizes)]
+    gflops = {size: harness_gflop(size) for size in size_list}
+    peaks = {v: VARIANT_PEAKS.get(v, rng.uniform(3.0, 20.0)) for v in variant_list}
+    env_factor = {env: 1.0 if env == 'native' else 1.0 + rng.uniform(0.0, 0.02) for env in env_list}
+
+    files = 0
+    for env in env_list:
+        for method in methods:
+            for run in range(1, runs + 1):
+                run_dir = out / threading_mode / env / method / f"{run:03d}"
+                run_dir.mkdir(parents=True, exist_ok=True)
+                write_env(run_dir / 'host.env', {
+                    'host_id': 'synthetic-00000000', 'hostname': 'synthetic',
+                    'cpu_model': 'Synthetic CPU', 'cpu_sockets': 1, 'cpu_cores': 8,
+                    'cpu_threads': 16, 'cpu_max_mhz': 3000, 'cache_l1d': '48K',
+                    'cache_l2': '1280K', 'cache_l3': '24576K', 'kernel': 'synthetic',
+                    'arch': 'x86_64', 'bench_threads': 1 if threading_mode == 'single' else 4,
+                    'rapl': 'readable', 'date': '2025-01-01T00:00:00+00:00',
+                })
+                write_env(run_dir / 'runtime.env', {
+                    'runtime': env, 'engine': 'native' if env == 'native' else 'docker',
+                    'flags': '', 'engine_version': '', 'image': '',
+                })
+                (run_dir / '.complete').write_text('2025-01-01T00:00:00+00:00\n')
+                drift = 1.0 + rng.uniform(-0.005, 0.005)
+                for variant in variant_list:
+                    watts = 30.0 + peaks[variant]
+                    lines = [HEADER + "\n"]
+                    for size in size_list:
+                        mean_time = gflops[size] / peaks[variant] * (1.0 + 32.0 / size)
+                        times = sample_times(rng, mean_time * env_factor[env] * drift)
+                        lines.append(dat_row(size, gflops[size], times, watts))
+                    (run_dir / f"output_{variant}.dat").write_text("".join(lines))
+                    files += 1
+    return files
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera árvores de resultados sintéticas para a análise")
+    parser.add_argument('--out', default='output_synthetic', help="Diretório base (padrão: output_synthetic)")
+    parser.add_argument('--runs', type=int, default=2, help="Execuções por ambiente/método")
+    parser.add_argument('--variants', type=int, default=2, help="Bibliotecas por execução")
+    parser.add_argument('--sizes', type=int, default=8, help="Tamanhos de matriz (128, 256, ...)")
+    parser.add_argument('--environments', type=int, default=2, help="Ambientes (nativo + containers)")
+    parser.add_argument('--methods', nargs='+', default=METHODS, choices=METHODS)
+    parser.add_argument('--mode', default='single', choices=['single', 'multi'])
+    parser.add_argument('--seed', type=int, default=1234567890)
+    args = parser.parse_args()
+
+    count = generate(args.out, args.runs, args.variants, args.sizes, args.environments,
+                     args.methods, args.mode, args.seed)
+    print(f"{count} arquivos .dat gerados em {args.out}/{args.mode}/")
+    sys.exit(0)
@@ -99,12 +99,23 @@ df_pivot['overhead_tempo_abs'] = df_pivot.apply(
 )
 df_pivot['slowdown'] = df_pivot['docker'] / df_pivot['native']
 
-# Calcular GFLOPS
+# Calcular GFLOPS com o tamanho do problema gravado pelo harness (coluna Size)
+df_size = df_combined.pivot_table(
+    index=['variant', 'method', 'matSize'],
+    columns='environment',
+    values='Size',
+    aggfunc='first'
+).reset_index()
+df_size = df_size[['variant', 'method', 'matSize', 'native', 'docker']].rename(
+    columns={'native': 'gflop_native', 'docker': 'gflop_docker'}
+)
+df_pivot = df_pivot.merge(df_size, on=['variant', 'method', 'matSize'], how='left')
+
 df_pivot['gflops_native'] = df_pivot.apply(
-    lambda row: calculate_gflops(row['matSize'], row['native']), axis=1
+    lambda row: calculate_gflops(row['matSize'], row['native'], row['gflop_native']), axis=1
 )
 df_pivot['gflops_docker'] = df_pivot.apply(
-    lambda row: calculate_gflops(row['matSize'], row['docker']), axis=1
+    lambda row: calculate_gflops(row['matSize'], row['docker'], row['gflop_docker']), axis=1
 )
 df_pivot['overhead_gflops_percent'] = (
     (df_pivot['gflops_native'] - df_pivot['gflops_docker']) / df_pivot['gflops_native'] * 100
@@ -0,0 +1,125 @@
+#ifndef RAPL_H
+#define RAPL_H
+
+/*
+ * Leitura de energia via powercap/RAPL (/sys/class/powercap/intel-rapl:*)
+ *
+ * Dominios: pacote (intel-rapl:<p>, todos os sockets somados) e DRAM
+ * (subzona intel-rapl:<p>:<s> com name = "dram"). Os contadores energy_uj
+ * dão a volta em max_energy_range_uj; a diferença corrige uma volta.
+ * Sem RAPL (ou sem permissão de leitura) o dominio fica vazio e a energia
+ * é gravada como nan. DGEMM_RAPL=0 desativa a leitura.
+ */
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <math.h>
+
+#ifndef RAPL_ROOT
+#define RAPL_ROOT "/sys/class/powercap"
+#endif
+#define RAPL_MAX_ZONES 8
+
+typedef struct{
+	int n;
+	char path[RAPL_MAX_ZONES][128];  // .../energy_uj
+	double range[RAPL_MAX_ZONES];    // max_energy_range_uj
+	double start[RAPL_MAX_ZONES];
+	double joules;                   // acumulado entre raplStart/raplStop
+} raplDomain;
+
+static inline int raplReadValue(const char *path, double *value){
+	FILE *f = fopen(path, "r");
+	int ok;
+	if (f == NULL)
+		return 0;
+	ok = (fscanf(f, "%lf", value) == 1);
+	fclose(f);
+	return ok;
+}
+
+static inline int raplNameIs(const char *zone, const char *prefix){
+	char path[160], name[64] = "";
+	FILE *f;
+	snprintf(path, sizeof(path), "%s/name", zone);
+	f = fopen(path, "r");
+	if (f == NULL)
+		return 0;
+	if (fscanf(f, "%63s", name) != 1)
+		name[0] = '\0';
+	fclose(f);
+	return strncmp(name, prefix, strlen(prefix)) == 0;
+}
+
+// adiciona a zona ao dominio se energy_uj puder ser lido
+static inline void raplAddZone(raplDomain *d, const char *zone){
+	char path[160];
+	double value;
+	if (d->n >= RAPL_MAX_ZONES)
+		return;
+	snprintf(d->path[d->n], sizeof(d->path[d->n]), "%s/energy_uj", zone);
+	if (!raplReadValue(d->path[d->n], &value))
+		return;
+	snprintf(path, sizeof(path), "%s/max_energy_range_uj", zone);
+	if (!raplReadValue(path, &d->range[d->n]))
+		d->range[d->n] = 0.0;
+	d->n++;
+}
+
+static inline void raplInit(raplDomain *pkg, raplDomain *dram){
+	char zone[96], sub[112];
+	int p, s;
+	memset(pkg, 0, sizeof(raplDomain));
+	memset(dram, 0, sizeof(raplDomain));
+	if (getenv("DGEMM_RAPL") != NULL && strcmp(getenv("DGEMM_RAPL"), "0") == 0)
+		return;
+	for (p = 0; p < RAPL_MAX_ZONES; p++){
+		snprintf(zone, sizeof(zone), "%s/intel-rapl:%d", RAPL_ROOT, p);
+		if (!raplNameIs(zone, "package"))
+			continue;
+		raplAddZone(pkg, zone);
+		for (s = 0; s < RAPL_MAX_ZONES; s++){
+			snprintf(sub, sizeof(sub), "%s/intel-rapl:%d:%d", zone, p, s);
+			if (raplNameIs(sub, "dram"))
+				raplAddZone(dram, sub);
+		}
+	}
+}
+
+static inline void raplStart(raplDomain *d){
+	int i;
+	for (i = 0; i < d->n; i++)
+		raplReadValue(d->path[i], &d->start[i]);
+}
+
+static inline void raplReset(raplDomain *d){
+	d->joules = 0.0;
+}
+
+// acumula a energia desde raplStart (em joules)
+static inline void raplStop(raplDomain *d){
+	int i;
+	double now, delta;
+	for (i = 0; i < d->n; i++){
+		if (!raplReadValue(d->path[i], &now))
+			continue;
+		delta = now - d->start[i];
+		if (delta < 0){  // contador deu a volta
+			if (d->range[i] <= 0){  // sem max_energy_range_uj: energia desconhecida
+				d->joules = NAN;
+				continue;
+			}
+			delta += d->range[i];
+		}
+		d->joules += delta*0.000001;
+	}
+}
+
+// energia acumulada por chamada (nan sem leitura RAPL)
+static inline double raplJoulesPer(raplDomain *d, int calls){
+	if (d->n == 0 || calls <= 0)
+		return NAN;
+	return d->joules/calls;
+}
+
+#endif
@@ -0,0 +1,137 @@
+#!/bin/bash
+
+# Script de varredura adaptativa: passo grosso seguido de rodadas de refinamento
+# onde o GFLOPS muda bruscamente entre vizinhos ou o container diverge do nativo
+# (adaptive_sampling.py), dentro de um orçamento total de tempo
+# Os novos tamanhos são anexados aos output_<variante>.dat das mesmas execuções
+#
+# Variáveis:
+#   TIME_BUDGET  - orçamento total em segundos, incluindo a varredura grossa (padrão: 3600)
+#   MAX_ROUNDS   - rodadas de refinamento (padrão: 5)
+#   MODE         - single ou multi (padrão: single)
+#   METHOD       - método de troca de biblioteca (padrão: direct_compilation)
+#   ENVS         - ambientes; o primeiro é a referência (padrão: "native docker")
+#   REFINE_RUNS  - refinar execuções existentes em vez de uma nova varredura grossa
+#                  (ex: "native=003 docker=003")
+#   GFLOPS_JUMP  - salto de GFLOPS entre vizinhos, em % (padrão: 5)
+#   DIVERGENCE   - variação do overhead container/nativo entre vizinhos, em pp (padrão: 1)
+
+# Cores
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+BLUE='\033[0;34m'
+CYAN='\033[0;36m'
+NC='\033[0m' # No Color
+
+# funções compartilhadas (ambientes de container, identificação do host)
+source "$(dirname "$0")/benchmark_common.sh"
+
+: "${TIME_BUDGET:=3600}"
+: "${MAX_ROUNDS:=5}"
+: "${MODE:=single}"
+: "${METHOD:=direct_compilation}"
+: "${ENVS:=native docker}"
+: "${GFLOPS_JUMP:=5}"
+: "${DIVERGENCE:=1}"
+: "${NUM_THREADS:=4}"
+THREADS=1
+[ "$MODE" == "multi" ] && THREADS=$NUM_THREADS
+SCRIPT=$(method_script $MODE $METHOD)
+
+# Executa o script de teste de um ambiente (varredura completa ou só os pontos do arquivo)
+# Uso: run_env <ambiente> [arquivo de pontos]
+run_env() {
+    local ENV_NAME=$1
+    local POINTS=$2
+    local OUT="output/$MODE/$ENV_NAME/$METHOD/${RUN_NUM[$ENV_NAME]}"
+    local LOGS="logs/$MODE/$ENV_NAME/$METHOD/${RUN_NUM[$ENV_NAME]}"
+    if [ "$ENV_NAME" == "native" ]; then
+        OUTPUT_DIR="$OUT" LOG_DIR="$LOGS" NUM_THREADS=$THREADS REMEASURE_FILE="$POINTS" $SCRIPT
+    else
+        runtime_run $ENV_NAME $METHOD "$OUT" "$LOGS" "$SCRIPT" \
+            "NUM_THREADS=$THREADS" "REMEASURE_FILE=$POINTS" \
+            "DTYPES=$DTYPES" "CALL_PATHS=$CALL_PATHS" "ROUTINES=$ROUTINES" "DGEMM_CLOCK=$DGEMM_CLOCK" "DGEMM_BATCH_MIN=$DGEMM_BATCH_MIN"
+    fi
+}
+
+echo "=============================================="
+echo "  meuGEMM - Varredura Adaptativa"
+echo "=============================================="
+echo "Orçamento: ${TIME_BUDGET}s | Rodadas: até $MAX_ROUNDS"
+echo "Modo: $MODE | Método: $METHOD | Ambientes: $ENVS"
+echo "Refinar onde: ΔGFLOPS > ${GFLOPS_JUMP}% ou Δoverhead > ${DIVERGENCE}pp"
+echo "=============================================="
+echo ""
+
+ACTIVE_ENVS=""
+for ENV_NAME in $ENVS; do
+    if [ "$ENV_NAME" != "native" ] && ! runtime_available $ENV_NAME; then
+        echo -e "${YELLOW}[AVISO]${NC} Ambiente '$ENV_NAME' indisponível, pulando"
+        continue
+    fi
+    ACTIVE_ENVS="$ACTIVE_ENVS $ENV_NAME"
+done
+
+START=$(date +%s)
+declare -A RUN_NUM
+if [ -n "$REFINE_RUNS" ]; then
+    for SPEC in $REFINE_RUNS; do
+        RUN_NUM[${SPEC%%=*}]=${SPEC#*=}
+    done
+    # só os ambientes com execução indicada
+    REFINE_ENVS=""
+    for ENV_NAME in $ACTIVE_ENVS; do
+        [ -n "${RUN_NUM[$ENV_NAME]}" ] && REFINE_ENVS="$REFINE_ENVS $ENV_NAME"
+    done
+    ACTIVE_ENVS=$REFINE_ENVS
+    echo -e "${CYAN}[INFO]${NC} Refinando execuções existentes: $REFINE_RUNS"
+else
+    # Varredura grossa (passo dos scripts de teste) em cada ambiente
+    for ENV_NAME in $ACTIVE_ENVS; do
+        RUN_NUM[$ENV_NAME]=$(get_next_run_number "output/$MODE/$ENV_NAME/$METHOD")
+        open_run "output/$MODE/$ENV_NAME/$METHOD/${RUN_NUM[$ENV_NAME]}" $THREADS $ENV_NAME $METHOD
+        mkdir -p "logs/$MODE/$ENV_NAME/$METHOD/${RUN_NUM[$ENV_NAME]}"
+        echo -e "${BLUE}[$ENV_NAME]${NC} Varredura grossa (${RUN_NUM[$ENV_NAME]})..."
+        run_env $ENV_NAME > "logs/$MODE/$ENV_NAME/$METHOD/${RUN_NUM[$ENV_NAME]}/adaptive_coarse.log" 2>&1
+    done
+fi
+
+ENV_ARGS=""
+for ENV_NAME in $ACTIVE_ENVS; do
+    ENV_ARGS="$ENV_ARGS --env $ENV_NAME=${RUN_NUM[$ENV_NAME]}"
+done
+FIRST_ENV=$(echo $ACTIVE_ENVS | cut -d' ' -f1)
+PLAN_DIR="logs/$MODE/$FIRST_ENV/$METHOD/${RUN_NUM[$FIRST_ENV]}"
+mkdir -p "$PLAN_DIR"
+
+for ROUND in $(seq 1 $MAX_ROUNDS); do
+    REMAINING=$((TIME_BUDGET - ($(date +%s) - START)))
+    if [ "$REMAINING" -le 0 ]; then
+        echo -e "${YELLOW}[AVISO]${NC} Orçamento esgotado"
+        break
+    fi
+
+    POINTS="$PLAN_DIR/adaptive_round${ROUND}.csv"
+    echo ""
+    echo -e "${CYAN}► Rodada $ROUND${NC} (restam ${REMAINING}s)"
+    python3 adaptive_sampling.py --mode $MODE --method $METHOD $ENV_ARGS --budget $REMAINING \
+        --gflops-jump $GFLOPS_JUMP --divergence $DIVERGENCE --out "$POINTS"
+    if [ $? -ne 0 ] || [ ! -s "$POINTS" ]; then
+        echo -e "${GREEN}✓${NC} Nenhum intervalo a refinar dentro do orçamento"
+        break
+    fi
+
+    for ENV_NAME in $ACTIVE_ENVS; do
+        echo -ne "${BLUE}[$ENV_NAME]${NC} $(wc -l < "$POINTS") tamanhos... "
+        run_env $ENV_NAME "$POINTS" >> "logs/$MODE/$ENV_NAME/$METHOD/${RUN_NUM[$ENV_NAME]}/adaptive.log" 2>&1
+        echo -e "${GREEN}✓${NC}"
+    done
+done
+
+echo ""
+echo -e "${GREEN}✓${NC} Varredura adaptativa concluída em $(( $(date +%s) - START ))s"
+for ENV_NAME in $ACTIVE_ENVS; do
+    echo "  $ENV_NAME: output/$MODE/$ENV_NAME/$METHOD/${RUN_NUM[$ENV_NAME]}"
+done
+echo "Análise: python3 analysis_benchmark_hpc.py"
@@ -18,6 +18,9 @@ STEP=128
 # source file
 SOURCE_FILE="teste_GSL_DGEMM.c"
 
+# funções compartilhadas (execução do harness, remedição)
+source "$(dirname "$0")/benchmark_common.sh"
+
 # Diretórios de saída (com fallback para valores padrão)
 : "${OUTPUT_DIR:=output/single/native/alternatives/001}"
 : "${LOG_DIR:=logs/single/native/alternatives/001}"
@@ -52,7 +55,7 @@ compile_object_64() {
 }
 
 link_executable_64() {
-    gcc -o $OUTPUT_DIR/dgemm_test64 $OUTPUT_DIR/dgemm_test64.o -lgsl -lgslcblas -lm -lblas64 -lgfortran -lgomp -fopenmp -export-dynamic 2>/dev/null
+    gcc -o $OUTPUT_DIR/dgemm_test64 $OUTPUT_DIR/dgemm_test64.o -Wl,--no-as-needed -lgsl -lgslcblas -lm -lblas64 -lgfortran -lgomp -fopenmp -export-dynamic 2>/dev/null
     
     if [ $? -ne 0 ]; then
         echo -e "${RED}[ERRO]${NC} Falha no link do executável 64 bits"
@@ -74,6 +77,7 @@ run_test_blas64() {
     
     if [ -z "$ALT_PATH" ]; then
         echo -e "${RED}ERRO (alternativa não encontrada)${NC}"
+        skip_variant "alternativa ausente" $VARIANT_NAME
         return 1
     fi
     
@@ -88,13 +92,15 @@ run_test_blas64() {
     else
         # For BLAS64 reference, skip due to linkage issues
         echo -e "${YELLOW}SKIP (problema de linkagem)${NC}"
+        skip_variant "link" $VARIANT_NAME
         return 1
     fi
     
     # Link with specific library path
-    gcc -o $OUTPUT_DIR/dgemm_test64 $OUTPUT_DIR/dgemm_test64.o -lgsl -lgslcblas -lm $LIB_PATH -lgomp -fopenmp -export-dynamic 2>/dev/null
+    gcc -o $OUTPUT_DIR/dgemm_test64 $OUTPUT_DIR/dgemm_test64.o -Wl,--no-as-needed -lgsl -lgslcblas -lm $LIB_PATH -lgomp -fopenmp -export-dynamic 2>/dev/null
     if [ $? -ne 0 ]; then
         echo -e "${RED}ERRO (link)${NC}"
+        skip_variant "link" $VARIANT_NAME
         return 1
     fi
 
@@ -106,9 +112,10 @@ run_test_blas64() {
     echo "LDD Output:" >> $LDD_FILE
     echo "========================================" >> $LDD_FILE
     ldd $OUTPUT_DIR/dgemm_test64 >> $LDD_FILE 2>&1
+    record_blas_backend $VARIANT_NAME $LDD_FILE
     
     # Executar teste (suprimir output)
-    $OUTPUT_DIR/dgemm_test64 $OUTPUT_FILE $INITIAL_SIZE $FINAL_SIZE $STEP > /dev/null 2>&1
+    run_dgemm_harness $OUTPUT_DIR/dgemm_test64 $OUTPUT_FILE $VARIANT_NAME
     
     if [ $? -eq 0 ]; then
         echo -e "${GREEN}✓${NC}"
@@ -130,7 +137,7 @@ compile_object() {
 }
 
 link_executable() {
-    gcc -o $OUTPUT_DIR/dgemm_test $OUTPUT_DIR/dgemm_test.o -lgsl -lgslcblas -lm -lblas -fopenmp -export-dynamic 2>/dev/null
+    gcc -o $OUTPUT_DIR/dgemm_test $OUTPUT_DIR/dgemm_test.o -Wl,--no-as-needed -lgsl -lgslcblas -lm -lblas -fopenmp -export-dynamic 2>/dev/null
     
     if [ $? -ne 0 ]; then
         echo -e "${RED}[ERRO]${NC} Falha no link do executável"
@@ -152,6 +159,7 @@ run_test_blas() {
     
     if [ -z "$ALT_NUMBER" ]; then
         echo -e "${RED}ERRO (alternativa não encontrada)${NC}"
+        skip_variant "alternativa ausente" $VARIANT_NAME
         return 1
     fi
     
@@ -172,6 +180,7 @@ run_test_blas() {
     link_executable
     if [ $? -ne 0 ]; then
         echo -e "${RED}ERRO (link)${NC}"
+        skip_variant "link" $VARIANT_NAME
         return 1
     fi
 
@@ -183,9 +192,10 @@ run_test_blas() {
     echo "LDD Output:" >> $LDD_FILE
     echo "========================================" >> $LDD_FILE
     ldd $OUTPUT_DIR/dgemm_test >> $LDD_FILE 2>&1
+    record_blas_backend $VARIANT_NAME $LDD_FILE
     
     # Executar teste (suprimir output)
-    $OUTPUT_DIR/dgemm_test $OUTPUT_FILE $INITIAL_SIZE $FINAL_SIZE $STEP > /dev/null 2>&1
+    run_dgemm_harness $OUTPUT_DIR/dgemm_test $OUTPUT_FILE $VARIANT_NAME
     
     if [ $? -eq 0 ]; then
         echo -e "${GREEN}✓${NC}"
@@ -199,6 +209,8 @@ run_test_blas() {
 # Verificar se update-alternatives está disponível
 if ! command -v update-alternatives &> /dev/null; then
     echo -e "${RED}[ERRO]${NC} update-alternatives não encontrado"
+    skip_variant "alternativa ausente" OpenBLAS64 BLIS64 BLAS ATLAS BLIS
+    finish_run
     exit 1
 fi
 
@@ -220,6 +232,8 @@ if [ $? -eq 0 ]; then
     # TESTE 2: BLIS64 (usando pthread com 1 thread para single-thread)
     export BLIS_NUM_THREADS=1
     run_test_blas64 "BLIS64" "blis64-pthread"
+else
+    skip_variant "compilação" OpenBLAS64 BLIS64
 fi
 
 # Verificar alternativas BLAS disponíveis
@@ -241,10 +255,15 @@ if update-alternatives --list libblas.so.3-x86_64-linux-gnu > /dev/null 2>&1; th
             # TESTE 3: BLIS (usando pthread com 1 thread para single-thread)
             export BLIS_NUM_THREADS=1
             run_test_blas "BLIS" "blis-pthread"
+        else
+            skip_variant "link" BLAS ATLAS BLIS
         fi
+    else
+        skip_variant "compilação" BLAS ATLAS BLIS
     fi
 else
     echo -e "${YELLOW}⚠${NC} Alternativas BLAS não disponíveis, pulando testes"
+    skip_variant "alternativa ausente" BLAS ATLAS BLIS
 fi
 
 echo ""
@@ -283,3 +302,6 @@ done
 
 echo ""
 echo "Arquivos salvos em: $LOG_DIR/ e $OUTPUT_DIR/"
+
+# Execução completa só se nenhuma varredura falhou (senão será retomada)
+finish_run
@@ -18,6 +18,9 @@ STEP=128
 # source file
 SOURCE_FILE="teste_GSL_DGEMM.c"
 
+# funções compartilhadas (execução do harness, remedição)
+source "$(dirname "$0")/benchmark_common.sh"
+
 # Diretórios de saída (com fallback para valores padrão)
 : "${OUTPUT_DIR:=output/multi/native/alternatives/001}"
 : "${LOG_DIR:=logs/multi/native/alternatives/001}"
@@ -29,7 +32,7 @@ echo "=============================================="
 echo "  Testes Multithread - update-alternatives"
 echo "=============================================="
 echo "Parâmetros: $INITIAL_SIZE $FINAL_SIZE $STEP"
-echo "Threads: $NUM_THREADS"
+echo "Threads: $NUM_THREADS | Backends: $BACKENDS"
 echo "Output: $OUTPUT_DIR | Logs: $LOG_DIR"
 echo "=============================================="
 
@@ -45,7 +48,11 @@ compile_object_64() {
 
 link_executable_64() {
     local LIB_PATH=$1
-    gcc -o $OUTPUT_DIR/dgemm_test64 $OUTPUT_DIR/dgemm_test64.o -lgsl -lgslcblas -lm $LIB_PATH -fopenmp -export-dynamic 2>/dev/null
+    # rpath no diretório do backend: sem ele o loader resolve o soname pelo symlink
+    # de alternatives ativo e o backend executado pode não ser o da variante
+    local RPATH=""
+    [ -n "$LIB_PATH" ] && RPATH="-Wl,-rpath,$(dirname $LIB_PATH)"
+    gcc -o $OUTPUT_DIR/dgemm_test64 $OUTPUT_DIR/dgemm_test64.o -Wl,--no-as-needed -lgsl -lgslcblas -lm $LIB_PATH $RPATH -fopenmp -export-dynamic 2>/dev/null
     
     if [ $? -ne 0 ]; then
         echo -e "${RED}[ERRO]${NC} Falha no link do executável 64 bits"
@@ -67,6 +74,7 @@ run_test_blas64() {
     
     if [ -z "$ALT_PATH" ]; then
         echo -e "${RED}ERRO (alternativa não encontrada)${NC}"
+        skip_variant "alternativa ausente" $VARIANT_NAME
         return 1
     fi
     
@@ -87,6 +95,7 @@ run_test_blas64() {
     link_executable_64 "$LIB_PATH"
     if [ $? -ne 0 ]; then
         echo -e "${RED}ERRO (link)${NC}"
+        skip_variant "link" $VARIANT_NAME
         return 1
     fi
 
@@ -98,9 +107,10 @@ run_test_blas64() {
     echo "LDD Output:" >> $LDD_FILE
     echo "========================================" >> $LDD_FILE
     ldd $OUTPUT_DIR/dgemm_test64 >> $LDD_FILE 2>&1
+    record_blas_backend $VARIANT_NAME $LDD_FILE
     
     # Executar teste (suprimir output)
-    $OUTPUT_DIR/dgemm_test64 $OUTPUT_FILE $INITIAL_SIZE $FINAL_SIZE $STEP > /dev/null 2>&1
+    run_dgemm_harness $OUTPUT_DIR/dgemm_test64 $OUTPUT_FILE $VARIANT_NAME
     
     if [ $? -eq 0 ]; then
         echo -e "${GREEN}✓${NC}"
@@ -111,9 +121,17 @@ run_test_blas64() {
     fi
 }
 
+# Variantes da varredura (biblioteca x backend)
+VARIANTS=""
+for BACKEND in $BACKENDS; do
+    VARIANTS="$VARIANTS OpenBLAS64$(backend_suffix $BACKEND) BLIS64$(backend_suffix $BACKEND)"
+done
+
 # Verificar se update-alternatives está disponível
 if ! command -v update-alternatives &> /dev/null; then
     echo -e "${RED}[ERRO]${NC} update-alternatives não encontrado"
+    skip_variant "alternativa ausente" $VARIANTS
+    finish_run
     exit 1
 fi
 
@@ -132,25 +150,27 @@ if update-alternatives --list libblas64.so.3-x86_64-linux-gnu > /dev/null 2>&1;
         if [ $? -eq 0 ]; then
             echo ""
             
-            # TESTE 1: OpenBLAS64 Pthread
-            export OPENBLAS_NUM_THREADS=$NUM_THREADS
-            run_test_blas64 "OpenBLAS64Pth" "openblas64-pthread"
-            
-            # TESTE 2: OpenBLAS64 OpenMP
-            export OPENBLAS_NUM_THREADS=$NUM_THREADS
-            run_test_blas64 "OpenBLAS64Omp" "openblas64-openmp"
-            
-            # TESTE 3: BLIS64 Pthread
-            export BLIS_NUM_THREADS=$NUM_THREADS
-            run_test_blas64 "BLIS64Pth" "blis64-pthread"
-            
-            # TESTE 4: BLIS64 OpenMP
-            export BLIS_NUM_THREADS=$NUM_THREADS
-            run_test_blas64 "BLIS64Omp" "blis64-openmp"
+            for BACKEND in $BACKENDS; do
+                SUFFIX=$(backend_suffix $BACKEND)
+                export_omp_threads $BACKEND
+                
+                # OpenBLAS64 <backend>
+                export OPENBLAS_NUM_THREADS=$NUM_THREADS
+                run_test_blas64 "OpenBLAS64$SUFFIX" "openblas64-$BACKEND"
+                
+                # BLIS64 <backend>
+                export BLIS_NUM_THREADS=$NUM_THREADS
+                run_test_blas64 "BLIS64$SUFFIX" "blis64-$BACKEND"
+            done
+        else
+            skip_variant "link" $VARIANTS
         fi
+    else
+        skip_variant "compilação" $VARIANTS
     fi
 else
     echo -e "${YELLOW}⚠${NC} Alternativas BLAS64 não disponíveis"
+    skip_variant "alternativa ausente" $VARIANTS
 fi
 
 echo ""
@@ -159,7 +179,7 @@ echo "  RESUMO GERAL DOS TESTES"
 echo "=============================================="
 echo ""
 
-for variant in OpenBLAS64Pth OpenBLAS64Omp BLIS64Pth BLIS64Omp; do
+for variant in $VARIANTS; do
     DAT_FILE="$OUTPUT_DIR/output_${variant}.dat"
     if [ -f "$DAT_FILE" ]; then
         LINES=$(wc -l < "$DAT_FILE")
@@ -174,3 +194,6 @@ done
 
 echo ""
 echo "Arquivos salvos em: $LOG_DIR/ e $OUTPUT_DIR/"
+
+# Execução completa só se nenhuma varredura falhou (senão será retomada)
+finish_run
@@ -0,0 +1,191 @@
+#!/bin/bash
+
+# Script para testar todas as bibliotecas BLAS em um único processo (dlopen)
+# Sem recompilação, relink ou update-alternatives (não requer root/--privileged)
+
+# colors
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+CYAN='\033[0;36m'
+NC='\033[0m' # no color
+
+# parameters
+INITIAL_SIZE=128
+FINAL_SIZE=1024
+STEP=128
+: "${NREP:=5}"
+
+# source file
+SOURCE_FILE="teste_DLOPEN_DGEMM.c"
+
+# compilation flags
+CFLAGS="-O2 -Wall -fopenmp"
+LDFLAGS="-lgsl -lgslcblas -lm -ldl -lgomp -fopenmp"
+
+# funções compartilhadas (remedição)
+source "$(dirname "$0")/benchmark_common.sh"
+
+# Número de threads das bibliotecas (1 = single-thread)
+: "${NUM_THREADS:=1}"
+MODE="single"
+[ "$NUM_THREADS" -gt 1 ] && MODE="multi"
+
+# Diretórios de saída (com fallback para valores padrão)
+: "${OUTPUT_DIR:=output/$MODE/native/dlopen/001}"
+: "${LOG_DIR:=logs/$MODE/native/dlopen/001}"
+export OPENBLAS_NUM_THREADS=$NUM_THREADS
+export BLIS_NUM_THREADS=$NUM_THREADS
+# bibliotecas padrão são serial/pthread: runtime OpenMP do harness com 1 thread
+export OMP_NUM_THREADS=${OMP_NUM_THREADS:-1}
+
+LIBDIR=/usr/lib/x86_64-linux-gnu
+
+# Primeiro arquivo existente que casa com o padrão
+find_lib() {
+    ls $1 2>/dev/null | head -n 1
+}
+
+# Bibliotecas (Nome=caminho). Pode ser substituído via DLOPEN_LIBS="Nome=/caminho/lib.so ..."
+if [ -z "$DLOPEN_LIBS" ]; then
+    if [ "$NUM_THREADS" -gt 1 ]; then
+        OPENBLAS64_DIR="openblas64-pthread"
+    else
+        OPENBLAS64_DIR="openblas64-serial"
+    fi
+    for SPEC in "OpenBLAS64=$LIBDIR/$OPENBLAS64_DIR/libopenblas64.so*" \
+                "BLIS64=$LIBDIR/blis64-pthread/libblis64.so*" \
+                "BLAS=$LIBDIR/blas/libblas.so.3*" \
+                "ATLAS=$LIBDIR/atlas/libblas.so.3*" \
+                "BLIS=$LIBDIR/blis-pthread/libblis.so*"; do
+        LIB_PATH=$(find_lib "${SPEC#*=}")
+        [ -n "$LIB_PATH" ] && DLOPEN_LIBS="$DLOPEN_LIBS ${SPEC%%=*}=$LIB_PATH"
+    done
+fi
+
+echo "=============================================="
+echo "  Testes DGEMM via dlopen (processo único)"
+echo "=============================================="
+echo "Tamanho inicial: $INITIAL_SIZE"
+echo "Tamanho final: $FINAL_SIZE"
+echo "Incremento: $STEP"
+echo "Threads: $NUM_THREADS"
+echo "Output: $OUTPUT_DIR | Logs: $LOG_DIR"
+echo "=============================================="
+echo ""
+
+if [ -z "$DLOPEN_LIBS" ]; then
+    echo -e "${RED}[ERRO]${NC} Nenhuma biblioteca BLAS encontrada em $LIBDIR"
+    skip_variant "biblioteca ausente" OpenBLAS64 BLIS64 BLAS ATLAS BLIS
+    finish_run
+    exit 1
+fi
+
+# Criar diretórios se não existirem (para execução direta do script)
+mkdir -p "$OUTPUT_DIR" "$LOG_DIR" 2>/dev/null
+
+EXEC_NAME="$OUTPUT_DIR/dgemm_dlopen"
+# calibração do temporizador (uma linha por biblioteca/.dat em cada execução)
+export DGEMM_TIMER_FILE="$OUTPUT_DIR/timer.csv"
+
+echo -ne "${YELLOW}►${NC} Compilando harness dlopen... "
+gcc $CFLAGS $SOURCE_FILE -o $EXEC_NAME $LDFLAGS 2>/dev/null
+if [ $? -ne 0 ]; then
+    echo -e "${RED}ERRO (compilação)${NC}"
+    skip_variant "compilação" $(for SPEC in $DLOPEN_LIBS; do echo ${SPEC%%=*}; done)
+    finish_run
+    exit 1
+fi
+echo -e "${GREEN}✓${NC}"
+
+# Registrar bibliotecas carregadas
+{
+    echo "Bibliotecas carregadas via dlopen ($NUM_THREADS threads)"
+    echo "========================================"
+    for SPEC in $DLOPEN_LIBS; do
+        echo "${SPEC%%=*}: $(readlink -f ${SPEC#*=})"
+    done
+    echo ""
+    echo "LDD Output (harness):"
+    echo "========================================"
+    ldd $EXEC_NAME
+} > "$LOG_DIR/dlopen_libs.log" 2>&1
+for SPEC in $DLOPEN_LIBS; do
+    record_blas_backend ${SPEC%%=*} "$LOG_DIR/dlopen_libs.log" ${SPEC#*=}
+done
+
+# Todas as bibliotecas são medidas juntas (intercaladas); na remedição
+# os tamanhos marcados de qualquer variante são medidos para todas.
+# Na retomada, a varredura continua do menor tamanho ausente entre as bibliotecas
+# (tamanhos já medidos por outras são repetidos; a análise mantém o mais recente)
+if [ -n "$REMEASURE_FILE" ]; then
+    SIZES=$(cut -d',' -f2 "$REMEASURE_FILE" | sort -n | uniq)
+else
+    FIRST_SIZE=$((FINAL_SIZE + 1))
+    STARTED=$(ls "$OUTPUT_DIR"/output_*.dat 2>/dev/null)
+    for SPEC in $DLOPEN_LIBS; do
+        # execução retomada: biblioteca sem .dat não carregou na tentativa anterior
+        [ -n "$STARTED" ] && [ ! -f "$OUTPUT_DIR/output_${SPEC%%=*}.dat" ] && continue
+        LIB_FIRST=$(resume_first_size "$OUTPUT_DIR/output_${SPEC%%=*}.dat")
+        [ "$LIB_FIRST" -lt "$FIRST_SIZE" ] && FIRST_SIZE=$LIB_FIRST
+    done
+    SIZES=""
+    [ "$FIRST_SIZE" -le "$FINAL_SIZE" ] && SIZES="$FIRST_SIZE:$FINAL_SIZE"
+    [ -n "$SIZES" ] && [ "$FIRST_SIZE" -ne "$INITIAL_SIZE" ] && \
+        echo "dlopen,$FIRST_SIZE,$(date -Iseconds)" >> "$LOG_DIR/resume.log"
+fi
+
+echo -ne "${CYAN}►${NC} $(echo $DLOPEN_LIBS | wc -w) bibliotecas intercaladas... "
+STATUS=0
+for RANGE in $SIZES; do
+    FIRST=${RANGE%%:*}
+    LAST=${RANGE##*:}
+    $EXEC_NAME $OUTPUT_DIR $FIRST $LAST $STEP $NREP $DLOPEN_LIBS >> "$LOG_DIR/dlopen_run.log" 2>&1
+    STATUS=$?
+    # 2: nenhuma biblioteca carregada (o harness não iniciou a varredura)
+    if [ $STATUS -eq 2 ]; then
+        echo -e "${YELLOW}SKIP (nenhuma biblioteca carregada)${NC}"
+        break
+    elif [ $STATUS -ne 0 ]; then
+        echo -e "${RED}ERRO (execução)${NC}"
+        SWEEP_FAILED=1
+        break
+    fi
+    [ -n "$REMEASURE_FILE" ] && echo "dlopen,$RANGE,$(date -Iseconds)" >> "$LOG_DIR/remeasure.log"
+done
+[ $STATUS -eq 0 ] && echo -e "${GREEN}✓${NC}"
+
+# O harness cria output_<Nome>.dat só depois de carregar a biblioteca e achar
+# cblas_dgemm: as demais ficam em skipped.log, fora da conferência de finish_run
+if [ -z "$REMEASURE_FILE" ]; then
+    for SPEC in $DLOPEN_LIBS; do
+        if [ -f "$OUTPUT_DIR/output_${SPEC%%=*}.dat" ]; then
+            expect_sweep_output "$OUTPUT_DIR/output_${SPEC%%=*}.dat"
+        else
+            skip_variant "dlopen" ${SPEC%%=*}
+        fi
+    done
+fi
+
+echo ""
+echo "=============================================="
+echo "  RESUMO DOS TESTES"
+echo "=============================================="
+echo ""
+for SPEC in $DLOPEN_LIBS; do
+    variant=${SPEC%%=*}
+    DAT_FILE="$OUTPUT_DIR/output_${variant}.dat"
+    if [ -f "$DAT_FILE" ]; then
+        LINES=$(wc -l < "$DAT_FILE")
+        SIZE=$(du -h "$DAT_FILE" | cut -f1)
+        echo -e "${GREEN}✓${NC} $variant: $DAT_FILE ($LINES linhas, $SIZE)"
+    else
+        echo -e "${RED}✗${NC} $variant: Arquivo não gerado"
+    fi
+done
+
+echo ""
+echo "Arquivos salvos em: $LOG_DIR/ e $OUTPUT_DIR/"
+
+# Execução completa só se nenhuma varredura falhou (senão será retomada)
+finish_run
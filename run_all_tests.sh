@@ -14,9 +14,13 @@ STEP=128
 # source file
 SOURCE_FILE="teste_GSL_DGEMM.c"
 
+# funções compartilhadas (execução do harness, remedição)
+source "$(dirname "$0")/benchmark_common.sh"
+
 # compilation flags
 CFLAGS="-O2 -Wall -fopenmp"
-LDFLAGS="-lgsl -lgslcblas -lm -lgomp -fopenmp -export-dynamic"
+# --no-as-needed: a BLAS fica carregada mesmo sem referência direta (CALL_PATHS cblas/fortran)
+LDFLAGS="-Wl,--no-as-needed -lgsl -lgslcblas -lm -lgomp -fopenmp -export-dynamic"
 
 # Diretórios de saída (com fallback para valores padrão)
 : "${OUTPUT_DIR:=output/single/native/direct_compilation/001}"
@@ -47,6 +51,7 @@ test_blas_variant_64() {
     gcc -c $CFLAGS $SOURCE_FILE -o $OBJ_NAME 2>/dev/null
     if [ $? -ne 0 ]; then
         echo -e "${RED}ERRO (compilação)${NC}"
+        skip_variant "compilação" $VARIANT_NAME
         return 1
     fi
     
@@ -54,14 +59,16 @@ test_blas_variant_64() {
     gcc -o $EXEC_NAME $OBJ_NAME $LDFLAGS $LIB_FLAG 2>/dev/null
     if [ $? -ne 0 ]; then
         echo -e "${RED}ERRO (link)${NC}"
+        skip_variant "link" $VARIANT_NAME
         return 1
     fi
     
     # save ldd info
     ldd $EXEC_NAME > $LDD_FILE 2>&1
+    record_blas_backend $VARIANT_NAME $LDD_FILE
     
     # execute test (redirect output to suppress messages)
-    $EXEC_NAME $OUTPUT_FILE $INITIAL_SIZE $FINAL_SIZE $STEP > /dev/null 2>&1
+    run_dgemm_harness $EXEC_NAME $OUTPUT_FILE $VARIANT_NAME
     
     if [ $? -eq 0 ]; then
         echo -e "${GREEN}✓${NC}"
@@ -88,6 +95,7 @@ test_blas_variant() {
     gcc -c $CFLAGS $SOURCE_FILE -o $OBJ_NAME 2>/dev/null
     if [ $? -ne 0 ]; then
         echo -e "${RED}ERRO (compilação)${NC}"
+        skip_variant "compilação" $VARIANT_NAME
         return 1
     fi
     
@@ -95,14 +103,16 @@ test_blas_variant() {
     gcc -o $EXEC_NAME $OBJ_NAME $LDFLAGS $LIB_FLAG 2>/dev/null
     if [ $? -ne 0 ]; then
         echo -e "${RED}ERRO (link)${NC}"
+        skip_variant "link" $VARIANT_NAME
         return 1
     fi
     
     # save ldd info
     ldd $EXEC_NAME > $LDD_FILE 2>&1
+    record_blas_backend $VARIANT_NAME $LDD_FILE
     
     # execute test (redirect output to suppress messages)
-    $EXEC_NAME $OUTPUT_FILE $INITIAL_SIZE $FINAL_SIZE $STEP > /dev/null 2>&1
+    run_dgemm_harness $EXEC_NAME $OUTPUT_FILE $VARIANT_NAME
     
     if [ $? -eq 0 ]; then
         echo -e "${GREEN}✓${NC}"
@@ -191,3 +201,6 @@ done
 
 echo ""
 echo "Arquivos salvos em: $LOG_DIR/ e $OUTPUT_DIR/"
+
+# Execução completa só se nenhuma varredura falhou (senão será retomada)
+finish_run
@@ -18,9 +18,13 @@ STEP=128
 # source file
 SOURCE_FILE="teste_GSL_DGEMM.c"
 
+# funções compartilhadas (execução do harness, remedição)
+source "$(dirname "$0")/benchmark_common.sh"
+
 # compilation flags
 CFLAGS="-O2 -Wall -fopenmp"
-LDFLAGS="-lgsl -lgslcblas -lm -lgomp -fopenmp -export-dynamic"
+# --no-as-needed: a BLAS fica carregada mesmo sem referência direta (CALL_PATHS cblas/fortran)
+LDFLAGS="-Wl,--no-as-needed -lgsl -lgslcblas -lm -lgomp -fopenmp -export-dynamic"
 
 # Diretórios de saída (com fallback para valores padrão)
 : "${OUTPUT_DIR:=output/multi/native/direct_compilation/001}"
@@ -35,7 +39,7 @@ echo "=============================================="
 echo "Tamanho inicial: $INITIAL_SIZE"
 echo "Tamanho final: $FINAL_SIZE"
 echo "Incremento: $STEP"
-echo "Threads: $NUM_THREADS"
+echo "Threads: $NUM_THREADS | Backends: $BACKENDS"
 echo "Output: $OUTPUT_DIR | Logs: $LOG_DIR"
 echo "=============================================="
 echo ""
@@ -55,6 +59,7 @@ test_blas_variant_64() {
     gcc -c $CFLAGS $SOURCE_FILE -o $OBJ_NAME 2>/dev/null
     if [ $? -ne 0 ]; then
         echo -e "${RED}ERRO (compilação)${NC}"
+        skip_variant "compilação" $VARIANT_NAME
         return 1
     fi
     
@@ -62,6 +67,7 @@ test_blas_variant_64() {
     gcc -o $EXEC_NAME $OBJ_NAME $LDFLAGS $LIB_FLAG 2>/dev/null
     if [ $? -ne 0 ]; then
         echo -e "${RED}ERRO (link)${NC}"
+        skip_variant "link" $VARIANT_NAME
         return 1
     fi
     
@@ -69,9 +75,10 @@ test_blas_variant_64() {
     echo "Configuração para $VARIANT_NAME ($NUM_THREADS threads)" > $LDD_FILE
     echo "========================================" >> $LDD_FILE
     ldd $EXEC_NAME >> $LDD_FILE 2>&1
+    record_blas_backend $VARIANT_NAME $LDD_FILE
     
     # execute test (redirect output to suppress messages)
-    $EXEC_NAME $OUTPUT_FILE $INITIAL_SIZE $FINAL_SIZE $STEP > /dev/null 2>&1
+    run_dgemm_harness $EXEC_NAME $OUTPUT_FILE $VARIANT_NAME
     
     if [ $? -eq 0 ]; then
         echo -e "${GREEN}✓${NC}"
@@ -86,21 +93,34 @@ test_blas_variant_64() {
 # Criar diretórios se não existirem (para execução direta do script)
 mkdir -p "$OUTPUT_DIR" "$LOG_DIR" 2>/dev/null
 
-# TESTE 1: OpenBLAS64 Pthread
-export OPENBLAS_NUM_THREADS=$NUM_THREADS
-test_blas_variant_64 "OpenBLAS64Pth" "-L/usr/lib/x86_64-linux-gnu/openblas64-pthread -lopenblas64"
-
-# TESTE 2: OpenBLAS64 OpenMP
-export OPENBLAS_NUM_THREADS=$NUM_THREADS
-test_blas_variant_64 "OpenBLAS64Omp" "-L/usr/lib/x86_64-linux-gnu/openblas64-openmp -lopenblas64"
-
-# TESTE 3: BLIS64 Pthread
-export BLIS_NUM_THREADS=$NUM_THREADS
-test_blas_variant_64 "BLIS64Pth" "-L/usr/lib/x86_64-linux-gnu/blis64-pthread -lblis64"
-
-# TESTE 4: BLIS64 OpenMP
-export BLIS_NUM_THREADS=$NUM_THREADS
-test_blas_variant_64 "BLIS64Omp" "-L/usr/lib/x86_64-linux-gnu/blis64-openmp -lblis64"
+# Varredura biblioteca x backend; o rpath fixa o backend em tempo de execução
+# (sem ele o loader usa o libopenblas64.so.0/libblis64.so.4 do alternatives ativo)
+LIBDIR=/usr/lib/x86_64-linux-gnu
+VARIANTS=""
+for BACKEND in $BACKENDS; do
+    SUFFIX=$(backend_suffix $BACKEND)
+    export_omp_threads $BACKEND
+    
+    # OpenBLAS64 <backend>
+    export OPENBLAS_NUM_THREADS=$NUM_THREADS
+    if [ -d "$LIBDIR/openblas64-$BACKEND" ]; then
+        test_blas_variant_64 "OpenBLAS64$SUFFIX" "-L$LIBDIR/openblas64-$BACKEND -Wl,-rpath,$LIBDIR/openblas64-$BACKEND -lopenblas64"
+    else
+        echo -e "${YELLOW}►${NC} OpenBLAS64$SUFFIX... SKIP (backend não instalado)"
+        skip_variant "backend ausente" OpenBLAS64$SUFFIX
+    fi
+    
+    # BLIS64 <backend>
+    export BLIS_NUM_THREADS=$NUM_THREADS
+    if [ -d "$LIBDIR/blis64-$BACKEND" ]; then
+        test_blas_variant_64 "BLIS64$SUFFIX" "-L$LIBDIR/blis64-$BACKEND -Wl,-rpath,$LIBDIR/blis64-$BACKEND -lblis64"
+    else
+        echo -e "${YELLOW}►${NC} BLIS64$SUFFIX... SKIP (backend não instalado)"
+        skip_variant "backend ausente" BLIS64$SUFFIX
+    fi
+    
+    VARIANTS="$VARIANTS OpenBLAS64$SUFFIX BLIS64$SUFFIX"
+done
 
 echo ""
 echo "=============================================="
@@ -108,7 +128,7 @@ echo "  RESUMO DOS TESTES"
 echo "=============================================="
 echo ""
 
-for variant in OpenBLAS64Pth OpenBLAS64Omp BLIS64Pth BLIS64Omp; do
+for variant in $VARIANTS; do
     DAT_FILE="$OUTPUT_DIR/output_${variant}.dat"
     if [ -f "$DAT_FILE" ]; then
         LINES=$(wc -l < "$DAT_FILE")
@@ -123,3 +143,6 @@ done
 
 echo ""
 echo "Arquivos salvos em: $LOG_DIR/ e $OUTPUT_DIR/"
+
+# Execução completa só se nenhuma varredura falhou (senão será retomada)
+finish_run
@@ -1,7 +1,8 @@
 #!/bin/bash
 
 # Script para executar benchmarks no SO nativo e no Docker
-# Organiza os resultados em output/single/{native,docker}/{alternatives,direct_compilation}/{001,002,...}
+# Organiza os resultados em output/single/{native,<ambiente>}/{alternatives,direct_compilation}/{001,002,...}
+# Ambientes de container: RUNTIMES="docker docker_privileged ..." ou RUNTIMES=all (ver benchmark_common.sh)
 
 # Cores
 RED='\033[0;31m'
@@ -11,25 +12,8 @@ BLUE='\033[0;34m'
 CYAN='\033[0;36m'
 NC='\033[0m' # No Color
 
-# Função para obter o próximo número de execução
-get_next_run_number() {
-    local base_dir=$1
-    mkdir -p "$base_dir" 2>/dev/null
-    
-    local max_num=0
-    for dir in "$base_dir"/[0-9][0-9][0-9]; do
-        if [ -d "$dir" ]; then
-            num=$(basename "$dir")
-            # Remove leading zeros for comparison
-            num=$((10#$num))
-            if [ "$num" -gt "$max_num" ]; then
-                max_num=$num
-            fi
-        fi
-    done
-    
-    printf "%03d" $((max_num + 1))
-}
+# funções compartilhadas (identificação do host)
+source "$(dirname "$0")/benchmark_common.sh"
 
 echo "=============================================="
 echo "  meuGEMM - Benchmark Completo"
@@ -37,25 +21,63 @@ echo "  Nativo + Docker"
 echo "=============================================="
 echo ""
 
+# Ambientes de container a comparar com o nativo (RUNTIMES=all para a matriz completa)
+: "${RUNTIMES:=docker}"
+[ "$RUNTIMES" == "all" ] && RUNTIMES=$RUNTIME_ALL
+# Métodos de troca de biblioteca (dlopen: todas as variantes em um único processo)
+: "${METHODS:=direct_compilation alternatives dlopen}"
+
+# Execuções só são abertas para ambientes disponíveis (sem .in_progress órfãos)
+AVAILABLE_RUNTIMES=""
+for RUNTIME in $RUNTIMES; do
+    if ! runtime_available $RUNTIME; then
+        echo -e "${YELLOW}[AVISO]${NC} Ambiente '$RUNTIME' indisponível ($(runtime_engine $RUNTIME) ou imagem ausente)"
+        echo "Para Docker: ./docker-run.sh build | Podman: podman build -t meugemm:latest ."
+        echo "Para Apptainer: apptainer build $APPTAINER_IMAGE docker-daemon://$DOCKER_IMAGE"
+        echo "Pulando $RUNTIME..."
+        echo ""
+        continue
+    fi
+    AVAILABLE_RUNTIMES="$AVAILABLE_RUNTIMES $RUNTIME"
+done
+RUNTIMES=${AVAILABLE_RUNTIMES# }
+
 # Criar estrutura de diretórios base
 echo -e "${CYAN}[SETUP]${NC} Criando estrutura de diretórios..."
-mkdir -p output/single/native/alternatives
-mkdir -p output/single/native/direct_compilation
-mkdir -p output/single/docker/alternatives
-mkdir -p output/single/docker/direct_compilation
-mkdir -p logs/single/native/alternatives
-mkdir -p logs/single/native/direct_compilation
-mkdir -p logs/single/docker/alternatives
-mkdir -p logs/single/docker/direct_compilation
-
-# Obter números de execução para esta rodada
-RUN_NUM_NATIVE_ALT=$(get_next_run_number "output/single/native/alternatives")
-RUN_NUM_NATIVE_DIR=$(get_next_run_number "output/single/native/direct_compilation")
-RUN_NUM_DOCKER_ALT=$(get_next_run_number "output/single/docker/alternatives")
-RUN_NUM_DOCKER_DIR=$(get_next_run_number "output/single/docker/direct_compilation")
+for ENV_NAME in native $RUNTIMES; do
+    for METHOD in $METHODS; do
+        runtime_supports_method $ENV_NAME $METHOD || continue
+        mkdir -p output/single/$ENV_NAME/$METHOD
+        mkdir -p logs/single/$ENV_NAME/$METHOD
+    done
+done
+
+# Obter números de execução para esta rodada (RUN_NUM[<ambiente>/<método>])
+declare -A RUN_NUM
+RESUMED=""
+for ENV_NAME in native $RUNTIMES; do
+    for METHOD in $METHODS; do
+        runtime_supports_method $ENV_NAME $METHOD || continue
+        # Retoma a execução interrompida mais recente (RESUME=0 força uma nova)
+        RUN_NUM[$ENV_NAME/$METHOD]=$(resumable_run_number "output/single/$ENV_NAME/$METHOD")
+        if [ -n "${RUN_NUM[$ENV_NAME/$METHOD]}" ]; then
+            RESUMED="$RESUMED $ENV_NAME/$METHOD"
+        else
+            RUN_NUM[$ENV_NAME/$METHOD]=$(get_next_run_number "output/single/$ENV_NAME/$METHOD")
+        fi
+        RUN_DIR="output/single/$ENV_NAME/$METHOD/${RUN_NUM[$ENV_NAME/$METHOD]}"
+        # Identificação do host/hardware e do ambiente gravadas em cada execução
+        open_run "$RUN_DIR" 1 $ENV_NAME $METHOD
+    done
+done
 
 echo -e "${GREEN}✓${NC} Estrutura de diretórios criada"
-echo -e "${CYAN}[INFO]${NC} Números de execução: Native Alt=${RUN_NUM_NATIVE_ALT}, Native Dir=${RUN_NUM_NATIVE_DIR}, Docker Alt=${RUN_NUM_DOCKER_ALT}, Docker Dir=${RUN_NUM_DOCKER_DIR}"
+echo -e "${CYAN}[INFO]${NC} Ambientes: native $RUNTIMES"
+for KEY in "${!RUN_NUM[@]}"; do
+    STATE=""
+    [[ " $RESUMED " == *" $KEY "* ]] && STATE=" (retomada)"
+    echo -e "${CYAN}[INFO]${NC} Execução $KEY: ${RUN_NUM[$KEY]}$STATE"
+done | sort
 echo ""
 
 # =============================================
@@ -66,69 +88,46 @@ echo "  FASE 1: EXECUÇÃO NATIVA"
 echo "=============================================="
 echo ""
 
-# Executar testes nativos com linkagem direta
-echo -e "${BLUE}[NATIVE]${NC} Executando testes com linkagem direta..."
-export OUTPUT_DIR="output/single/native/direct_compilation/$RUN_NUM_NATIVE_DIR"
-export LOG_DIR="logs/single/native/direct_compilation/$RUN_NUM_NATIVE_DIR"
-mkdir -p "$OUTPUT_DIR" "$LOG_DIR"
-./run_all_tests.sh
-
-echo ""
-
-# Executar testes nativos com alternatives
-echo -e "${BLUE}[NATIVE]${NC} Executando testes com alternatives..."
-export OUTPUT_DIR="output/single/native/alternatives/$RUN_NUM_NATIVE_ALT"
-export LOG_DIR="logs/single/native/alternatives/$RUN_NUM_NATIVE_ALT"
-mkdir -p "$OUTPUT_DIR" "$LOG_DIR"
-./run_all_alternatives.sh
+# Executar testes nativos para cada método
+for METHOD in $METHODS; do
+    echo -e "${BLUE}[NATIVE]${NC} Executando testes com $METHOD..."
+    export OUTPUT_DIR="output/single/native/$METHOD/${RUN_NUM[native/$METHOD]}"
+    export LOG_DIR="logs/single/native/$METHOD/${RUN_NUM[native/$METHOD]}"
+    mkdir -p "$OUTPUT_DIR" "$LOG_DIR"
+    NUM_THREADS=1 $(method_script single $METHOD)
+    echo ""
+done
 
-echo ""
 echo -e "${GREEN}✓${NC} Testes nativos concluídos"
 echo ""
 
 # =============================================
-# EXECUÇÃO NO DOCKER
+# EXECUÇÃO NOS CONTAINERS
 # =============================================
 echo "=============================================="
-echo "  FASE 2: EXECUÇÃO NO DOCKER"
+echo "  FASE 2: EXECUÇÃO NOS CONTAINERS ($RUNTIMES)"
 echo "=============================================="
 echo ""
 
-# Verificar se Docker está instalado
-if ! command -v docker &> /dev/null; then
-    echo -e "${RED}[ERRO]${NC} Docker não está instalado!"
-    echo "Pulando execução no Docker..."
-else
-    # Verificar se a imagem existe
-    if ! docker image inspect meugemm:latest &> /dev/null; then
-        echo -e "${YELLOW}[AVISO]${NC} Imagem 'meugemm:latest' não encontrada!"
-        echo "Por favor, execute primeiro: ./docker-run.sh build"
-        echo "Ou: docker build -t meugemm:latest ."
-        echo ""
-        echo "Pulando execução no Docker..."
-    else
-        echo -e "${GREEN}✓${NC} Imagem Docker encontrada"
-        echo ""
-        
-        echo -e "${BLUE}[DOCKER]${NC} Executando testes com linkagem direta..."
-        docker run --rm \
-            -v $(pwd):/app \
-            -e OUTPUT_DIR="output/single/docker/direct_compilation/$RUN_NUM_DOCKER_DIR" \
-            -e LOG_DIR="logs/single/docker/direct_compilation/$RUN_NUM_DOCKER_DIR" \
-            meugemm:latest bash -c "mkdir -p \$OUTPUT_DIR \$LOG_DIR && ./run_all_tests.sh"
-        
-        echo ""
-        echo -e "${BLUE}[DOCKER]${NC} Executando testes com alternatives..."
-        docker run --rm --privileged \
-            -v $(pwd):/app \
-            -e OUTPUT_DIR="output/single/docker/alternatives/$RUN_NUM_DOCKER_ALT" \
-            -e LOG_DIR="logs/single/docker/alternatives/$RUN_NUM_DOCKER_ALT" \
-            meugemm:latest bash -c "mkdir -p \$OUTPUT_DIR \$LOG_DIR && ./run_all_alternatives.sh"
-        
+for RUNTIME in $RUNTIMES; do
+    for METHOD in $METHODS; do
+        if ! runtime_supports_method $RUNTIME $METHOD; then
+            echo -e "${YELLOW}[AVISO]${NC} $RUNTIME não suporta $METHOD, pulando"
+            continue
+        fi
+        SCRIPT=$(method_script single $METHOD)
+
+        echo -e "${BLUE}[$RUNTIME]${NC} Executando $METHOD ($(runtime_flags $RUNTIME $METHOD))..."
+        runtime_run $RUNTIME $METHOD \
+            "output/single/$RUNTIME/$METHOD/${RUN_NUM[$RUNTIME/$METHOD]}" \
+            "logs/single/$RUNTIME/$METHOD/${RUN_NUM[$RUNTIME/$METHOD]}" \
+            "$SCRIPT" "NUM_THREADS=1" "DTYPES=$DTYPES" "CALL_PATHS=$CALL_PATHS" "ROUTINES=$ROUTINES" \
+            "DGEMM_CLOCK=$DGEMM_CLOCK" "DGEMM_BATCH_MIN=$DGEMM_BATCH_MIN"
         echo ""
-        echo -e "${GREEN}✓${NC} Testes no Docker concluídos"
-    fi
-fi
+    done
+    echo -e "${GREEN}✓${NC} Testes em $RUNTIME concluídos"
+    echo ""
+done
 
 echo ""
 echo "=============================================="
@@ -139,42 +138,20 @@ echo ""
 echo "Estrutura de arquivos criada:"
 echo ""
 echo "output/single/"
-echo "├── native/"
-echo "│   ├── alternatives/$RUN_NUM_NATIVE_ALT/"
-for variant in BLAS64 OpenBLAS64 BLIS64 BLAS ATLAS BLIS; do
-    if [ -f "output/single/native/alternatives/$RUN_NUM_NATIVE_ALT/output_${variant}.dat" ]; then
-        echo "│   │   └── output_${variant}.dat ✓"
-    fi
-done
-echo "│   └── direct_compilation/$RUN_NUM_NATIVE_DIR/"
-for variant in BLAS64 OpenBLAS64 BLIS64 BLAS ATLAS BLIS; do
-    if [ -f "output/single/native/direct_compilation/$RUN_NUM_NATIVE_DIR/output_${variant}.dat" ]; then
-        echo "│       └── output_${variant}.dat ✓"
-    fi
-done
-echo "└── docker/"
-echo "    ├── alternatives/$RUN_NUM_DOCKER_ALT/"
-for variant in BLAS64 OpenBLAS64 BLIS64 BLAS ATLAS BLIS; do
-    if [ -f "output/single/docker/alternatives/$RUN_NUM_DOCKER_ALT/output_${variant}.dat" ]; then
-        echo "    │   └── output_${variant}.dat ✓"
-    fi
-done
-echo "    └── direct_compilation/$RUN_NUM_DOCKER_DIR/"
-for variant in BLAS64 OpenBLAS64 BLIS64 BLAS ATLAS BLIS; do
-    if [ -f "output/single/docker/direct_compilation/$RUN_NUM_DOCKER_DIR/output_${variant}.dat" ]; then
-        echo "        └── output_${variant}.dat ✓"
-    fi
+for ENV_NAME in native $RUNTIMES; do
+    echo "├── $ENV_NAME/"
+    for METHOD in $METHODS; do
+        [ -n "${RUN_NUM[$ENV_NAME/$METHOD]}" ] || continue
+        RUN_DIR="output/single/$ENV_NAME/$METHOD/${RUN_NUM[$ENV_NAME/$METHOD]}"
+        echo "│   ├── $METHOD/${RUN_NUM[$ENV_NAME/$METHOD]}/"
+        for variant in BLAS64 OpenBLAS64 BLIS64 BLAS ATLAS BLIS; do
+            if [ -f "$RUN_DIR/output_${variant}.dat" ]; then
+                echo "│   │   └── output_${variant}.dat ✓"
+            fi
+        done
+    done
 done
 
-echo ""
-echo "logs/single/"
-echo "├── native/"
-echo "│   ├── alternatives/$RUN_NUM_NATIVE_ALT/"
-echo "│   └── direct_compilation/$RUN_NUM_NATIVE_DIR/"
-echo "└── docker/"
-echo "    ├── alternatives/$RUN_NUM_DOCKER_ALT/"
-echo "    └── direct_compilation/$RUN_NUM_DOCKER_DIR/"
-
 echo ""
 
 # =============================================
@@ -186,7 +163,7 @@ echo "=============================================="
 echo ""
 
 echo -e "${CYAN}[INFO]${NC} Executando benchmarks multithread..."
-./run_benchmarks_multithread.sh
+RUNTIMES="$RUNTIMES" ./run_benchmarks_multithread.sh
 
 echo ""
 echo "=============================================="
@@ -196,16 +173,12 @@ echo ""
 echo "Estrutura completa de resultados:"
 echo ""
 echo "1. Single-thread (output/single/):"
-echo "   - native/alternatives/$RUN_NUM_NATIVE_ALT/"
-echo "   - native/direct_compilation/$RUN_NUM_NATIVE_DIR/"
-echo "   - docker/alternatives/$RUN_NUM_DOCKER_ALT/"
-echo "   - docker/direct_compilation/$RUN_NUM_DOCKER_DIR/"
+for KEY in "${!RUN_NUM[@]}"; do
+    echo "   - $KEY/${RUN_NUM[$KEY]}/"
+done | sort
 echo ""
 echo "2. Multithread (output/multi/):"
-echo "   - native/alternatives/{run_number}/"
-echo "   - native/direct_compilation/{run_number}/"
-echo "   - docker/alternatives/{run_number}/"
-echo "   - docker/direct_compilation/{run_number}/"
+echo "   - {native,$(echo $RUNTIMES | tr ' ' ',')}/{alternatives,direct_compilation}/{run_number}/"
 echo ""
 echo -e "${GREEN}Todos os benchmarks finalizados com sucesso!${NC}"
 echo ""
@@ -0,0 +1,150 @@
+#!/bin/bash
+
+# Script para medir throughput sob contenção: K execuções DGEMM simultâneas por nó
+# Organiza os resultados em output/contention/{native,<ambiente>}/{pinned,unpinned}/{001,002,...}
+#
+# Variáveis:
+#   CONCURRENCY - níveis de concorrência K (padrão: "1 2 4 8")
+#   SIZES       - tamanhos de matriz, um por rodada (padrão: "512 1024")
+#   NREP        - repetições por job (padrão: 20)
+#   PIN         - 1 = cada job fixado em uma CPU (taskset), 0 = livre
+#   RUNTIMES    - ambientes de container (ver benchmark_common.sh)
+#
+# Cada job grava uma amostra por repetição (DGEMM_SAMPLES_FILE) e todos partem
+# do mesmo instante (DGEMM_START_AT), para que a partida dos containers não
+# reduza a sobreposição entre os jobs.
+
+# Cores
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+BLUE='\033[0;34m'
+CYAN='\033[0;36m'
+NC='\033[0m' # No Color
+
+# funções compartilhadas (ambientes de container, identificação do host)
+source "$(dirname "$0")/benchmark_common.sh"
+
+: "${CONCURRENCY:=1 2 4 8}"
+: "${SIZES:=512 1024}"
+: "${NREP:=20}"
+: "${PIN:=1}"
+: "${RUNTIMES:=docker}"
+[ "$RUNTIMES" == "all" ] && RUNTIMES=$RUNTIME_ALL
+
+# Um job = um processo single-thread (a contenção vem dos K processos, não das threads da BLAS)
+VARIANT="OpenBLAS64"
+SOURCE_FILE="teste_GSL_DGEMM.c"
+CFLAGS="-O2 -Wall -fopenmp"
+LDFLAGS="-lgsl -lgslcblas -lm -lgomp -fopenmp -export-dynamic -lopenblas64"
+JOB_ENV="OPENBLAS_NUM_THREADS=1 OMP_NUM_THREADS=1"
+
+PLACEMENT="unpinned"
+[ "$PIN" == "1" ] && PLACEMENT="pinned"
+
+# Antecedência da partida comum (containers levam alguns segundos para iniciar)
+START_DELAY_NATIVE=1
+START_DELAY_CONTAINER=10
+
+# Comando de um job (caminhos relativos: válidos no host e em /app no container)
+# Uso: job_command <exec> <K> <N> <job>
+job_command() {
+    local EXEC_NAME=$1
+    local K=$2
+    local N=$3
+    local J=$4
+    local PREFIX=""
+    [ "$PIN" == "1" ] && PREFIX="taskset -c $(( J % $(nproc) ))"
+    echo "$PREFIX $EXEC_NAME $OUTPUT_DIR/K${K}_N${N}_job${J}.dat $N $N 1 $NREP"
+}
+
+# Executa uma rodada (K jobs simultâneos de tamanho N) em um ambiente
+run_round() {
+    local ENV_NAME=$1
+    local EXEC_NAME=$2
+    local K=$3
+    local N=$4
+    local DELAY=$START_DELAY_NATIVE
+    [ "$ENV_NAME" != "native" ] && DELAY=$START_DELAY_CONTAINER
+    local START_AT=$(( $(date +%s) + DELAY ))
+    local J
+
+    for J in $(seq 0 $((K - 1))); do
+        local SAMPLES="$OUTPUT_DIR/K${K}_N${N}_job${J}_samples.csv"
+        local JOB_LOG="$LOG_DIR/K${K}_N${N}_job${J}.log"
+        if [ "$ENV_NAME" == "native" ]; then
+            env $JOB_ENV DGEMM_SAMPLES_FILE=$SAMPLES DGEMM_START_AT=$START_AT \
+                $(job_command $EXEC_NAME $K $N $J) > "$JOB_LOG" 2>&1 &
+        else
+            runtime_run $ENV_NAME direct_compilation "$OUTPUT_DIR" "$LOG_DIR" \
+                "$(job_command $EXEC_NAME $K $N $J)" \
+                $JOB_ENV "DGEMM_SAMPLES_FILE=$SAMPLES" "DGEMM_START_AT=$START_AT" > "$JOB_LOG" 2>&1 &
+        fi
+    done
+    wait
+}
+
+echo "=============================================="
+echo "  meuGEMM - Throughput sob Contenção"
+echo "=============================================="
+echo "Concorrência (K): $CONCURRENCY"
+echo "Tamanhos: $SIZES | Repetições por job: $NREP"
+echo "Posicionamento: $PLACEMENT | CPUs: $(nproc)"
+echo "Ambientes: native $RUNTIMES"
+echo "=============================================="
+echo ""
+
+for ENV_NAME in native $RUNTIMES; do
+    if [ "$ENV_NAME" != "native" ] && ! runtime_available $ENV_NAME; then
+        echo -e "${YELLOW}[AVISO]${NC} Ambiente '$ENV_NAME' indisponível, pulando"
+        echo ""
+        continue
+    fi
+
+    RUN_NUM=$(get_next_run_number "output/contention/$ENV_NAME/$PLACEMENT")
+    export OUTPUT_DIR="output/contention/$ENV_NAME/$PLACEMENT/$RUN_NUM"
+    export LOG_DIR="logs/contention/$ENV_NAME/$PLACEMENT/$RUN_NUM"
+    mkdir -p "$OUTPUT_DIR" "$LOG_DIR"
+
+    write_host_fingerprint "$OUTPUT_DIR" 1
+    write_runtime_info "$OUTPUT_DIR" $ENV_NAME direct_compilation
+    {
+        echo "variant=\"$VARIANT\""
+        echo "placement=\"$PLACEMENT\""
+        echo "concurrency=\"$CONCURRENCY\""
+        echo "sizes=\"$SIZES\""
+        echo "nrep=\"$NREP\""
+    } > "$OUTPUT_DIR/contention.env"
+
+    # Compilar o harness no próprio ambiente (bibliotecas da imagem no container)
+    EXEC_NAME="$OUTPUT_DIR/dgemm_contention"
+    COMPILE="gcc $CFLAGS $SOURCE_FILE -o $EXEC_NAME $LDFLAGS"
+    echo -ne "${BLUE}[$ENV_NAME]${NC} Compilando harness ($VARIANT)... "
+    if [ "$ENV_NAME" == "native" ]; then
+        $COMPILE > "$LOG_DIR/compile.log" 2>&1
+    else
+        runtime_run $ENV_NAME direct_compilation "$OUTPUT_DIR" "$LOG_DIR" "$COMPILE" > "$LOG_DIR/compile.log" 2>&1
+    fi
+    if [ $? -ne 0 ]; then
+        echo -e "${RED}ERRO (compilação)${NC}"
+        continue
+    fi
+    echo -e "${GREEN}✓${NC}"
+
+    for N in $SIZES; do
+        for K in $CONCURRENCY; do
+            echo -ne "${CYAN}►${NC} N=$N, K=$K jobs... "
+            run_round $ENV_NAME $EXEC_NAME $K $N
+            DONE=$(ls "$OUTPUT_DIR"/K${K}_N${N}_job*_samples.csv 2>/dev/null | wc -l)
+            if [ "$DONE" -eq "$K" ]; then
+                echo -e "${GREEN}✓${NC}"
+            else
+                echo -e "${YELLOW}$DONE/$K jobs com amostras${NC}"
+            fi
+        done
+    done
+    echo -e "${GREEN}✓${NC} $ENV_NAME: $OUTPUT_DIR"
+    echo ""
+done
+
+echo "Análise: python3 analysis_benchmark_hpc.py (seção de throughput sob contenção)"
@@ -0,0 +1,145 @@
+#!/bin/bash
+
+# Script para medir a latência fim a fim de jobs DGEMM curtos (partida do container,
+# carga da BLAS, criação do pool de threads), no SO nativo e nos containers
+# Organiza os resultados em output/latency/{native,<ambiente>}/direct_compilation/{001,002,...}
+#
+# Variáveis:
+#   VARIANTS    - bibliotecas medidas (padrão: "OpenBLAS64 BLIS64")
+#   SIZE        - tamanho da matriz de cada job (padrão: 256)
+#   NREP        - DGEMMs por job (padrão: 5)
+#   JOBS        - jobs (partidas a frio) por variante (padrão: 10)
+#   NUM_THREADS - threads da BLAS (padrão: 1)
+#   RUNTIMES    - ambientes de container (ver benchmark_common.sh)
+#
+# Cada job grava os instantes das fases em <variante>_job<j>_phases.csv (fase,epoch):
+#   launch, returned                    - gravados por este script, antes e depois do comando
+#   process_start, library_loaded,
+#   first_dgemm_start, first_dgemm_done,
+#   exit                                - gravados pelo harness (DGEMM_PHASES_FILE)
+
+# Cores
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+BLUE='\033[0;34m'
+CYAN='\033[0;36m'
+NC='\033[0m' # No Color
+
+# funções compartilhadas (ambientes de container, identificação do host)
+source "$(dirname "$0")/benchmark_common.sh"
+
+: "${VARIANTS:=OpenBLAS64 BLIS64}"
+: "${SIZE:=256}"
+: "${NREP:=5}"
+: "${JOBS:=10}"
+: "${NUM_THREADS:=1}"
+: "${RUNTIMES:=docker}"
+[ "$RUNTIMES" == "all" ] && RUNTIMES=$RUNTIME_ALL
+
+SOURCE_FILE="teste_GSL_DGEMM.c"
+CFLAGS="-O2 -Wall -fopenmp"
+LDFLAGS="-lgsl -lgslcblas -lm -lgomp -fopenmp -export-dynamic"
+JOB_ENV="OPENBLAS_NUM_THREADS=$NUM_THREADS BLIS_NUM_THREADS=$NUM_THREADS OMP_NUM_THREADS=1"
+
+# Flag de link de cada variante
+variant_lib_flag() {
+    case $1 in
+        OpenBLAS64) echo "-lopenblas64" ;;
+        BLIS64) echo "-lblis64" ;;
+        BLAS) echo "-lblas" ;;
+        BLIS) echo "-lblis" ;;
+        ATLAS) echo "-L/usr/lib/x86_64-linux-gnu/atlas -lblas" ;;
+    esac
+}
+
+# Instante atual (epoch, ns) para as fases gravadas pelo script
+now() {
+    date +%s.%N
+}
+
+# Executa um job e grava launch/returned em volta do processo (ou do container)
+# Uso: run_job <ambiente> <variante> <job>
+run_job() {
+    local ENV_NAME=$1
+    local VARIANT=$2
+    local J=$3
+    local PHASES="$OUTPUT_DIR/${VARIANT}_job${J}_phases.csv"
+    local JOB_LOG="$LOG_DIR/${VARIANT}_job${J}.log"
+    # caminhos relativos: válidos no host e em /app no container
+    local CMD="$OUTPUT_DIR/dgemm_latency_$VARIANT $OUTPUT_DIR/output_${VARIANT}.dat $SIZE $SIZE 1 $NREP"
+
+    echo "launch,$(now)" > "$PHASES"
+    if [ "$ENV_NAME" == "native" ]; then
+        env $JOB_ENV DGEMM_PHASES_FILE=$PHASES $CMD > "$JOB_LOG" 2>&1
+    else
+        runtime_run $ENV_NAME direct_compilation "$OUTPUT_DIR" "$LOG_DIR" "$CMD" \
+            $JOB_ENV "DGEMM_PHASES_FILE=$PHASES" > "$JOB_LOG" 2>&1
+    fi
+    local STATUS=$?
+    echo "returned,$(now)" >> "$PHASES"
+    return $STATUS
+}
+
+echo "=============================================="
+echo "  meuGEMM - Latência Fim a Fim por Job"
+echo "=============================================="
+echo "Variantes: $VARIANTS"
+echo "Tamanho: $SIZE | DGEMMs por job: $NREP | Jobs por variante: $JOBS"
+echo "Threads: $NUM_THREADS"
+echo "Ambientes: native $RUNTIMES"
+echo "=============================================="
+echo ""
+
+for ENV_NAME in native $RUNTIMES; do
+    if [ "$ENV_NAME" != "native" ] && ! runtime_available $ENV_NAME; then
+        echo -e "${YELLOW}[AVISO]${NC} Ambiente '$ENV_NAME' indisponível, pulando"
+        echo ""
+        continue
+    fi
+
+    RUN_NUM=$(get_next_run_number "output/latency/$ENV_NAME/direct_compilation")
+    export OUTPUT_DIR="output/latency/$ENV_NAME/direct_compilation/$RUN_NUM"
+    export LOG_DIR="logs/latency/$ENV_NAME/direct_compilation/$RUN_NUM"
+    mkdir -p "$OUTPUT_DIR" "$LOG_DIR"
+
+    write_host_fingerprint "$OUTPUT_DIR" $NUM_THREADS
+    write_runtime_info "$OUTPUT_DIR" $ENV_NAME direct_compilation
+    {
+        echo "variants=\"$VARIANTS\""
+        echo "size=\"$SIZE\""
+        echo "nrep=\"$NREP\""
+        echo "jobs=\"$JOBS\""
+    } > "$OUTPUT_DIR/latency.env"
+
+    for VARIANT in $VARIANTS; do
+        # Compilar no próprio ambiente (bibliotecas da imagem no container)
+        EXEC_NAME="$OUTPUT_DIR/dgemm_latency_$VARIANT"
+        COMPILE="gcc $CFLAGS $SOURCE_FILE -o $EXEC_NAME $LDFLAGS $(variant_lib_flag $VARIANT)"
+        echo -ne "${BLUE}[$ENV_NAME]${NC} $VARIANT: compilando... "
+        if [ "$ENV_NAME" == "native" ]; then
+            $COMPILE > "$LOG_DIR/compile_$VARIANT.log" 2>&1
+        else
+            runtime_run $ENV_NAME direct_compilation "$OUTPUT_DIR" "$LOG_DIR" "$COMPILE" > "$LOG_DIR/compile_$VARIANT.log" 2>&1
+        fi
+        if [ $? -ne 0 ]; then
+            echo -e "${RED}ERRO (compilação)${NC}"
+            continue
+        fi
+
+        echo -ne "$JOBS jobs... "
+        FAILED=0
+        for J in $(seq 1 $JOBS); do
+            run_job $ENV_NAME $VARIANT $J || FAILED=$((FAILED + 1))
+        done
+        if [ "$FAILED" -eq 0 ]; then
+            echo -e "${GREEN}✓${NC}"
+        else
+            echo -e "${YELLOW}$FAILED/$JOBS jobs com erro${NC}"
+        fi
+    done
+    echo -e "${GREEN}✓${NC} $ENV_NAME: $OUTPUT_DIR"
+    echo ""
+done
+
+echo "Análise: python3 analysis_benchmark_hpc.py (seção de latência fim a fim)"
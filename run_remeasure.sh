@@ -0,0 +1,69 @@
+#!/bin/bash
+
+# Script para remedir apenas os pontos instáveis apontados pela análise
+# Uso: ./run_remeasure.sh [output/remeasure_single.csv]
+#
+# O CSV é gerado por analysis_benchmark_hpc.py (seção de estabilidade) com as colunas:
+# threading_mode,environment,method,run,variant,matSize,cv_pct,spread_pct,skew,kurtosis,reasons
+# As novas medições são anexadas ao output_<variant>.dat da mesma execução;
+# o carregador da análise mantém a medição mais recente de cada tamanho.
+
+# Cores
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+BLUE='\033[0;34m'
+CYAN='\033[0;36m'
+NC='\033[0m' # No Color
+
+# funções compartilhadas (ambientes de container)
+source "$(dirname "$0")/benchmark_common.sh"
+
+REMEASURE_CSV=${1:-output/remeasure_single.csv}
+
+if [ ! -f "$REMEASURE_CSV" ]; then
+    echo -e "${RED}[ERRO]${NC} Lista de remedição não encontrada: $REMEASURE_CSV"
+    echo "Execute primeiro: python3 analysis_benchmark_hpc.py"
+    exit 1
+fi
+
+echo "=============================================="
+echo "  meuGEMM - Remedição de Pontos Instáveis"
+echo "=============================================="
+echo "Lista: $REMEASURE_CSV ($(($(wc -l < "$REMEASURE_CSV") - 1)) pontos)"
+echo ""
+
+# Um grupo por execução (modo, ambiente, método, número da execução)
+GROUPS_LIST=$(tail -n +2 "$REMEASURE_CSV" | awk -F',' '{print $1","$2","$3","$4}' | sort -u)
+
+for GROUP in $GROUPS_LIST; do
+    IFS=',' read -r MODE ENV METHOD RUN <<< "$GROUP"
+
+    OUTPUT_DIR="output/$MODE/$ENV/$METHOD/$RUN"
+    LOG_DIR="logs/$MODE/$ENV/$METHOD/$RUN"
+    mkdir -p "$OUTPUT_DIR" "$LOG_DIR"
+
+    # Pontos deste grupo no formato esperado pelo benchmark_common.sh (variant,matSize)
+    POINTS_FILE="$LOG_DIR/remeasure_points.csv"
+    tail -n +2 "$REMEASURE_CSV" | awk -F',' -v g="$GROUP" '$1","$2","$3","$4 == g {print $5","$6}' > "$POINTS_FILE"
+
+    SCRIPT=$(method_script "$MODE" "$METHOD")
+    # Mesmo número de threads da execução original (host.env)
+    THREADS=$(. "$OUTPUT_DIR/host.env" 2>/dev/null; echo "$bench_threads")
+    [ -z "$THREADS" ] && THREADS=1 && [ "$MODE" == "multi" ] && THREADS=4
+    echo -e "${BLUE}[$ENV]${NC} $MODE/$METHOD/$RUN: $(wc -l < "$POINTS_FILE") pontos"
+
+    if [ "$ENV" == "native" ]; then
+        OUTPUT_DIR="$OUTPUT_DIR" LOG_DIR="$LOG_DIR" NUM_THREADS="$THREADS" REMEASURE_FILE="$POINTS_FILE" $SCRIPT
+    elif runtime_available "$ENV"; then
+        runtime_run "$ENV" "$METHOD" "$OUTPUT_DIR" "$LOG_DIR" "$SCRIPT" "NUM_THREADS=$THREADS" "REMEASURE_FILE=$POINTS_FILE" \
+            "DTYPES=$DTYPES" "CALL_PATHS=$CALL_PATHS" "ROUTINES=$ROUTINES" "DGEMM_CLOCK=$DGEMM_CLOCK" "DGEMM_BATCH_MIN=$DGEMM_BATCH_MIN"
+    else
+        echo -e "${YELLOW}[AVISO]${NC} Ambiente '$ENV' indisponível, pulando $GROUP"
+        continue
+    fi
+    echo ""
+done
+
+echo -e "${GREEN}✓${NC} Remedição concluída"
+echo "Execute novamente a análise para verificar a estabilidade: python3 analysis_benchmark_hpc.py"
@@ -0,0 +1,55 @@
+#!/bin/bash
+
+# Script de teste: comparação entre hosts (--hosts) em árvores sem host.env
+# (resultados anteriores ao fingerprint do host)
+
+# Cores
+GREEN='\033[0;32m'
+RED='\033[0;31m'
+CYAN='\033[0;36m'
+NC='\033[0m'
+
+cd "$(dirname "$0")"
+
+echo -e "${CYAN}========================================${NC}"
+echo -e "${CYAN}Teste de --hosts sem host.env${NC}"
+echo -e "${CYAN}========================================${NC}"
+echo ""
+
+TEST_DIR="test_output_legacy_hosts"
+rm -rf "$TEST_DIR" 2>/dev/null
+FAILED=0
+
+echo -e "${CYAN}[PREPARAÇÃO]${NC} Gerando duas árvores sintéticas e removendo host.env"
+python3 generate_synthetic_results.py --out "$TEST_DIR/hostA" --runs 1 --sizes 8 > /dev/null
+python3 generate_synthetic_results.py --out "$TEST_DIR/hostB" --runs 1 --sizes 8 --seed 2 > /dev/null
+find "$TEST_DIR" -name host.env -delete
+echo ""
+
+echo -e "${CYAN}[TESTE 1]${NC} Análise termina sem erro"
+OUT=$(python3 analysis_benchmark_hpc.py --hosts "$TEST_DIR/hostA" "$TEST_DIR/hostB" 2>&1)
+if [ $? -eq 0 ]; then
+    echo -e "${GREEN}✓ PASSOU${NC}"
+else
+    echo -e "${RED}✗ FALHOU${NC}"
+    echo "$OUT" | tail -5
+    FAILED=1
+fi
+echo ""
+
+echo -e "${CYAN}[TESTE 2]${NC} Hosts identificados pelo nome do diretório"
+if echo "$OUT" | grep -q "^hostA " && echo "$OUT" | grep -q "^hostB "; then
+    echo -e "${GREEN}✓ PASSOU${NC} - hostA e hostB na tabela"
+else
+    echo -e "${RED}✗ FALHOU${NC} - hostA/hostB ausentes da tabela"
+    FAILED=1
+fi
+echo ""
+
+# Limpar
+echo -e "${CYAN}[LIMPEZA]${NC} Removendo diretório de teste..."
+rm -rf "$TEST_DIR"
+echo -e "${GREEN}✓ Concluído${NC}"
+echo ""
+
+exit $FAILED
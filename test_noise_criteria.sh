@@ -0,0 +1,71 @@
+#!/bin/bash
+
+# Script de teste: critérios de estabilidade (seção 6) com as estatísticas
+# gravadas pelo harness (gsl_rstat: assimetria e curtose amostrais, não corrigidas)
+
+# Cores
+GREEN='\033[0;32m'
+RED='\033[0;31m'
+CYAN='\033[0;36m'
+NC='\033[0m'
+
+cd "$(dirname "$0")"
+
+echo -e "${CYAN}========================================${NC}"
+echo -e "${CYAN}Teste dos critérios de medição instável${NC}"
+echo -e "${CYAN}========================================${NC}"
+echo ""
+
+FAILED=0
+
+# Motivos de classify_measurement_noise para uma linha com os tempos dados
+reasons() {
+    python3 - "$@" <<'EOF'
+import sys
+import numpy as np
+from analysis_benchmark_hpc import classify_measurement_noise
+
+t = np.array([float(x) for x in sys.argv[1:]])
+d = t - t.mean()
+m2, m3, m4 = (d ** 2).sum(), (d ** 3).sum(), (d ** 4).sum()
+n = len(t)
+row = {'Mean': t.mean(), 'Median': np.median(t), 'SD': t.std(ddof=1),
+       'Largest': t.min(), 'Smallest': t.max(),
+       'Skew': np.sqrt(n) * m3 / m2 ** 1.5, 'Kurtosis': n * m4 / m2 ** 2 - 3}
+print('; '.join(classify_measurement_noise(row, nrep=n)[1]))
+EOF
+}
+
+echo -e "${CYAN}[TESTE 1]${NC} n=5 com um outlier de 1% (CV e amplitude abaixo dos limites)"
+OUT=$(reasons 1.0 1.0 1.0 1.0 1.01)
+echo "  Motivos: $OUT"
+if [[ "$OUT" == *"assimetria"* ]] && [[ "$OUT" != *"curtose"* ]]; then
+    echo -e "${GREEN}✓ PASSOU${NC} - marcado pela assimetria (curtose máxima com n=5: 0.25)"
+else
+    echo -e "${RED}✗ FALHOU${NC}"
+    FAILED=1
+fi
+echo ""
+
+echo -e "${CYAN}[TESTE 2]${NC} n=20 com um outlier de 1%: curtose avaliada"
+OUT=$(reasons $(printf '1.0 %.0s' $(seq 19)) 1.01)
+echo "  Motivos: $OUT"
+if [[ "$OUT" == *"curtose"* ]]; then
+    echo -e "${GREEN}✓ PASSOU${NC}"
+else
+    echo -e "${RED}✗ FALHOU${NC}"
+    FAILED=1
+fi
+echo ""
+
+echo -e "${CYAN}[TESTE 3]${NC} n=5 sem outlier: estável"
+OUT=$(reasons 1.000 1.001 0.999 1.000 1.001)
+if [ -z "$OUT" ]; then
+    echo -e "${GREEN}✓ PASSOU${NC}"
+else
+    echo -e "${RED}✗ FALHOU${NC} - $OUT"
+    FAILED=1
+fi
+echo ""
+
+exit $FAILED
@@ -8,25 +8,8 @@ RED='\033[0;31m'
 CYAN='\033[0;36m'
 NC='\033[0m'
 
-# Função para obter o próximo número de execução
-get_next_run_number() {
-    local base_dir=$1
-    mkdir -p "$base_dir" 2>/dev/null
-    
-    local max_num=0
-    for dir in "$base_dir"/[0-9][0-9][0-9]; do
-        if [ -d "$dir" ]; then
-            num=$(basename "$dir")
-            # Remove leading zeros for comparison
-            num=$((10#$num))
-            if [ "$num" -gt "$max_num" ]; then
-                max_num=$num
-            fi
-        fi
-    done
-    
-    printf "%03d" $((max_num + 1))
-}
+# função testada (compartilhada pelos runners)
+source "$(dirname "$0")/benchmark_common.sh"
 
 echo -e "${CYAN}========================================${NC}"
 echo -e "${CYAN}Teste da função get_next_run_number()${NC}"
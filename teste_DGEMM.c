@@ -3,6 +3,7 @@
 #include <gsl/gsl_blas.h>
 #include <gsl/gsl_rstat.h>
 #include <omp.h>
+#include "flop_model.h"
 
 #define FSIZE 1024
 #define ISIZE 32
@@ -92,7 +93,7 @@ int main( int argc, char** argv ){
 			gsl_rstat_add(dt, rstat_t); // stat dt
 		}
 		// calc problem size in GFLOP
-		gflop = (2.0*matSize + 2)*matSize*matSize*0.000000001;
+		gflop = gemm_gflop(matSize, matSize, matSize, alpha, beta);
 		// output
 		printf("_______________________________________\n");
 		printf("Matrix Size: %d\n", matSize);
@@ -112,7 +113,7 @@ int main( int argc, char** argv ){
 		// col 0
 		fprintf(desemp, "%d, ", matSize);
 		// col 1
-		fprintf(desemp, " %.4lf, ", gflop);
+		fprintf(desemp, " %.9lf, ", gflop);
 		// col 2
 		fprintf(desemp, " %.4lf,", gsl_rstat_mean(rstat_t));
 		// col 3
@@ -0,0 +1,257 @@
+#define _GNU_SOURCE
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <stdint.h>
+#include <dlfcn.h>
+#include <gsl/gsl_rstat.h>
+#include <omp.h>
+#include "flop_model.h"
+#include "dgemm_timer.h"
+
+/*
+ * Harness DGEMM com troca de biblioteca em tempo de execucao (dlopen)
+ *
+ * Carrega cada BLAS explicitamente e mede todas no mesmo processo, com as
+ * mesmas matrizes, intercalando as bibliotecas a cada repeticao (a ordem
+ * gira a cada repeticao para cancelar deriva termica/temporal).
+ * Dispensa recompilacao, relink e update-alternatives.
+ * Temporizador calibrado como em teste_GSL_DGEMM.c (dgemm_timer.h): chamadas
+ * curtas sao medidas em lotes (lote por biblioteca, coluna Batch) e a
+ * calibracao vai para DGEMM_TIMER_FILE, uma linha por .dat.
+ *
+ * Uso: dgemm_dlopen <dir_saida> <iSize> <fSize> <step> <nrep> Nome=/caminho/lib.so [...]
+ * Saida: <dir_saida>/output_<Nome>.dat (mesmo formato de teste_GSL_DGEMM.c), criado
+ * apenas para as bibliotecas carregadas; codigo de saida 2 se nenhuma carregar
+ */
+
+#define FSIZE 1024
+#define ISIZE 32
+#define STEP 32
+#define NREP 5
+#define MAXLIBS 16
+
+// enums CBLAS (cblas.h)
+#define CBLAS_ROW_MAJOR 101
+#define CBLAS_NO_TRANS 111
+
+typedef void (*dgemm_lp64_t)(int, int, int, int, int, int, double,
+	const double*, int, const double*, int, double, double*, int);
+typedef void (*dgemm_ilp64_t)(int, int, int, int64_t, int64_t, int64_t, double,
+	const double*, int64_t, const double*, int64_t, double, double*, int64_t);
+
+typedef struct{
+	char name[64];
+	char path[512];
+	char file[1024];           // output_<Nome>.dat
+	void *handle;
+	dgemm_lp64_t dgemm;        // cblas_dgemm (inteiros de 32 bits)
+	dgemm_ilp64_t dgemm64;     // cblas_dgemm64_ (inteiros de 64 bits, Debian *64)
+	FILE *desemp;
+	int newFile;
+	int batchCols;             // coluna Batch (arquivo novo ou cabeçalho com Batch)
+	int batch;                 // chamadas por medição no tamanho atual
+	gsl_rstat_workspace *rstat_t;
+} blasLib;
+
+double numGenerator(double min, double max);
+int loadLib(blasLib *lib, const char *spec, const char *outDir);
+void callDgemm(blasLib *lib, int n, double alpha, const double *A, const double *B, double beta, double *C);
+
+int main( int argc, char** argv ){
+
+	int i, k, l, b;
+
+	int matSize;
+	double start, stop, dt;
+	double gflop;
+
+	double alpha, beta;
+
+	int fSize, iSize, step, nrep;
+	int nlibs = 0;
+	blasLib libs[MAXLIBS];
+	dgemmTimer timer;
+
+	if(argc < 7){
+		fprintf(stderr, "Uso: %s <dir_saida> <iSize> <fSize> <step> <nrep> Nome=/caminho/lib.so [...]\n", argv[0]);
+		return 1;
+	}
+	iSize = atoi(argv[2]);
+	fSize = atoi(argv[3]);
+	step = atoi(argv[4]);
+	nrep = atoi(argv[5]);
+	if(iSize <= 0) iSize = ISIZE;
+	if(fSize <= 0) fSize = FSIZE;
+	if(step <= 0) step = STEP;
+	if(nrep <= 0) nrep = NREP;
+	// load all libraries up front
+	for (i = 6; i < argc && nlibs < MAXLIBS; i++){
+		if (loadLib(&libs[nlibs], argv[i], argv[1]) == 0)
+			nlibs++;
+	}
+	if (nlibs == 0){
+		fprintf(stderr, "Nenhuma biblioteca carregada\n");
+		return 2;
+	}
+	// timer resolution and read overhead (saved to DGEMM_TIMER_FILE, one line per .dat)
+	timerCalibrate(&timer);
+	for (l = 0; l < nlibs; l++)
+		timerSave(&timer, libs[l].file);
+	printf("Timer: %s | resolution %.3le s | overhead %.3le s | batch below %.3le s\n",
+		timer.raw ? "CLOCK_MONOTONIC_RAW" : "omp_get_wtime", timer.resolution, timer.overhead, timer.batchMin);
+	// Intro
+	printf("DLOPEN_DGEMM test: %d, %d, ... (+%d)..., %d, %d | %d bibliotecas\n", iSize, iSize + step, step, fSize - step, fSize, nlibs);
+	for (l = 0; l < nlibs; l++)
+		printf("  %s: %s (%s)\n", libs[l].name, libs[l].path, libs[l].dgemm64 ? "cblas_dgemm64_" : "cblas_dgemm");
+	// Set constants
+	alpha = 1.0;
+	beta = 0.5;
+	// Set random seed
+	srand(1234567890);
+	// Main loop (for all mat sizes)
+	matSize = iSize;
+	while (matSize <= fSize){
+		size_t nn = (size_t)matSize*matSize;
+		double *A = malloc(nn*sizeof(double));
+		double *B = malloc(nn*sizeof(double));
+		double *C0 = malloc(nn*sizeof(double));
+		double *C = malloc(nn*sizeof(double));
+		// same matrices for every library
+		for (i = 0; i < (int)nn; i++){
+			A[i] = numGenerator(-1.0, 1.0);
+			B[i] = numGenerator(-4.0, 4.0);
+			C0[i] = numGenerator(0.0, 1.0);
+		}
+		// probe call per library (untimed warm-up): calls shorter than timer.batchMin are timed in batches
+		for (l = 0; l < nlibs; l++){
+			libs[l].rstat_t = gsl_rstat_alloc();
+			memcpy(C, C0, nn*sizeof(double));
+			start = timerNow(&timer);
+			callDgemm(&libs[l], matSize, alpha, A, B, beta, C);
+			stop = timerNow(&timer);
+			libs[l].batch = timerBatch(&timer, stop - start);
+		}
+		// test loop: libraries interleaved, order rotated each repetition
+		for(k = 0; k < nrep; k++){
+			for (i = 0; i < nlibs; i++){
+				blasLib *lib = &libs[(i + k) % nlibs];
+				memcpy(C, C0, nn*sizeof(double)); // identical C input
+				start = timerNow(&timer); // start crono
+				for (b = 0; b < lib->batch; b++)
+					callDgemm(lib, matSize, alpha, A, B, beta, C);
+				stop = timerNow(&timer);  // stop crono
+				dt = timerPerCall(&timer, stop - start, lib->batch); // calc dt (per call)
+				gsl_rstat_add(dt, lib->rstat_t); // stat dt
+			}
+		}
+		// calc problem size in GFLOP
+		gflop = gemm_gflop(matSize, matSize, matSize, alpha, beta);
+		printf("_______________________________________\n");
+		printf("Matrix Size: %d | Size in GFLOP: %.4lf\n", matSize, gflop);
+		for (l = 0; l < nlibs; l++){
+			gsl_rstat_workspace *rstat_t = libs[l].rstat_t;
+			FILE *desemp = libs[l].desemp;
+			printf("%-16s mean: %.4lf GFLOPS (%d call(s) per measurement)\n", libs[l].name,
+				gflop/gsl_rstat_mean(rstat_t), libs[l].batch);
+			if (libs[l].newFile){ //print dataframe head
+				fprintf(desemp, "matSize,Size,Mean,Variance,Largest,Smallest,Median,SD,SD_Mean,Skew,RMS,Kurtosis%s\n",
+					libs[l].batchCols ? ",Batch" : "");
+				libs[l].newFile = 0;
+			}
+			fprintf(desemp, "%d, ", matSize);
+			fprintf(desemp, " %.9lf, ", gflop);
+			fprintf(desemp, " %.9lf,", gsl_rstat_mean(rstat_t));
+			fprintf(desemp, " %.6le,", gsl_rstat_variance(rstat_t));
+			fprintf(desemp, " %.9lf,", gsl_rstat_min(rstat_t));
+			fprintf(desemp, " %.9lf, ", gsl_rstat_max(rstat_t));
+			fprintf(desemp, " %.9lf,", gsl_rstat_median(rstat_t));
+			fprintf(desemp, " %.9lf,", gsl_rstat_sd(rstat_t));
+			fprintf(desemp, " %.9lf,", gsl_rstat_sd_mean(rstat_t));
+			fprintf(desemp, " %.4lf,", gsl_rstat_skew(rstat_t));
+			fprintf(desemp, " %.9lf,", gsl_rstat_rms(rstat_t));
+			fprintf(desemp, " %.4lf", gsl_rstat_kurtosis(rstat_t));
+			// calls per measurement (the statistics are per call)
+			if (libs[l].batchCols)
+				fprintf(desemp, ", %d", libs[l].batch);
+			fprintf(desemp, " \n");
+			fflush(desemp);
+			gsl_rstat_free(rstat_t);
+		}
+		fflush(stdout);
+		free(A);
+		free(B);
+		free(C0);
+		free(C);
+		matSize += step;
+	}
+	for (l = 0; l < nlibs; l++){
+		fclose(libs[l].desemp);
+		dlclose(libs[l].handle);
+	}
+	return 0;
+}
+
+double numGenerator(double min, double max){
+	double number = min + ((double)rand()/RAND_MAX)*(max - min);
+	return number;
+}
+
+// spec: Nome=/caminho/lib.so
+int loadLib(blasLib *lib, const char *spec, const char *outDir){
+	const char *eq = strchr(spec, '=');
+	int flags = RTLD_NOW | RTLD_LOCAL;
+
+	memset(lib, 0, sizeof(blasLib));
+	if (eq == NULL || eq == spec){
+		fprintf(stderr, "Especificação inválida (use Nome=/caminho/lib.so): %s\n", spec);
+		return 1;
+	}
+	snprintf(lib->name, sizeof(lib->name), "%.*s", (int)(eq - spec), spec);
+	snprintf(lib->path, sizeof(lib->path), "%s", eq + 1);
+#ifdef RTLD_DEEPBIND
+	// a biblioteca resolve os próprios símbolos antes dos globais (ex: gslcblas)
+	flags |= RTLD_DEEPBIND;
+#endif
+	lib->handle = dlopen(lib->path, flags);
+	if (lib->handle == NULL){
+		fprintf(stderr, "%s: %s\n", lib->name, dlerror());
+		return 1;
+	}
+	lib->dgemm = (dgemm_lp64_t) dlsym(lib->handle, "cblas_dgemm");
+	if (lib->dgemm == NULL)
+		lib->dgemm64 = (dgemm_ilp64_t) dlsym(lib->handle, "cblas_dgemm64_");
+	if (lib->dgemm == NULL && lib->dgemm64 == NULL){
+		fprintf(stderr, "%s: cblas_dgemm não encontrado em %s\n", lib->name, lib->path);
+		dlclose(lib->handle);
+		return 1;
+	}
+	snprintf(lib->file, sizeof(lib->file), "%s/output_%s.dat", outDir, lib->name);
+	lib->desemp = fopen(lib->file, "a+");
+	if (lib->desemp == NULL){
+		perror(lib->file);
+		dlclose(lib->handle);
+		return 1;
+	}
+	// header only for a new file (resumed/re-measured runs append)
+	fseek(lib->desemp, 0, SEEK_END);
+	lib->newFile = (ftell(lib->desemp) == 0);
+	// Batch column: always in a new file, only if the existing header has it
+	lib->batchCols = lib->newFile;
+	if (!lib->newFile){
+		char header[512] = "";
+		rewind(lib->desemp);
+		if (fgets(header, sizeof(header), lib->desemp) != NULL)
+			lib->batchCols = (strstr(header, "Batch") != NULL);
+		// back to the end: "a+" requires a positioning call between a read and a write
+		fseek(lib->desemp, 0, SEEK_END);
+	}
+	return 0;
+}
+
+void callDgemm(blasLib *lib, int n, double alpha, const double *A, const double *B, double beta, double *C){
+	if (lib->dgemm != NULL)
+		lib->dgemm(CBLAS_ROW_MAJOR, CBLAS_NO_TRANS, CBLAS_NO_TRANS, n, n, n, alpha, A, n, B, n, beta, C, n);
+	else
+		lib->dgemm64(CBLAS_ROW_MAJOR, CBLAS_NO_TRANS, CBLAS_NO_TRANS, n, n, n, alpha, A, n, B, n, beta, C, n);
+}
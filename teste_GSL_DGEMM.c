@@ -1,33 +1,80 @@
+#define _GNU_SOURCE
 #include <stdio.h>
 #include <stdlib.h>
+#include <time.h>
+#include <unistd.h>
+#include <ctype.h>
 #include <gsl/gsl_blas.h>
 #include <gsl/gsl_rstat.h>
 #include <omp.h>
+#include "flop_model.h"
+#include "rapl.h"
+#include "dgemm_timer.h"
+#include "blas_path.h"
 
 #define FSIZE 1024
 #define ISIZE 32
 #define STEP 32
 #define NREP 5
+// level 1/2 operands rotate through copies spanning ROTATE_LLC x the last-level cache
+// (each call reads from DRAM, not from the cache warmed by the previous call)
+#define ROTATE_LLC 2
+#define ROTATE_MAX 16384
 
+// matrices of one GEMM type: 's', 'd', 'c' or 'z' (gsl_blas_<t>gemm)
+// or operands of a level 1/2 routine: dgemv (A, x = B, y = C), daxpy/ddot (x = B, y = C)
+typedef struct{
+	char dtype;
+	const char *routine;   // NULL = GEMM; dgemv, daxpy or ddot
+	int n;
+	void *A, *B, *C;
+	double dot;            // ddot result
+	const blasPath *path;  // DGEMM: gsl, cblas ou fortran
+} gemmMats;
 
 double numGenerator(double min, double max);
 void printTime(double sec);
+double wallClock(void);
+double processStart(void);
+void phaseMark(FILE *phases, const char *phase, double t);
+void waitUntil(double t);
+long llcBytes(void);
+void gemmAlloc(gemmMats *m, char dtype, const char *routine, int n);
+void gemmFill(gemmMats *m, int n);
+void gemmRun(gemmMats *m, double alpha, double beta);
+double gemmGet(gemmMats *m, int i, int j);
+void gemmFree(gemmMats *m);
 
 int main( int argc, char** argv ){
 
-	int i,j,k;
+	// shared libraries are mapped and their constructors have run (BLAS init)
+	double loaded = wallClock();
+	int k, b, batch;
+	int set, nsets;
+	long llc;
+	double wsetBytes;
 
 	int matSize;
 	double start, stop, dt;
-	double gflop;
+	double gflop, gbytes;
 
 	double alpha, beta;
 
 	FILE *desemp;
+	FILE *samples = NULL;
+	FILE *phases = NULL;
+	int firstCall = 1;
+	raplDomain pkg, dram;
+	dgemmTimer timer;
+	blasPath path;
+	int energyCols, batchCols, bytesCols, wsetCols;
 	int fSize, iSize, step, nrep;
+	char dtype;
+	const char *routine = NULL;
+	char kernelName[8];
 	// First arg fileName
 	if(argc > 1)
-		desemp = fopen(argv[1], "a");
+		desemp = fopen(argv[1], "a+");
 	else
 		desemp = fopen("./desempenho.dat", "w");
 	// next arg iSize
@@ -50,49 +97,168 @@ int main( int argc, char** argv ){
 		nrep = atoi(argv[5]);
 	else
 		nrep = NREP;
+	// next arg dtype (s, d, c, z) or a memory-bound level 1/2 routine (dgemv, daxpy, ddot)
+	if(argc > 6 && strlen(argv[6]) > 1){
+		routine = argv[6];
+		dtype = 'd';
+		if (strcmp(routine, "dgemv") != 0 && strcmp(routine, "daxpy") != 0 && strcmp(routine, "ddot") != 0){
+			fprintf(stderr, "Rotina inválida: %s (use dgemv, daxpy ou ddot)\n", routine);
+			return 1;
+		}
+	}
+	else if(argc > 6)
+		dtype = argv[6][0];
+	else
+		dtype = 'd';
+	if (dtype != 's' && dtype != 'd' && dtype != 'c' && dtype != 'z'){
+		fprintf(stderr, "Tipo inválido: %s (use s, d, c ou z)\n", argv[6]);
+		return 1;
+	}
+	// next arg call path (gsl, cblas, fortran; only DGEMM goes around GSL)
+	if (blasPathResolve(&path, argc > 7 ? argv[7] : "gsl") != 0){
+		fprintf(stderr, "Caminho inválido ou símbolo ausente: %s (use gsl, cblas ou fortran)\n", argv[7]);
+		return 1;
+	}
+	if ((dtype != 'd' || routine != NULL) && path.name[0] != 'g'){
+		fprintf(stderr, "Caminho %s disponível apenas para DGEMM\n", path.name);
+		return 1;
+	}
 	// define first matSize
 	matSize = iSize;
+	// header only for a new file (re-measurements append to the same file)
+	fseek(desemp, 0, SEEK_END);
+	int newFile = (ftell(desemp) == 0);
+	// energy and batch columns: always in a new file, only if the existing header has them
+	// (bytes moved: level 1/2 routines only)
+	energyCols = batchCols = newFile;
+	bytesCols = wsetCols = newFile && routine != NULL;
+	if (!newFile){
+		char header[512] = "";
+		rewind(desemp);
+		if (fgets(header, sizeof(header), desemp) != NULL){
+			energyCols = (strstr(header, "PkgJoules") != NULL);
+			batchCols = (strstr(header, "Batch") != NULL);
+			bytesCols = (strstr(header, "GBytes") != NULL);
+			wsetCols = (strstr(header, "WorkingSet") != NULL);
+		}
+		// back to the end: "a+" requires a positioning call between a read and a write
+		fseek(desemp, 0, SEEK_END);
+	}
+	raplInit(&pkg, &dram);
+	printf("RAPL: %d zona(s) de pacote, %d de DRAM\n", pkg.n, dram.n);
+	llc = llcBytes();
+	printf("LLC: %ld bytes%s\n", llc, llc > 0 ? "" : " (unknown: level 1/2 operands are not rotated)");
+	// timer resolution and read overhead (saved to DGEMM_TIMER_FILE)
+	timerCalibrate(&timer);
+	timerSave(&timer, argc > 1 ? argv[1] : "./desempenho.dat");
+	printf("Timer: %s | resolution %.3le s | overhead %.3le s | batch below %.3le s\n",
+		timer.raw ? "CLOCK_MONOTONIC_RAW" : "omp_get_wtime", timer.resolution, timer.overhead, timer.batchMin);
+	// resolved BLAS symbol and its library (DGEMM only; saved to DGEMM_CALLPATH_FILE)
+	if (dtype == 'd' && routine == NULL){
+		blasPathSave(&path, argc > 1 ? argv[1] : "./desempenho.dat");
+		printf("Call path: %s -> %s (%s)\n", path.entry, path.symbol, path.library);
+	}
+	// optional job phase timestamps (end-to-end latency): DGEMM_PHASES_FILE=<csv>
+	// launch and return are written by the runner around the process
+	if (getenv("DGEMM_PHASES_FILE") != NULL){
+		phases = fopen(getenv("DGEMM_PHASES_FILE"), "a");
+		phaseMark(phases, "process_start", processStart());
+		phaseMark(phases, "library_loaded", loaded);
+	}
+	// optional per-repetition samples (contention mode): DGEMM_SAMPLES_FILE=<csv>
+	if (getenv("DGEMM_SAMPLES_FILE") != NULL){
+		samples = fopen(getenv("DGEMM_SAMPLES_FILE"), "a");
+		if (samples != NULL){
+			fseek(samples, 0, SEEK_END);
+			if (ftell(samples) == 0)
+				fprintf(samples, "matSize,rep,start,time\n");
+		}
+	}
 	// Intro
-	printf("GSL_DGEMM test: %d, %d, ... (+%d)..., %d, %d \n", iSize, iSize + step, step, fSize - step, fSize);
+	snprintf(kernelName, sizeof(kernelName), "%cGEMM", dtype - 32);
+	if (routine != NULL){
+		for (k = 0; routine[k] != '\0'; k++)
+			kernelName[k] = toupper(routine[k]);
+		kernelName[k] = '\0';
+	}
+	printf("GSL_%s test (%s): %d, %d, ... (+%d)..., %d, %d \n", kernelName, path.name, iSize, iSize + step, step, fSize - step, fSize);
 	// Set constants
 	alpha = 1.0;
 	beta = 0.5;
 	// Set random seed
 	srand(1234567890);
+	// common start for concurrent jobs: DGEMM_START_AT=<epoch seconds>
+	if (getenv("DGEMM_START_AT") != NULL)
+		waitUntil(atof(getenv("DGEMM_START_AT")));
 	// Main loop (for all mat sizes)
 	while (matSize <= fSize){
-		// alloc matrix
-		gsl_matrix *A = gsl_matrix_alloc(matSize, matSize);
-		gsl_matrix *B = gsl_matrix_alloc(matSize, matSize);
-		gsl_matrix *C = gsl_matrix_alloc(matSize, matSize);
-		// init matrix
-		for (i = 0; i < matSize; i++) {
-			for (j = 0; j < matSize; j++) {
-				gsl_matrix_set(A, i, j, numGenerator(-1.0, 1.0));
-				gsl_matrix_set(B, i, j, numGenerator(-4.0, 4.0));
-				gsl_matrix_set(C, i, j, numGenerator(0.0, 1.0));
-			}
+		// alloc matrix (level 1/2: operand copies until the working set exceeds the LLC)
+		nsets = 1;
+		if (routine != NULL && llc > 0){
+			nsets = (int)(ROTATE_LLC*(double)llc/blas12_operand_bytes(routine, matSize)) + 1;
+			if (nsets > ROTATE_MAX)
+				nsets = ROTATE_MAX;
+		}
+		gemmMats *sets = malloc(nsets*sizeof(gemmMats));
+		for (set = 0; set < nsets; set++){
+			gemmAlloc(&sets[set], dtype, routine, matSize);
+			sets[set].path = &path;
+			// init matrix
+			gemmFill(&sets[set], matSize);
 		}
+		wsetBytes = (routine != NULL) ? nsets*blas12_operand_bytes(routine, matSize) : 0.0;
+		set = 0;
 		// init stst
 		gsl_rstat_workspace *rstat_t = gsl_rstat_alloc();
+		raplReset(&pkg);
+		raplReset(&dram);
+		// probe call (untimed warm-up): calls shorter than timer.batchMin are timed in batches
+		start = timerNow(&timer);
+		gemmRun(&sets[set], alpha, beta);
+		stop = timerNow(&timer);
+		set = (set + 1) % nsets;
+		batch = timerBatch(&timer, stop - start);
+		if (firstCall){ // cold call: lazy thread pool creation, page faults
+			double done = wallClock();
+			phaseMark(phases, "first_dgemm_start", done - (stop - start));
+			phaseMark(phases, "first_dgemm_done", done);
+			firstCall = 0;
+		}
 		// test loop 
 		for(k = 0; k < nrep; k++){
-			start = omp_get_wtime(); // start crono
+			double wall = (samples != NULL) ? wallClock() : 0.0;
+			raplStart(&pkg); // energy counters outside the timed region
+			raplStart(&dram);
+			start = timerNow(&timer); // start crono
 			// make gemm operation
-			gsl_blas_dgemm(CblasNoTrans, CblasNoTrans, alpha, A, B, beta, C); 
-			stop = omp_get_wtime();  // syop crono
-			dt = stop - start; // calc dt
+			for (b = 0; b < batch; b++){
+				gemmRun(&sets[set], alpha, beta);
+				set = (set + 1) % nsets;
+			}
+			stop = timerNow(&timer);  // syop crono
+			raplStop(&pkg);
+			raplStop(&dram);
+			dt = timerPerCall(&timer, stop - start, batch); // calc dt (per call)
 			gsl_rstat_add(dt, rstat_t); // stat dt
+			if (samples != NULL)
+				fprintf(samples, "%d,%d,%.6lf,%.9lf\n", matSize, k, wall, dt);
+		}
+		// calc problem size in GFLOP (and compulsory memory traffic in GB for level 1/2)
+		if (routine != NULL){
+			gflop = blas12_gflop(routine, matSize, alpha, beta);
+			gbytes = blas12_gbytes(routine, matSize, beta);
+		}
+		else{
+			gflop = gemm_gflop_t(matSize, matSize, matSize, alpha, beta, dtype);
+			gbytes = 0.0;
 		}
-		// calc problem size in GFLOP
-		gflop = (2.0*matSize + 2)*matSize*matSize*0.000000001;
 		// output
 		printf("_______________________________________\n");
 		printf("Matrix Size: %d\n", matSize);
 		printf("_______________________________________\n");
-		// corners of the matrix C
-		printf("%lf \t %lf\n", gsl_matrix_get (C, 0, 0			),	gsl_matrix_get (C, 0		, matSize-1));
-		printf("%lf \t %lf\n", gsl_matrix_get (C, 0, matSize - 1), 	gsl_matrix_get (C, matSize-1, matSize-1));
+		// corners of the matrix C (real part)
+		printf("%lf \t %lf\n", gemmGet(&sets[0], 0, 0			),	gemmGet(&sets[0], 0		, matSize-1));
+		printf("%lf \t %lf\n", gemmGet(&sets[0], 0, matSize - 1), 	gemmGet(&sets[0], matSize-1, matSize-1));
 		// print dt
 		printTime(gsl_rstat_mean(rstat_t));
 		printf("Size in GFLOP: %.4lf\n", gflop);
@@ -102,43 +268,75 @@ int main( int argc, char** argv ){
 		printf("smallest: %.4lf\n", gflop/gsl_rstat_max(rstat_t));
 		printf("median: %.4lf\n", gflop/gsl_rstat_median(rstat_t));
 		printf("rms: %.4lf\n", gflop/gsl_rstat_rms(rstat_t));
-		if (matSize == iSize) //print dataframe head
-			fprintf(desemp, "matSize,Size,Mean,Variance,Largest,Smallest,Median,SD,SD_Mean,Skew,RMS,Kurtosis\n");
+		if (routine != NULL){
+			printf("Bandwidth in GB/s (mean): %.4lf\n", gbytes/gsl_rstat_mean(rstat_t));
+			printf("Working set: %.3lf MB in %d operand set(s)%s\n", wsetBytes*1e-6, nsets,
+				wsetBytes > llc ? "" : " (cache-resident: GB/s is cache bandwidth)");
+		}
+		printf("Calls per measurement: %d\n", batch);
+		printf("Energy per call (J): pkg %.6lf, dram %.6lf\n", raplJoulesPer(&pkg, nrep*batch), raplJoulesPer(&dram, nrep*batch));
+		if (newFile){ //print dataframe head
+			fprintf(desemp, "matSize,Size,Mean,Variance,Largest,Smallest,Median,SD,SD_Mean,Skew,RMS,Kurtosis%s%s%s%s\n",
+				energyCols ? ",PkgJoules,DramJoules" : "", batchCols ? ",Batch" : "", bytesCols ? ",GBytes" : "",
+				wsetCols ? ",WorkingSet" : "");
+			newFile = 0;
+		}
 		
 		// col 0
 		fprintf(desemp, "%d, ", matSize);
 		// col 1
-		fprintf(desemp, " %.4lf, ", gflop);
-		// col 2
-		fprintf(desemp, " %.4lf,", gsl_rstat_mean(rstat_t));
+		fprintf(desemp, " %.9lf, ", gflop);
+		// col 2 (time columns in full precision: small N runs in microseconds)
+		fprintf(desemp, " %.9lf,", gsl_rstat_mean(rstat_t));
 		// col 3
-		fprintf(desemp, " %.4lf,", gsl_rstat_variance(rstat_t));
+		fprintf(desemp, " %.6le,", gsl_rstat_variance(rstat_t));
 		// col 4
-		fprintf(desemp, " %.4lf,", gsl_rstat_min(rstat_t));
+		fprintf(desemp, " %.9lf,", gsl_rstat_min(rstat_t));
 		// col 5
-		fprintf(desemp, " %.4lf, ", gsl_rstat_max(rstat_t));
+		fprintf(desemp, " %.9lf, ", gsl_rstat_max(rstat_t));
 		// col 6
-		fprintf(desemp, " %.4lf,", gsl_rstat_median(rstat_t));
+		fprintf(desemp, " %.9lf,", gsl_rstat_median(rstat_t));
 		// col 7
-		fprintf(desemp, " %.4lf,", gsl_rstat_sd(rstat_t));
+		fprintf(desemp, " %.9lf,", gsl_rstat_sd(rstat_t));
 		// col 8
-		fprintf(desemp, " %.4lf,", gsl_rstat_sd_mean(rstat_t));
+		fprintf(desemp, " %.9lf,", gsl_rstat_sd_mean(rstat_t));
 		// col 9
 		fprintf(desemp, " %.4lf,", gsl_rstat_skew(rstat_t));
 		// col 10
-		fprintf(desemp, " %.4lf,", gsl_rstat_rms(rstat_t));
+		fprintf(desemp, " %.9lf,", gsl_rstat_rms(rstat_t));
 		// col 11
-		fprintf(desemp, " %.4lf \n", gsl_rstat_kurtosis(rstat_t));
+		fprintf(desemp, " %.4lf", gsl_rstat_kurtosis(rstat_t));
+		// col 12, 13 (joules per call, nan without RAPL)
+		if (energyCols)
+			fprintf(desemp, ", %.6lf, %.6lf", raplJoulesPer(&pkg, nrep*batch), raplJoulesPer(&dram, nrep*batch));
+		// col 14 (calls per measurement; the statistics are per call)
+		if (batchCols)
+			fprintf(desemp, ", %d", batch);
+		// col 15 (bytes moved per call in GB; level 1/2 routines)
+		if (bytesCols)
+			fprintf(desemp, ", %.9lf", gbytes);
+		// col 16 (rotated operand working set in GB; level 1/2 routines)
+		if (wsetCols)
+			fprintf(desemp, ", %.9lf", wsetBytes*0.000000001);
+		fprintf(desemp, " \n");
 
 		fflush(stdout);
 		fflush(desemp);
-		gsl_matrix_free(A);
-		gsl_matrix_free(B);
-		gsl_matrix_free(C);
+		if (samples != NULL)
+			fflush(samples);
+		for (set = 0; set < nsets; set++)
+			gemmFree(&sets[set]);
+		free(sets);
 		gsl_rstat_free(rstat_t);
 		matSize += step;
 	}
 	fclose(desemp);
+	if (samples != NULL)
+		fclose(samples);
+	if (phases != NULL){
+		phaseMark(phases, "exit", wallClock());
+		fclose(phases);
+	}
 	return 0;
 }
 
@@ -147,6 +345,250 @@ double numGenerator(double min, double max){
 	return number;
 }
 
+void gemmAlloc(gemmMats *m, char dtype, const char *routine, int n){
+	m->dtype = dtype;
+	m->routine = routine;
+	m->n = n;
+	m->dot = 0.0;
+	if (routine != NULL){ // dgemv: A (n x n), x and y (n); daxpy/ddot: x and y (n*n)
+		int gemv = (strcmp(routine, "dgemv") == 0);
+		int len = gemv ? n : n*n;
+		m->A = gemv ? gsl_matrix_alloc(n, n) : NULL;
+		m->B = gsl_vector_alloc(len);
+		m->C = gsl_vector_alloc(len);
+		return;
+	}
+	switch (dtype){
+	case 's':
+		m->A = gsl_matrix_float_alloc(n, n);
+		m->B = gsl_matrix_float_alloc(n, n);
+		m->C = gsl_matrix_float_alloc(n, n);
+		break;
+	case 'c':
+		m->A = gsl_matrix_complex_float_alloc(n, n);
+		m->B = gsl_matrix_complex_float_alloc(n, n);
+		m->C = gsl_matrix_complex_float_alloc(n, n);
+		break;
+	case 'z':
+		m->A = gsl_matrix_complex_alloc(n, n);
+		m->B = gsl_matrix_complex_alloc(n, n);
+		m->C = gsl_matrix_complex_alloc(n, n);
+		break;
+	default:
+		m->A = gsl_matrix_alloc(n, n);
+		m->B = gsl_matrix_alloc(n, n);
+		m->C = gsl_matrix_alloc(n, n);
+	}
+}
+
+// same value ranges for every type (complex: real and imaginary parts)
+void gemmFill(gemmMats *m, int n){
+	int i, j;
+	gsl_complex z[3];
+	gsl_complex_float zf[3];
+	if (m->routine != NULL){
+		gsl_vector *x = m->B, *y = m->C;
+		if (m->A != NULL)
+			for (i = 0; i < n; i++)
+				for (j = 0; j < n; j++)
+					gsl_matrix_set(m->A, i, j, numGenerator(-1.0, 1.0));
+		for (i = 0; i < (int)x->size; i++){
+			gsl_vector_set(x, i, numGenerator(-4.0, 4.0));
+			gsl_vector_set(y, i, numGenerator(0.0, 1.0));
+		}
+		return;
+	}
+	for (i = 0; i < n; i++) {
+		for (j = 0; j < n; j++) {
+			switch (m->dtype){
+			case 's':
+				gsl_matrix_float_set(m->A, i, j, numGenerator(-1.0, 1.0));
+				gsl_matrix_float_set(m->B, i, j, numGenerator(-4.0, 4.0));
+				gsl_matrix_float_set(m->C, i, j, numGenerator(0.0, 1.0));
+				break;
+			case 'c':
+				GSL_SET_COMPLEX(&zf[0], numGenerator(-1.0, 1.0), numGenerator(-1.0, 1.0));
+				GSL_SET_COMPLEX(&zf[1], numGenerator(-4.0, 4.0), numGenerator(-4.0, 4.0));
+				GSL_SET_COMPLEX(&zf[2], numGenerator(0.0, 1.0), numGenerator(0.0, 1.0));
+				gsl_matrix_complex_float_set(m->A, i, j, zf[0]);
+				gsl_matrix_complex_float_set(m->B, i, j, zf[1]);
+				gsl_matrix_complex_float_set(m->C, i, j, zf[2]);
+				break;
+			case 'z':
+				GSL_SET_COMPLEX(&z[0], numGenerator(-1.0, 1.0), numGenerator(-1.0, 1.0));
+				GSL_SET_COMPLEX(&z[1], numGenerator(-4.0, 4.0), numGenerator(-4.0, 4.0));
+				GSL_SET_COMPLEX(&z[2], numGenerator(0.0, 1.0), numGenerator(0.0, 1.0));
+				gsl_matrix_complex_set(m->A, i, j, z[0]);
+				gsl_matrix_complex_set(m->B, i, j, z[1]);
+				gsl_matrix_complex_set(m->C, i, j, z[2]);
+				break;
+			default:
+				gsl_matrix_set(m->A, i, j, numGenerator(-1.0, 1.0));
+				gsl_matrix_set(m->B, i, j, numGenerator(-4.0, 4.0));
+				gsl_matrix_set(m->C, i, j, numGenerator(0.0, 1.0));
+			}
+		}
+	}
+}
+
+// C = alpha*A*B + beta*C (complex types: real alpha and beta)
+void gemmRun(gemmMats *m, double alpha, double beta){
+	gsl_complex za, zb;
+	gsl_complex_float fa, fb;
+	if (m->routine != NULL){ // y = alpha*A*x + beta*y, y = alpha*x + y, x.y
+		if (strcmp(m->routine, "dgemv") == 0)
+			gsl_blas_dgemv(CblasNoTrans, alpha, m->A, m->B, beta, m->C);
+		else if (strcmp(m->routine, "daxpy") == 0)
+			gsl_blas_daxpy(alpha, m->B, m->C);
+		else
+			gsl_blas_ddot(m->B, m->C, &m->dot);
+		return;
+	}
+	switch (m->dtype){
+	case 's':
+		gsl_blas_sgemm(CblasNoTrans, CblasNoTrans, alpha, m->A, m->B, beta, m->C);
+		break;
+	case 'c':
+		GSL_SET_COMPLEX(&fa, alpha, 0.0);
+		GSL_SET_COMPLEX(&fb, beta, 0.0);
+		gsl_blas_cgemm(CblasNoTrans, CblasNoTrans, fa, m->A, m->B, fb, m->C);
+		break;
+	case 'z':
+		GSL_SET_COMPLEX(&za, alpha, 0.0);
+		GSL_SET_COMPLEX(&zb, beta, 0.0);
+		gsl_blas_zgemm(CblasNoTrans, CblasNoTrans, za, m->A, m->B, zb, m->C);
+		break;
+	default:
+		if (m->path->name[0] == 'g')
+			gsl_blas_dgemm(CblasNoTrans, CblasNoTrans, alpha, m->A, m->B, beta, m->C);
+		else // same gsl_matrix storage, without the GSL wrapper
+			blasPathDgemm(m->path, ((gsl_matrix*)m->C)->size1, alpha,
+				((gsl_matrix*)m->A)->data, ((gsl_matrix*)m->A)->tda,
+				((gsl_matrix*)m->B)->data, ((gsl_matrix*)m->B)->tda,
+				beta, ((gsl_matrix*)m->C)->data, ((gsl_matrix*)m->C)->tda);
+	}
+}
+
+// element of C (real part); level 1/2: element of y (dgemv: y[i]) or the ddot result
+double gemmGet(gemmMats *m, int i, int j){
+	if (m->routine != NULL){
+		if (strcmp(m->routine, "ddot") == 0)
+			return m->dot;
+		return gsl_vector_get(m->C, (m->A != NULL) ? i : i*m->n + j);
+	}
+	switch (m->dtype){
+	case 's': return gsl_matrix_float_get(m->C, i, j);
+	case 'c': return GSL_REAL(gsl_matrix_complex_float_get(m->C, i, j));
+	case 'z': return GSL_REAL(gsl_matrix_complex_get(m->C, i, j));
+	default: return gsl_matrix_get(m->C, i, j);
+	}
+}
+
+void gemmFree(gemmMats *m){
+	if (m->routine != NULL){
+		if (m->A != NULL)
+			gsl_matrix_free(m->A);
+		gsl_vector_free(m->B);
+		gsl_vector_free(m->C);
+		return;
+	}
+	switch (m->dtype){
+	case 's':
+		gsl_matrix_float_free(m->A);
+		gsl_matrix_float_free(m->B);
+		gsl_matrix_float_free(m->C);
+		break;
+	case 'c':
+		gsl_matrix_complex_float_free(m->A);
+		gsl_matrix_complex_float_free(m->B);
+		gsl_matrix_complex_float_free(m->C);
+		break;
+	case 'z':
+		gsl_matrix_complex_free(m->A);
+		gsl_matrix_complex_free(m->B);
+		gsl_matrix_complex_free(m->C);
+		break;
+	default:
+		gsl_matrix_free(m->A);
+		gsl_matrix_free(m->B);
+		gsl_matrix_free(m->C);
+	}
+}
+
+// wall clock (epoch seconds), comparable between processes and containers
+double wallClock(void){
+	struct timespec ts;
+	clock_gettime(CLOCK_REALTIME, &ts);
+	return ts.tv_sec + ts.tv_nsec*1e-9;
+}
+
+// process start (epoch seconds): starttime in /proc/self/stat is in clock ticks
+// since boot, converted with the current CLOCK_BOOTTIME/CLOCK_REALTIME pair
+// (resolution 1/CLK_TCK, usually 10 ms; nan if /proc is unavailable)
+double processStart(void){
+	char line[1024], *p;
+	unsigned long long ticks;
+	struct timespec boot;
+	int field;
+	FILE *f = fopen("/proc/self/stat", "r");
+	if (f == NULL)
+		return NAN;
+	p = fgets(line, sizeof(line), f);
+	fclose(f);
+	// fields after the command name "(comm)": 3 = state ... 22 = starttime
+	if (p == NULL || (p = strrchr(line, ')')) == NULL)
+		return NAN;
+	for (field = 2; field < 22 && p != NULL; field++)
+		p = strchr(p + 1, ' ');
+	if (p == NULL || sscanf(p, "%llu", &ticks) != 1)
+		return NAN;
+	clock_gettime(CLOCK_BOOTTIME, &boot);
+	return wallClock() - (boot.tv_sec + boot.tv_nsec*1e-9) + (double)ticks/sysconf(_SC_CLK_TCK);
+}
+
+void phaseMark(FILE *phases, const char *phase, double t){
+	if (phases == NULL)
+		return;
+	fprintf(phases, "%s,%.6lf\n", phase, t);
+	fflush(phases);
+}
+
+void waitUntil(double t){
+	struct timespec ts;
+	if (t <= wallClock())
+		return;
+	ts.tv_sec = (time_t)t;
+	ts.tv_nsec = (long)((t - ts.tv_sec)*1e9);
+	while (clock_nanosleep(CLOCK_REALTIME, TIMER_ABSTIME, &ts, NULL) != 0)
+		;
+}
+
+// last-level cache size in bytes: DGEMM_LLC_BYTES, sysfs (same source as host.env
+// cache_l3) or sysconf; 0 if unknown
+long llcBytes(void){
+	char line[64];
+	char unit = 'B';
+	long size = 0;
+	FILE *f;
+	if (getenv("DGEMM_LLC_BYTES") != NULL)
+		return atol(getenv("DGEMM_LLC_BYTES"));
+	f = fopen("/sys/devices/system/cpu/cpu0/cache/index3/size", "r");
+	if (f != NULL){
+		if (fgets(line, sizeof(line), f) != NULL && sscanf(line, "%ld%c", &size, &unit) >= 1){
+			if (unit == 'K')
+				size *= 1024;
+			else if (unit == 'M')
+				size *= 1024*1024;
+		}
+		fclose(f);
+	}
+#ifdef _SC_LEVEL3_CACHE_SIZE
+	if (size <= 0)
+		size = sysconf(_SC_LEVEL3_CACHE_SIZE);
+#endif
+	return size > 0 ? size : 0;
+}
+
 void printTime(double sec){
 	int hh,mm, ss;
 	hh = mm = ss = 0;